@@ -1,151 +1,167 @@
+import html
+from concurrent.futures import ProcessPoolExecutor
 import streamlit as st
 from parser import extract_text_from_file, extract_entities
 from scorer import score_resume
 from utils import display_entities, check_ats_compliance
+from cache import content_hash, get_parse_cache
+from dedup import fingerprint, get_duplicate_index
+from profiling import profile_document
+from batch import analyze_uploads, report_row
+from reports import ReportSink
+from mailer import MailQueue
+from assets import remote_asset, stylesheet
+from store import get_result_store
+import config
 import streamlit_lottie as st_lottie
-import requests
 import pandas as pd
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 # --- Load Lottie Animation ---
-def load_lottieurl(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
-lottie_url = "https://lottie.host/804a3a69-2be3-4ff9-8265-8f67c182ae4a/2a1X9H6Y0Y.json"
-lottie_json = load_lottieurl(lottie_url)
+# Resolved once per process from assets/ or the disk cache; a cold start
+# fetches it in the background and renders the page without it
+lottie_asset = remote_asset(config.LOTTIE_URL)
 
 # --- Email Function ---
+@st.cache_resource
+def get_mail_queue():
+    """One background mail queue per server process, reusing its SMTP login"""
+    return MailQueue(username=st.secrets["email"]["username"],
+                     password=st.secrets["email"]["password"])
+
 def send_email(to_email, report_content):
-    msg = MIMEMultipart()
-    msg["From"] = st.secrets["email"]["username"]
-    msg["To"] = to_email
-    msg["Subject"] = "Resume Analysis Report"
-    
-    body = MIMEText(report_content, "plain")
-    msg.attach(body)
-    
+    """Queue the report for delivery and return without waiting on SMTP"""
     try:
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(st.secrets["email"]["username"], st.secrets["email"]["password"])
-            server.send_message(msg)
-        return True
+        future = get_mail_queue().submit(to_email, "Resume Analysis Report", report_content)
     except Exception as e:
-        st.error(f"Failed to send email: {str(e)}")
+        st.error(f"Failed to queue email: {str(e)}")
+        return False
+    st.session_state.setdefault("email_deliveries", []).append((to_email, future))
+    return True
+
+def show_email_deliveries():
+    """Report the outcome of emails queued in this session once SMTP has answered"""
+    pending = []
+    for to_email, future in st.session_state.get("email_deliveries", []):
+        if not future.done():
+            pending.append((to_email, future))
+        elif future.exception() is not None:
+            st.error(f"Email to {to_email} failed: {future.exception()}")
+        else:
+            st.success(f"Email delivered to {to_email}")
+    st.session_state["email_deliveries"] = pending
+    if pending:
+        st.caption(f"{len(pending)} email(s) still being delivered")
+
+# --- CSV Report ---
+def save_report_rows(rows):
+    """Append rows to resume_report.csv, showing an error instead of raising"""
+    try:
+        # Append, never overwrite: the sink locks the file while it writes
+        with ReportSink("resume_report.csv", batch_size=len(rows)) as sink:
+            sink.write_many(rows)
+        return True
+    except (RuntimeError, OSError) as e:
+        st.error(f"Failed to save the report: {str(e)}")
         return False
 
 # --- Custom Futuristic UI Style ---
 def apply_futuristic_style():
-    st.markdown("""
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@500&family=Roboto+Mono&display=swap');
-            
-            /* Main background and text */
-            html, body, [class*="css"] {
-                font-family: 'Roboto Mono', monospace;
-                background: linear-gradient(315deg, #0f2027 0%, #203a43 50%, #2c5364 100%);
-                color: #ffffff;
-            }
-            
-            /* Headers */
-            h1, h2, h3, h4 {
-                color: #00ffff;
-                font-family: 'Orbitron', sans-serif;
-                text-shadow: 0 0 8px #0ff, 0 0 12px #0ff;
-            }
-            
-            /* Buttons */
-            .stButton>button {
-                background: linear-gradient(135deg, #00ffff, #00ff99);
-                color: #000;
-                border: none;
-                border-radius: 12px;
-                padding: 10px 20px;
-                font-weight: bold;
-                box-shadow: 0 0 10px #00ffff;
-                transition: all 0.3s ease;
-            }
-            .stButton>button:hover {
-                transform: scale(1.05);
-                box-shadow: 0 0 20px #00ffcc;
-            }
-            
-            /* Input fields */
-            .stTextInput>div>input, 
-            .stTextArea>div>textarea {
-                background-color: #1e1e1e;
-                color: #00ffff;
-                border: 1px solid #00ffff;
-            }
-            
-            /* File uploader */
-            .stFileUploader {
-                background-color: #1b1f23;
-                border-radius: 10px;
-                padding: 1em;
-                border: 1px solid #00ffff;
-            }
-            
-            /* Progress bar */
-            .progress-container {
-                background: #1a1a1a;
-                border-radius: 25px;
-                padding: 5px;
-                margin: 15px 0;
-                box-shadow: 0 0 12px #00ffff80;
-            }
-            .progress-fill {
-                background: linear-gradient(90deg, #00ffff, #00ff99);
-                height: 20px;
-                border-radius: 20px;
-                transition: width 0.5s ease;
-                animation: glow 1.5s infinite alternate;
-            }
-            @keyframes glow {
-                from { box-shadow: 0 0 10px #00ffff; }
-                to { box-shadow: 0 0 20px #00ffff; }
-            }
-            
-            /* Skill match boxes */
-            .skill-match {
-                background-color: rgba(0, 255, 255, 0.1);
-                border: 1px solid #00ffff;
-                border-radius: 15px;
-                padding: 15px;
-                margin-bottom: 15px;
-            }
-            .skill-item {
-                margin: 5px 0;
-                padding: 8px 12px;
-                border-radius: 8px;
-            }
-            .matched {
-                background-color: rgba(0, 255, 0, 0.1);
-                border-left: 4px solid #00ff99;
-            }
-            .missing {
-                background-color: rgba(255, 0, 0, 0.1);
-                border-left: 4px solid #ff5555;
-            }
-            
-            /* Scrollbar */
-            ::-webkit-scrollbar {
-                width: 8px;
-            }
-            ::-webkit-scrollbar-thumb {
-                background: #00ffff;
-                border-radius: 10px;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+    # Streamlit rebuilds the page on every rerun, so the style tag is emitted
+    # each time; the stylesheet itself is read from disk once per process
+    st.markdown(stylesheet("style.css"), unsafe_allow_html=True)
 
 apply_futuristic_style()
 
+parse_cache = get_parse_cache()
+duplicate_index = get_duplicate_index()
+result_store = get_result_store()
+
+# --- Multi-file Uploads ---
+@st.cache_resource
+def get_upload_pool():
+    """Worker processes shared by every session, so one big upload cannot take every core"""
+    return ProcessPoolExecutor(max_workers=config.UPLOAD_WORKERS)
+
+UPLOAD_COLUMNS = ["File", "Status", "Match_Percentage", "Name", "Email", "Matched_Skills",
+                  "Missing_Skills", "ATS_Warnings", "Duplicate_Of", "Seconds", "Error"]
+
+def upload_table(rows):
+    """Results so far, best match first; queued and failed files sink to the bottom"""
+    table = pd.DataFrame(rows, columns=UPLOAD_COLUMNS)
+    for column in ("Matched_Skills", "Missing_Skills", "ATS_Warnings"):
+        table[column] = table[column].map(lambda value: ", ".join(value) if isinstance(value, list) else value)
+    return table.sort_values("Match_Percentage", ascending=False, na_position="last", kind="stable")
+
+def store_once(key, analysis, job_skills, file):
+    """Record an analysis in the result store once per session, not on every rerun"""
+    stored = st.session_state.setdefault("stored", set())
+    if result_store is not None and (key, tuple(job_skills)) not in stored:
+        result_store.add(key, analysis, job_skills, file=file, source="app")
+        stored.add((key, tuple(job_skills)))
+
+def parse_upload(name, data, text=None, extract=True):
+    """Text, entities and duplicate match of one upload, alone or among several.
+
+    A resume analyzed before, here or by a batch run, is not parsed again, and
+    with DEDUP_REUSE a re-application with a lightly edited CV reuses the
+    earlier entities. Passing text skips the store lookup and the extraction;
+    with extract=False entities that still need extracting come back as None.
+    """
+    key = content_hash(data)
+    if text is None:
+        stored = result_store.get(key) if result_store is not None else None
+        if stored:
+            return {"text": stored["text"], "entities": stored["entities"], "duplicate": None}
+        # Extract straight from the upload buffer so sessions share no files
+        text = extract_text_from_file(data)
+    match = duplicate_index.check(fingerprint(data, text), label=name)
+    if match and match.key == key and match.label == name:
+        # This very upload, checked before its parse was evicted from the cache
+        match = None
+    earlier = parse_cache.get(match.key) if match and config.DEDUP_REUSE else None
+    entities = earlier["entities"] if earlier else extract_entities(text) if extract else None
+    return {"text": text, "entities": entities, "duplicate": match.as_dict() if match else None}
+
+def analyze_many(files, job_skills):
+    """Analyze several uploads in parallel, filling in the results table as each one finishes"""
+    uploads = [(f.name, f.getvalue()) for f in files]
+    keys = [content_hash(data) for _, data in uploads]
+    # Uploads parsed before are only re-scored; the rest go to the worker pool
+    parsed = {}
+    for i, key in enumerate(keys):
+        cached = parse_cache.get(key) or (result_store.get(key) if result_store is not None else None)
+        if cached:
+            parsed[i] = cached
+
+    # Workers extract the text; the duplicate check runs here, as for a single upload
+    duplicates = {}
+    def parse(i, text):
+        upload = parse_upload(*uploads[i], text=text, extract=False)
+        duplicates[i] = upload["duplicate"]
+        return upload
+
+    rows = [{"File": name, "Status": "⏳ Queued"} for name, _ in uploads]
+    table = st.empty()
+    table.dataframe(upload_table(rows), use_container_width=True, hide_index=True)
+    progress = st.progress(0.0, text=f"Analyzing {len(uploads)} resumes...")
+    uploads_done = analyze_uploads(uploads, job_skills, get_upload_pool(), parsed, parse)
+    for finished, (i, row) in enumerate(uploads_done, 1):
+        analysis = row.pop("Analysis", None)
+        if analysis is not None:
+            if i in parsed:
+                duplicate = parsed[i].get("duplicate")
+            else:
+                duplicate = duplicates.get(i)
+                parse_cache.put(keys[i], {"text": analysis["text"], "entities": analysis["entities"],
+                                          "duplicate": duplicate})
+            row["Duplicate_Of"] = duplicate["label"] if duplicate else None
+            store_once(keys[i], analysis, job_skills, row["File"])
+        row["Status"] = "❌ Failed" if row["Error"] else "✅ Done"
+        rows[i] = row
+        table.dataframe(upload_table(rows), use_container_width=True, hide_index=True)
+        progress.progress(finished / len(uploads), text=f"Analyzed {finished} of {len(uploads)} resumes")
+    return rows
+
 # --- Session State ---
 if 'page' not in st.session_state:
     st.session_state.page = "landing"
@@ -153,7 +169,9 @@ if 'page' not in st.session_state:
 # --- Landing Page ---
 if st.session_state.page == "landing":
     st.markdown("<h1 style='text-align: center; font-size: 3rem;'>🚀 AI Resume Analyzer</h1>", unsafe_allow_html=True)
-    st_lottie.st_lottie(lottie_json, height=350, key="landing")
+    lottie_json = lottie_asset.get()
+    if lottie_json:
+        st_lottie.st_lottie(lottie_json, height=350, key="landing")
     st.markdown("<p style='text-align: center; font-size: 1.2rem;'>Make your resume smarter using AI & NLP</p>", unsafe_allow_html=True)
 
     if st.button("🔍 Get Started"):
@@ -164,23 +182,43 @@ if st.session_state.page == "landing":
 elif st.session_state.page == "analyzer":
     st.title("📄 Resume Analyzer")
 
-    uploaded_file = st.file_uploader("📎 Upload Resume (PDF/DOCX)", type=["pdf", "docx"])
+    uploaded_files = st.file_uploader("📎 Upload Resumes (PDF/DOCX)", type=["pdf", "docx"],
+                                      accept_multiple_files=True)
     job_skills_input = st.text_input("💼 Job Requirement Skills (comma-separated)", 
                                    value="python, machine learning, sql, html, css, javascript")
+    # One resume gets the detailed view; several get a ranked table
+    uploaded_file = uploaded_files[0] if len(uploaded_files) == 1 else None
+
+    if len(uploaded_files) > 1:
+        job_skills = [skill.strip().lower() for skill in job_skills_input.split(",")]
+        st.subheader(f"📊 {len(uploaded_files)} Resumes")
+        upload_rows = analyze_many(uploaded_files, job_skills)
+        if st.button("💾 Save all to CSV"):
+            if save_report_rows(upload_rows):
+                st.success(f"{len(upload_rows)} rows appended to resume_report.csv!")
 
     if uploaded_file:
-        file_ext = uploaded_file.name.split('.')[-1]
-        with open(f"temp_resume.{file_ext}", "wb") as f:
-            f.write(uploaded_file.read())
+        upload_key = content_hash(uploaded_file.getvalue())
 
-        with st.spinner("🔍 Analyzing Resume..."):
-            text = extract_text_from_file(f"temp_resume.{file_ext}")
-            entities = extract_entities(text)
+        with st.spinner("🔍 Analyzing Resume..."), profile_document(uploaded_file.name) as prof:
+            # Reruns with the same upload reuse the cached parse and only re-score
+            parsed = parse_cache.get_or_parse(uploaded_file.getvalue(),
+                                              lambda data: parse_upload(uploaded_file.name, data))
+            text = parsed["text"]
+            entities = parsed["entities"]
             job_skills = [skill.strip().lower() for skill in job_skills_input.split(",")]
             
             result = score_resume(entities, job_skills, raw_text=text)
             ats_warnings = check_ats_compliance(text)
 
+        store_once(upload_key, {"text": text, "entities": entities, "result": result, "ats_warnings": ats_warnings},
+                   job_skills, uploaded_file.name)
+
+        duplicate = parsed.get("duplicate")
+        if duplicate:
+            st.info(f"♻️ Matches a previously analyzed resume ({duplicate['label']}, "
+                    f"{duplicate['similarity']:.0%} similar)")
+
         # --- Results ---
         st.subheader("🔎 Extracted Information")
         st.markdown(display_entities(entities), unsafe_allow_html=True)
@@ -207,10 +245,13 @@ elif st.session_state.page == "analyzer":
         
         if result['matched_skills']:
             st.markdown("✅ **Matched Skills**")
+            semantic_matches = result.get('semantic_matches', {})
             for skill in result['matched_skills']:
+                # Skills matched by meaning show the resume phrase behind the match
+                via = f" <small>≈ {html.escape(semantic_matches[skill])}</small>" if skill in semantic_matches else ""
                 st.markdown(f"""
                 <div class="skill-item matched">
-                    {skill.capitalize()}
+                    {skill.capitalize()}{via}
                 </div>
                 """, unsafe_allow_html=True)
         
@@ -250,26 +291,18 @@ ATS COMPLIANCE CHECK:
         with col1:
             # CSV Export
             if st.button("💾 Save to CSV"):
-                df = pd.DataFrame({
-                    "Name": [entities["name"]],
-                    "Email": [entities["email"][0] if entities["email"] else "N/A"],
-                    "Phone": [entities["phone"][0] if entities["phone"] else "N/A"],
-                    "Match_Percentage": [result["score"]],
-                    "Matched_Skills": [", ".join(result["matched_skills"])],
-                    "Missing_Skills": [", ".join(result["missing_skills"])],
-                    "ATS_Warnings": [", ".join(ats_warnings) if ats_warnings else "None"]
-                })
-                df.to_csv("resume_report.csv", index=False)
-                st.success("Report saved as CSV!")
+                row = {"File": uploaded_file.name, "Error": ""}
+                row.update(report_row({"entities": entities, "result": result, "ats_warnings": ats_warnings}))
+                if save_report_rows([row]):
+                    st.success("Report appended to resume_report.csv!")
         
         with col2:
             # Email Report
             email_address = st.text_input("Enter email address:")
             if st.button("📧 Email Report") and email_address:
                 if send_email(email_address, report_content):
-                    st.success("Report sent successfully!")
-                else:
-                    st.error("Failed to send email. Check credentials.")
+                    st.success("Report queued for delivery!")
+            show_email_deliveries()
 
         # Text Download
         st.download_button(
@@ -279,6 +312,13 @@ ATS COMPLIANCE CHECK:
             mime="text/plain"
         )
 
+        # Earlier results for the same skill list, from this app or batch runs
+        if result_store is not None and st.checkbox("Show stored candidates for these skills"):
+            min_score = st.slider("Minimum match %", 0, 100, 80)
+            rows = result_store.candidates(job_skills, min_score=min_score, limit=200)
+            st.dataframe(pd.DataFrame(rows, columns=["file", "name", "email", "score", "matched_skills", "missing_skills"]),
+                         use_container_width=True)
+
         # Debug view
         if st.checkbox("Show debug information"):
             st.subheader("Debug View")
@@ -286,4 +326,8 @@ ATS COMPLIANCE CHECK:
             with col1:
                 st.text_area("Extracted Text", text, height=300)
             with col2:
-                st.json(entities)
\ No newline at end of file
+                st.json(entities)
+            st.caption("Parse cache")
+            st.json(parse_cache.stats())
+            st.caption("Stage timings (this run)")
+            st.dataframe(pd.DataFrame(prof.stages), use_container_width=True)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Static UI assets, resolved once per process instead of on every rerun.
+
+A remote JSON asset is looked up in this order: the in-process copy, a file
+bundled under ``assets/``, then the on-disk cache. A missing or expired copy
+is refreshed by a background thread with a timeout, so a page render never
+waits on the network; callers get the stale copy, or None, until the fetch
+lands.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+
+import config
+
+# Seconds to wait after a failed fetch before trying the network again
+FAILED_FETCH_RETRY = 60
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+class RemoteAsset:
+    """A JSON document fetched from a URL and cached on disk with a TTL"""
+
+    def __init__(self, url, cache_dir=None, ttl=None, timeout=None):
+        self.url = url
+        self.cache_dir = cache_dir or config.ASSET_CACHE_DIR
+        self.ttl = config.ASSET_TTL if ttl is None else ttl
+        self.timeout = config.ASSET_TIMEOUT if timeout is None else timeout
+        name = os.path.basename(url.split("?")[0]) or "asset.json"
+        self.bundled_path = os.path.join(ASSETS_DIR, name)
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        self.cache_path = os.path.join(self.cache_dir, f"{digest}-{name}")
+
+        self._value = None
+        self._fetched_at = 0.0
+        self._fetching = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self.last_error = None
+
+    def get(self, wait=0.0):
+        """Current value of the asset, waiting at most `wait` seconds for a fetch"""
+        with self._lock:
+            if self._value is None:
+                self._load_local()
+            if self._value is not None and time.time() - self._fetched_at < self.ttl:
+                return self._value
+            if self._fetching is None and time.time() >= self._retry_at:
+                self._fetching = threading.Thread(target=self._fetch, name="asset-fetch", daemon=True)
+                self._fetching.start()
+            fetching = self._fetching
+        if wait > 0 and fetching is not None:
+            fetching.join(wait)
+        return self._value
+
+    def _load_local(self):
+        if os.path.exists(self.bundled_path):
+            with open(self.bundled_path, 'r', encoding='utf-8') as f:
+                self._value = json.load(f)
+            # Bundled assets ship with the code and never expire
+            self._fetched_at = float("inf")
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self._value = json.load(f)
+            self._fetched_at = os.path.getmtime(self.cache_path)
+        except (OSError, ValueError):
+            pass
+
+    def _fetch(self):
+        import requests
+
+        try:
+            response = requests.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            value = response.json()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self.cache_path)
+            with self._lock:
+                self._value = value
+                self._fetched_at = time.time()
+                self.last_error = None
+        except Exception as e:
+            # Keep serving whatever we had and hold off before trying again
+            with self._lock:
+                self.last_error = e
+                self._retry_at = time.time() + min(self.ttl, FAILED_FETCH_RETRY)
+        finally:
+            with self._lock:
+                self._fetching = None
+
+
+@lru_cache(maxsize=None)
+def remote_asset(url):
+    """Process-wide RemoteAsset for a URL"""
+    return RemoteAsset(url)
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name):
+    """A bundled stylesheet wrapped in a <style> tag, read from disk once"""
+    with open(os.path.join(ASSETS_DIR, name), 'r', encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"
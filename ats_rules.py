@@ -0,0 +1,149 @@
+"""Data-driven ATS rule engine.
+
+Rules live in a JSON file (``ats_rules.json`` by default, or the path in
+RESUME_ANALYZER_ATS_RULES). A rule fires when any of its matchers hits:
+
+    keywords    whole words, compared case-insensitively
+    chars       any of these characters
+    substrings  case-insensitive substrings
+    pattern     a regular expression (``ignore_case`` defaults to true)
+
+``warn_when`` says whether the rule warns when it fires (``present``) or
+when it does not (``missing``); ``never`` rules produce no warning and only
+record whether they fired, so other extractors can reuse the scan. Callers
+that run both scan the text once with ``scan_text`` and hand the TextScan to
+``extract_entities`` and ``check_ats_compliance``.
+
+A document is tokenized once into its lowercased word set and character
+set. Keyword and character rules are answered from inverted indexes over
+those sets, so adding more of them leaves the per-document cost flat. Only
+substring and pattern matchers scan the text themselves.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+
+import config
+
+WARN_WHEN = ("present", "missing", "never")
+
+WORD_RE = re.compile(r'\w+')
+
+
+class Rule:
+    def __init__(self, rule_id, warn_when="present", message="", keywords=(), chars="",
+                 substrings=(), pattern=None, ignore_case=True):
+        if warn_when not in WARN_WHEN:
+            raise ValueError(f"Rule {rule_id!r}: warn_when must be one of {WARN_WHEN}")
+        for keyword in keywords:
+            if not WORD_RE.fullmatch(keyword):
+                raise ValueError(f"Rule {rule_id!r}: keyword {keyword!r} is not a single word, use a pattern")
+        if not (keywords or chars or substrings or pattern):
+            raise ValueError(f"Rule {rule_id!r} has no matcher")
+        self.id = rule_id
+        self.warn_when = warn_when
+        self.message = message
+        self.keywords = frozenset(keyword.lower() for keyword in keywords)
+        self.chars = frozenset(chars)
+        self.substrings = tuple(substring.lower() for substring in substrings)
+        self.pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0) if pattern else None
+
+    @classmethod
+    def from_dict(cls, item):
+        return cls(
+            item["id"], item.get("warn_when", "present"), item.get("message", ""),
+            item.get("keywords", ()), item.get("chars", ""), item.get("substrings", ()),
+            item.get("pattern"), item.get("ignore_case", True)
+        )
+
+
+class TextScan:
+    """Result of one scan: word count and the ids of rules that fired"""
+
+    def __init__(self, rules, word_count, present):
+        self.rules = rules
+        self.word_count = word_count
+        self.present = present
+
+    def defines(self, rule_id):
+        return rule_id in self.rules.by_id
+
+    def matched(self, rule_id):
+        return rule_id in self.present
+
+    def warnings(self):
+        warnings = []
+        length = self.rules.word_count
+        if self.word_count < length["min"]:
+            warnings.append(length["too_short"].format(count=self.word_count))
+        elif self.word_count > length["max"]:
+            warnings.append(length["too_long"].format(count=self.word_count))
+        for rule in self.rules.rules:
+            if rule.warn_when == "present" and rule.id in self.present:
+                warnings.append(rule.message)
+            elif rule.warn_when == "missing" and rule.id not in self.present:
+                warnings.append(rule.message)
+        return warnings
+
+
+class RuleSet:
+    """Precompiled collection of ATS rules"""
+
+    def __init__(self, word_count, rules):
+        self.word_count = word_count
+        self.rules = rules
+        self.by_id = {rule.id: rule for rule in rules}
+
+        self._keyword_index = {}
+        self._char_index = {}
+        for rule in rules:
+            for keyword in rule.keywords:
+                self._keyword_index.setdefault(keyword, set()).add(rule.id)
+            for ch in rule.chars:
+                self._char_index.setdefault(ch, set()).add(rule.id)
+        self._keywords = frozenset(self._keyword_index)
+        self._chars = frozenset(self._char_index)
+        self._scanners = [rule for rule in rules if rule.substrings or rule.pattern]
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(spec["word_count"], [Rule.from_dict(item) for item in spec["rules"]])
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def present_rules(self, text):
+        """Ids of all rules that fire somewhere in text"""
+        text_lower = text.lower()
+        present = set()
+        for keyword in self._keywords.intersection(WORD_RE.findall(text_lower)):
+            present |= self._keyword_index[keyword]
+        for ch in self._chars.intersection(text):
+            present |= self._char_index[ch]
+        for rule in self._scanners:
+            if rule.id in present:
+                continue
+            if any(substring in text_lower for substring in rule.substrings) or \
+                    (rule.pattern and rule.pattern.search(text)):
+                present.add(rule.id)
+        return present
+
+    def scan(self, text):
+        return TextScan(self, len(text.split()), self.present_rules(text))
+
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ats_rules.json")
+
+
+@lru_cache(maxsize=None)
+def get_rules():
+    """The configured rule set, loaded once per process"""
+    return RuleSet.load(config.ATS_RULES_PATH or DEFAULT_RULES_PATH)
+
+
+def scan_text(text):
+    """Scan text with the configured rules"""
+    return get_rules().scan(text)
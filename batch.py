@@ -0,0 +1,277 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+
+from ats_rules import scan_text
+from cache import content_hash
+from dedup import fingerprint
+from parser import extract_text_from_file, extract_entities
+from profiling import profile_document, write_jsonl
+from reports import ReportSink
+from scorer import score_resume
+from store import get_result_store
+from utils import check_ats_compliance
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+
+def find_resumes(directory, extensions=RESUME_EXTENSIONS):
+    """Yield resume paths under a directory in a stable order"""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(extensions):
+                yield os.path.join(root, name)
+
+
+def parse_skills(skills_input):
+    """Split a comma-separated skill list the same way the Streamlit app does"""
+    return [skill.strip().lower() for skill in skills_input.split(",") if skill.strip()]
+
+
+def analyze_document(source, job_skills, parsed=None):
+    """Run the full analysis pipeline on a path, bytes or file-like object.
+
+    parsed, the stored text and entities of the same document, skips
+    extraction so only scoring and the ATS check run; entities of None are
+    still extracted from the stored text.
+    """
+    text = extract_text_from_file(source) if parsed is None else parsed["text"]
+    # One rule scan serves both the entity extractor and the ATS check
+    scan = scan_text(text)
+    entities = parsed["entities"] if parsed is not None else None
+    if entities is None:
+        entities = extract_entities(text, scan)
+    return {
+        "text": text,
+        "entities": entities,
+        "result": score_resume(entities, job_skills, raw_text=text),
+        "ats_warnings": check_ats_compliance(text, scan)
+    }
+
+
+def report_row(analysis):
+    """Flatten one analysis into the report columns used by the CSV export"""
+    entities = analysis["entities"]
+    result = analysis["result"]
+    return {
+        "Name": entities["name"],
+        "Email": entities["email"][0] if entities["email"] else "N/A",
+        "Phone": entities["phone"][0] if entities["phone"] else "N/A",
+        "Match_Percentage": result["score"],
+        "Matched_Skills": result["matched_skills"],
+        "Missing_Skills": result["missing_skills"],
+        "ATS_Warnings": analysis["ats_warnings"]
+    }
+
+
+def analyze_file(file_path, job_skills, profile=False, dedup=False, store_path=None):
+    """Run the full analysis pipeline on one file, never raising.
+
+    With profile=True the row also carries per-stage timings under "Profile",
+    and with dedup=True the document's fingerprint under "Fingerprint".
+    With a store_path, a document already in that ResultStore is re-scored
+    from its stored entities ("Reused") and the row carries a ResultStore.add
+    entry under "Stored" for the caller to write.
+    """
+    start = time.perf_counter()
+    row = {"File": file_path, "Error": ""}
+    with profile_document(file_path) if profile else nullcontext() as prof:
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            key = content_hash(data) if store_path else None
+            parsed = get_result_store(store_path).get(key) if store_path else None
+            analysis = analyze_document(data, job_skills, parsed)
+            row.update(report_row(analysis))
+            if store_path:
+                row["Reused"] = parsed is not None
+                row["Stored"] = {"key": key, "analysis": analysis, "job_skills": job_skills,
+                                 "file": file_path, "source": "batch"}
+            if dedup:
+                row["Fingerprint"] = fingerprint(data, analysis["text"])
+        except Exception as e:
+            row["Error"] = str(e)
+    if prof is not None:
+        row["Profile"] = prof.as_dict()
+    row["Seconds"] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def analyze_upload(name, data, job_skills, parsed=None):
+    """Analyze one in-memory document, never raising.
+
+    The row carries the analysis itself under "Analysis" so the caller can
+    cache the extracted text and entities.
+    """
+    start = time.perf_counter()
+    row = {"File": name, "Error": ""}
+    try:
+        analysis = analyze_document(data, job_skills, parsed)
+        row.update(report_row(analysis))
+        row["Analysis"] = analysis
+    except Exception as e:
+        row["Error"] = str(e)
+    row["Seconds"] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def extract_upload(name, data):
+    """Extract the text of one in-memory document, never raising; the row carries it under "Text" """
+    start = time.perf_counter()
+    row = {"File": name, "Error": ""}
+    try:
+        row["Text"] = extract_text_from_file(data)
+    except Exception as e:
+        row["Error"] = str(e)
+    row["Seconds"] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def analyze_uploads(uploads, job_skills, executor=None, parsed=None, parse=None):
+    """Yield (index, row) for a list of (name, data) uploads as each one finishes.
+
+    Extraction runs on the executor, one task per upload, or serially when
+    executor is None. parsed maps an upload's index to its stored text and
+    entities; those uploads are only re-scored, in this process, and come
+    first. With parse, the executor first extracts only the text, and
+    parse(index, text), called in this process, returns the upload's text
+    and entities; entities of None are then extracted on the executor, any
+    others just re-scored. Closing the generator early cancels the tasks
+    that have not started.
+    """
+    parsed = parsed or {}
+    for index in sorted(parsed):
+        name, data = uploads[index]
+        yield index, analyze_upload(name, data, job_skills, parsed[index])
+    todo = [index for index in range(len(uploads)) if index not in parsed]
+    if executor is None:
+        for index in todo:
+            name, data = uploads[index]
+            if parse is None:
+                yield index, analyze_upload(name, data, job_skills)
+                continue
+            extracted = extract_upload(name, data)
+            if extracted["Error"]:
+                yield index, extracted
+                continue
+            row = analyze_upload(name, data, job_skills, parse(index, extracted["Text"]))
+            yield index, _add_seconds(row, extracted)
+        return
+    stage = analyze_upload if parse is None else extract_upload
+    futures = {}
+    for index in todo:
+        name, data = uploads[index]
+        args = (name, data, job_skills) if parse is None else (name, data)
+        futures[executor.submit(stage, *args)] = (index, None)
+    try:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, extracted = futures.pop(future)
+                row = future.result()
+                if extracted is not None:
+                    yield index, _add_seconds(row, extracted)
+                    continue
+                if parse is None or row["Error"]:
+                    yield index, row
+                    continue
+                name, data = uploads[index]
+                upload = parse(index, row["Text"])
+                if upload["entities"] is None:
+                    futures[executor.submit(analyze_upload, name, data, job_skills, upload)] = (index, row)
+                else:
+                    yield index, _add_seconds(analyze_upload(name, data, job_skills, upload), row)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _add_seconds(row, extracted):
+    """Bill a row for the text extraction that ran before it"""
+    row["Seconds"] = round(row["Seconds"] + extracted["Seconds"], 4)
+    return row
+
+
+def parse_file(file_path):
+    """Extract text and entities from one file, keyed by its content hash"""
+    row = {"File": file_path, "Error": ""}
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        row["Key"] = content_hash(data)
+        row["text"] = extract_text_from_file(data)
+        row["entities"] = extract_entities(row["text"])
+    except Exception as e:
+        row["Error"] = str(e)
+    return row
+
+
+def run_batch(paths, job_skills, output_path, workers=None, on_result=None, profile_path=None,
+              flush_every=100, duplicate_index=None, store=None, job=None):
+    """Analyze many resumes across a process pool, appending rows to output_path.
+
+    Rows go through a ReportSink, so the output may be .csv, .jsonl or a
+    .parquet shard directory, and is flushed every flush_every rows.
+
+    When profile_path is given, per-stage timings for every document are
+    written there as JSON lines. With a DuplicateIndex, every resume is checked
+    against it and added; a repeat gets "Duplicate_Of" (the earlier file) and
+    "Similarity" in the row passed to on_result. With a ResultStore, resumes
+    already in it skip extraction and every result is written to it (under
+    the job name, if given) in transactions of flush_every rows. Returns a
+    summary dict with processed/failed/duplicate/reused counts, elapsed time
+    and resumes per second.
+    """
+    paths = list(paths)
+    processed = failed = duplicates = reused = 0
+    stored = []
+    start = time.perf_counter()
+    profile = bool(profile_path)
+
+    with ReportSink(output_path, batch_size=flush_every) as writer, \
+            (open(profile_path, 'w', encoding='utf-8') if profile else nullcontext()) as profile_file, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        dedup = duplicate_index is not None
+        store_path = store.path if store is not None else None
+        futures = [pool.submit(analyze_file, path, job_skills, profile, dedup, store_path) for path in paths]
+        for future in as_completed(futures):
+            row = future.result()
+            if profile:
+                write_jsonl(profile_file, [row.pop("Profile")])
+            fp = row.pop("Fingerprint", None)
+            if fp is not None:
+                match = duplicate_index.check(fp, label=row["File"])
+                if match:
+                    duplicates += 1
+                    row["Duplicate_Of"] = match.label
+                    row["Similarity"] = round(match.similarity, 3)
+            entry = row.pop("Stored", None)
+            if entry is not None:
+                entry["job"] = job
+                stored.append(entry)
+                reused += row["Reused"]
+                if len(stored) >= flush_every:
+                    store.add_many(stored)
+                    stored = []
+            writer.write(row)
+            if row["Error"]:
+                failed += 1
+            else:
+                processed += 1
+            if on_result:
+                on_result(row)
+        if stored:
+            store.add_many(stored)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "total": len(paths),
+        "processed": processed,
+        "failed": failed,
+        "duplicates": duplicates,
+        "reused": reused,
+        "seconds": round(elapsed, 3),
+        "resumes_per_second": round(len(paths) / elapsed, 2) if elapsed else 0.0
+    }
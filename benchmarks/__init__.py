@@ -0,0 +1,5 @@
+"""Micro-benchmarks for the resume analysis pipeline.
+
+Run a benchmark as a module from the project root, e.g.
+``python -m benchmarks.skill_matcher``.
+"""
@@ -0,0 +1,76 @@
+"""ATS check cost per document as the number of rules grows.
+
+Compares the RuleSet scan with evaluating every rule as its own regex
+search over the document, as check_ats_compliance used to.
+
+    python -m benchmarks.ats_rules [--repeat N]
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from ats_rules import DEFAULT_RULES_PATH, Rule, RuleSet
+from benchmarks.corpus import generate_resume
+
+RULE_COUNTS = [8, 50, 200, 1000]
+
+
+def grow_rules(base, count, seed=0):
+    """Pad the default rule set with keyword rules that rarely fire"""
+    rng = random.Random(seed)
+    rules = list(base.rules)
+    while len(rules) < count:
+        words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 10)))
+                 for _ in range(3)]
+        rules.append(Rule(f"extra_{len(rules)}", "present", f"Avoid {words[0]}", keywords=words))
+    return RuleSet(base.word_count, rules)
+
+
+def as_regexes(rule):
+    """The per-rule regex searches the old implementation would have run"""
+    regexes = []
+    if rule.keywords:
+        regexes.append(re.compile(r'\b(' + '|'.join(map(re.escape, rule.keywords)) + r')\b', re.IGNORECASE))
+    if rule.chars:
+        regexes.append(re.compile('[' + ''.join(map(re.escape, rule.chars)) + ']'))
+    if rule.substrings:
+        regexes.append(re.compile('|'.join(map(re.escape, rule.substrings)), re.IGNORECASE))
+    if rule.pattern:
+        regexes.append(rule.pattern)
+    return regexes
+
+
+def naive_present(compiled, text):
+    return {rule_id for rule_id, regexes in compiled if any(regex.search(text) for regex in regexes)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = ["\n".join(generate_resume(rng, words=600, layout=layout))
+             for layout in ("standard", "dense", "adversarial") for _ in range(5)]
+    base = RuleSet.load(DEFAULT_RULES_PATH)
+
+    print(f"{'rules':>6} {'scan us':>10} {'per-rule us':>12}")
+    for count in RULE_COUNTS:
+        rules = grow_rules(base, count)
+        compiled = [(rule.id, as_regexes(rule)) for rule in rules.rules]
+        for text in texts:
+            assert rules.present_rules(text) == naive_present(compiled, text)
+        timings = []
+        for func in (rules.scan, lambda text: naive_present(compiled, text)):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for text in texts:
+                    func(text)
+            timings.append((time.perf_counter() - start) / (args.repeat * len(texts)))
+        print(f"{count:>6} {timings[0] * 1e6:>10.1f} {timings[1] * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Offline generators for synthetic resume documents.
+
+Resumes are generated from a seeded RNG at a chosen length, skill density
+and layout, and written as PDF, DOCX or plain text without any network
+access or external tools:
+
+    python -m benchmarks.corpus out_dir --count 100 --formats pdf,docx,txt
+
+Layouts:
+    standard     conventional sections separated by blank lines
+    dense        no blank lines, long run-on lines, inline headings
+    adversarial  near-miss section headers, unterminated education lines,
+                 icons and table words that stress the extraction regexes
+"""
+import argparse
+import io
+import os
+import random
+
+from skills import SKILL_MAP
+
+SAMPLE_RESUME = """Jane Doe
+jane.doe@example.com | +1 555 123 4567
+
+TECHNICAL SKILLS
+Python, Django, Flask, PostgreSQL, Docker, Kubernetes, AWS, Git, CI/CD
+
+EXPERIENCE
+Senior Software Engineer - Acme Corp (2019 - 2024)
+- Developed a machine learning pipeline with scikit-learn and pandas that reduced churn by 12%
+- Led a team of 6 engineers building React.js and Node.js services on Google Cloud
+- Implemented Terraform modules and Jenkins jobs, improved deploy frequency by 40%
+- Managed a $1M budget across agile teams using Jira and Scrum
+
+EDUCATION
+B.Tech Computer Science
+State University | 2012 - 2016
+
+CERTIFICATIONS
+AWS Certified Solutions Architect (2021)
+Certified Kubernetes Administrator (2022)
+"""
+
+FIRST_NAMES = ["Jane", "Arjun", "Maria", "Wei", "Fatima", "Lucas", "Aisha", "Kenji", "Olga", "Diego"]
+LAST_NAMES = ["Doe", "Sharma", "Garcia", "Chen", "Khan", "Silva", "Bello", "Tanaka", "Ivanova", "Lopez"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "National University"]
+DEGREES = ["B.Tech Computer Science", "M.Tech Data Science", "MBA", "B.Sc Mathematics", "B.E Electronics"]
+VERBS = ["Developed", "Implemented", "Led", "Managed", "Improved", "Reduced", "Delivered", "Optimized"]
+FILLER = ("team project platform services customers reporting pipeline stakeholders production "
+          "scalable api testing design review migration roadmap quality onboarding support").split()
+ICONS = ["★", "⚡", "■", "♦", "█"]
+LAYOUTS = ("standard", "dense", "adversarial")
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(pages, font_size=11, lines_per_page=50):
+    """Build a minimal text PDF; pages is a list of line lists"""
+    objects = []
+    page_ids = []
+    # 1: catalog, 2: page tree, 3: font; pages and their content streams follow
+    for lines in pages:
+        content = [f"BT /F1 {font_size} Tf 50 780 Td {font_size + 3} TL"]
+        content += [f"({_pdf_escape(line)}) '" for line in lines[:lines_per_page]]
+        content.append("ET")
+        stream = "\n".join(content).encode('latin-1', 'replace')
+        content_id = 4 + len(objects)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(4 + len(objects))
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode())
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ] + objects
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _sentence(rng, skills, skill_density, words):
+    out = [rng.choice(VERBS)]
+    for _ in range(words):
+        out.append(rng.choice(skills) if rng.random() < skill_density else rng.choice(FILLER))
+    if rng.random() < 0.6:
+        out.append(f"by {rng.randint(5, 80)}%")
+    return " ".join(out)
+
+
+def generate_resume(rng, words=400, skill_density=0.05, layout="standard"):
+    """Return the lines of one synthetic resume of roughly ``words`` words"""
+    skills = rng.sample(list(SKILL_MAP), rng.randint(4, 16))
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    email = name.lower().replace(" ", ".") + "@example.com"
+    phone = f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}"
+    start_year = rng.randint(1995, 2015)
+
+    bullets = []
+    budget = max(words - 60, 10)
+    while budget > 0:
+        length = rng.randint(8, 20)
+        bullets.append(_sentence(rng, skills, skill_density, length))
+        budget -= length + 2
+
+    if layout == "dense":
+        # No blank lines and everything crammed into a few very long lines
+        return [
+            name,
+            f"{email} | {phone} SKILLS: {', '.join(skills)}",
+            "EXPERIENCE " + " ".join(bullets),
+            f"EDUCATION {rng.choice(DEGREES)} {rng.choice(SCHOOLS)} | {start_year} - {start_year + 4}",
+            "CERTIFICATIONS AWS Certified Developer (2021) Certified Scrum Master"
+        ]
+
+    lines = [name, f"{email} | {phone}", ""]
+    if layout == "adversarial":
+        lines += [
+            f"{rng.choice(ICONS)} PROFILE {rng.choice(ICONS)} see table, header and column layout",
+            "Skills skills SKILLS: " * 5,
+            "TECHNICAL SKILLS",
+            " | ".join(skills),
+        ]
+        lines += ["B.Tech " + " ".join(rng.choice(FILLER) for _ in range(30))] * 5
+        lines += ["EXPERIENCE"] + [f"{rng.choice(ICONS)} {bullet}" for bullet in bullets]
+        lines += ["CERTIFICATIONS", "CERTIFICATE", "LICENSES"] + ["1234 5678 9012 " * 3] * 3
+        return lines
+
+    lines += ["TECHNICAL SKILLS", ", ".join(skills), ""]
+    lines += ["EXPERIENCE", f"Software Engineer - {rng.choice(COMPANIES)} ({start_year + 4} - 2024)"]
+    lines += [f"- {bullet}" for bullet in bullets] + [""]
+    lines += ["EDUCATION", rng.choice(DEGREES), f"{rng.choice(SCHOOLS)} | {start_year} - {start_year + 4}", ""]
+    lines += ["CERTIFICATIONS", "AWS Certified Solutions Architect (2021)", "Certified Kubernetes Administrator (2022)"]
+    return lines
+
+
+def make_docx(lines, table_rows=()):
+    """Build a DOCX with one paragraph per line plus an optional table"""
+    from docx import Document
+
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    if table_rows:
+        table = doc.add_table(rows=len(table_rows), cols=len(table_rows[0]))
+        for row, values in zip(table.rows, table_rows):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def make_txt(lines):
+    return "\n".join(lines).encode('utf-8')
+
+
+def render(lines, file_format, layout="standard"):
+    """Encode resume lines as pdf, docx or txt bytes"""
+    if file_format == "pdf":
+        pages = [lines[i:i + 50] for i in range(0, len(lines), 50)] or [[]]
+        return make_pdf(pages)
+    if file_format == "docx":
+        if layout == "adversarial" and "TECHNICAL SKILLS" in lines:
+            # Templates often hide the skills list in a table
+            i = lines.index("TECHNICAL SKILLS")
+            return make_docx(lines[:i] + lines[i + 2:], table_rows=[(lines[i], lines[i + 1])])
+        return make_docx(lines)
+    return make_txt(lines)
+
+
+def generate_corpus(count, formats=("pdf", "docx", "txt"), words=400, skill_density=0.05,
+                    layouts=LAYOUTS, seed=0):
+    """Yield (name, bytes) pairs for a reproducible synthetic corpus"""
+    rng = random.Random(seed)
+    for i in range(count):
+        layout = layouts[i % len(layouts)]
+        # Walk layouts fastest so every layout appears in every format
+        file_format = formats[(i // len(layouts)) % len(formats)]
+        lines = generate_resume(rng, words=words, skill_density=skill_density, layout=layout)
+        yield f"resume_{i:05d}_{layout}.{file_format}", render(lines, file_format, layout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus")
+    parser.add_argument("directory")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--formats", default="pdf,docx,txt")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS))
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--skill-density", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.directory, exist_ok=True)
+    corpus = generate_corpus(args.count, tuple(args.formats.split(",")), args.words,
+                             args.skill_density, tuple(args.layouts.split(",")), args.seed)
+    for name, data in corpus:
+        with open(os.path.join(args.directory, name), 'wb') as f:
+            f.write(data)
+    print(f"Wrote {args.count} resumes to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
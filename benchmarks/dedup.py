@@ -0,0 +1,76 @@
+"""Duplicate lookup latency and recall against a large fingerprint index.
+
+Fills an on-disk index with --corpus unrelated documents (random MinHash
+signatures stand in for them) plus a few hundred synthetic resumes, then
+reloads it and queries lightly edited copies of those resumes.
+
+    python -m benchmarks.dedup [--corpus 300000] [--edits 0.02]
+"""
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.corpus import generate_resume
+from dedup import DuplicateIndex, Fingerprint, fingerprint, get_hasher
+
+
+def edit(text, rng, share):
+    """Replace a share of the words, like a candidate touching up their CV"""
+    words = text.split(" ")
+    for _ in range(max(1, int(len(words) * share))):
+        words[rng.randrange(len(words))] = rng.choice(["senior", "lead", "2024", "remote", "team"])
+    return " ".join(words)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=int, default=300000)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--edits", type=float, default=0.02, help="share of words changed in each copy")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = ["\n".join(generate_resume(rng)) for _ in range(args.resumes)]
+    signatures = np.random.default_rng(0).integers(
+        0, 2 ** 32, size=(args.corpus, get_hasher().num_perm), dtype=np.uint32
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = DuplicateIndex(directory)
+        start = time.perf_counter()
+        for i, signature in enumerate(signatures):
+            index.add(Fingerprint(f"bulk-{i}", f"bulk-{i}", signature))
+        for i, text in enumerate(texts):
+            index.add(fingerprint(text.encode(), text), label=f"resume-{i}")
+        print(f"built {len(index)} documents in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        index = DuplicateIndex(directory)
+        print(f"reloaded in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        fingerprint_ms, query_us, found = [], [], 0
+        for i, text in enumerate(texts):
+            copy = edit(text, rng, args.edits)
+            start = time.perf_counter()
+            fp = fingerprint(copy.encode(), copy)
+            fingerprint_ms.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            match = index.query(fp)
+            query_us.append((time.perf_counter() - start) * 1e6)
+            found += match is not None and match.label == f"resume-{i}"
+
+    print(f"fingerprint       p50 {percentile(fingerprint_ms, 0.5):.3f} ms  p99 {percentile(fingerprint_ms, 0.99):.3f} ms")
+    print(f"query             p50 {percentile(query_us, 0.5):.0f} us  p99 {percentile(query_us, 0.99):.0f} us")
+    print(f"edited copies found {found}/{len(texts)} ({args.edits:.0%} of words changed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""DOCX extraction: streaming zip/XML reader versus python-docx.
+
+Builds DOCX files of growing size, each a long resume with a skills table,
+and extracts them both ways in a fresh interpreter. It reports time, peak
+RSS growth sampled from /proc (Linux only; python-docx keeps its lxml tree
+outside the Python heap, so tracemalloc would not see it) and how many
+characters each path recovers.
+
+    python -m benchmarks.docx_extraction [--paragraphs 1000,10000,50000]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.corpus import generate_resume, make_docx
+
+CHILD = """
+import io, json, os, sys, threading, time
+method, path = sys.argv[1], sys.argv[2]
+with open(path, 'rb') as f:
+    data = f.read()
+if method == 'python-docx':
+    from docx import Document
+    extract = lambda: "\\n".join(p.text for p in Document(io.BytesIO(data)).paragraphs)
+else:
+    from docx_text import iter_docx_text
+    extract = lambda: "".join(iter_docx_text(io.BytesIO(data)))
+
+# The kernel's peak-RSS counter updates lazily, so sample the current RSS
+page = os.sysconf("SC_PAGE_SIZE")
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * page
+peak = [rss()]
+before = peak[0]
+done = threading.Event()
+def sample():
+    while not done.wait(0.002):
+        peak[0] = max(peak[0], rss())
+threading.Thread(target=sample, daemon=True).start()
+start = time.perf_counter()
+text = extract()
+seconds = time.perf_counter() - start
+done.set()
+peak[0] = max(peak[0], rss())
+print(json.dumps({"seconds": seconds, "rss_mb": (peak[0] - before) / 2 ** 20, "chars": len(text)}))
+"""
+
+
+def build(paragraphs, rng):
+    lines = []
+    while len(lines) < paragraphs:
+        lines.extend(generate_resume(rng, words=600))
+    rows = [("TECHNICAL SKILLS", "Python, SQL, Docker, Kubernetes")] * 20
+    return make_docx(lines[:paragraphs], table_rows=rows)
+
+
+def run(method, path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", CHILD, method, path], cwd=root,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", default="1000,10000,50000")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'paragraphs':>10} {'MB':>6} {'method':<12} {'seconds':>9} {'RSS +MB':>8} {'chars':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for paragraphs in (int(n) for n in args.paragraphs.split(",")):
+            path = os.path.join(directory, f"{paragraphs}.docx")
+            with open(path, 'wb') as f:
+                f.write(build(paragraphs, rng))
+            size = os.path.getsize(path) / 2 ** 20
+            for method in ("python-docx", "streaming"):
+                result = run(method, path)
+                print(f"{paragraphs:>10} {size:>6.2f} {method:<12} {result['seconds']:>9.3f} "
+                      f"{result['rss_mb']:>8.1f} {result['chars']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Time to first render of the Streamlit app when the asset host is slow.
+
+A local HTTP server stands in for lottie.host and answers after --delay
+seconds, like a network-restricted host that stalls until a timeout. Each
+scenario renders app.py with Streamlit's AppTest in a fresh interpreter:
+
+    cold          nothing cached; the animation is fetched in the background
+    rerun         a second run of the same session
+    disk cache    a new process with the animation already on disk
+
+"before" is the blocking ``requests.get`` the old module-level loader made
+on every run, added to the measured render time.
+
+    python -m benchmarks.first_render [--delay 3]
+"""
+import argparse
+import http.server
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+CHILD = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+print(json.dumps({{"first_s": first, "rerun_s": time.perf_counter() - start}}))
+"""
+
+
+def slow_server(delay):
+    body = json.dumps({"v": "5.7.4", "fr": 30, "ip": 0, "op": 60, "w": 100, "h": 100, "layers": []}).encode()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The app process exited before its background fetch finished
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def render(env):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(app=APP_PATH)], env=env,
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=3.0, help="seconds the asset host takes to answer")
+    args = parser.parse_args()
+
+    server = slow_server(args.delay)
+    url = f"http://127.0.0.1:{server.server_address[1]}/landing.json"
+
+    import requests
+
+    start = time.perf_counter()
+    requests.get(url)
+    blocking_fetch = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, RESUME_ANALYZER_LOTTIE_URL=url, RESUME_ANALYZER_ASSET_CACHE_DIR=cache_dir)
+        cold = render(env)
+        # Let the background fetch from a process of our own fill the disk cache
+        from assets import RemoteAsset
+        RemoteAsset(url, cache_dir=cache_dir).get(wait=args.delay + 5)
+        warm = render(env)
+
+    print(f"{'scenario':<22} {'first render ms':>16} {'rerun ms':>10}")
+    print(f"{'before (estimated)':<22} {(cold['first_s'] + blocking_fetch) * 1000:>16.1f} "
+          f"{(cold['rerun_s'] + blocking_fetch) * 1000:>10.1f}")
+    print(f"{'after, cold':<22} {cold['first_s'] * 1000:>16.1f} {cold['rerun_s'] * 1000:>10.1f}")
+    print(f"{'after, disk cache':<22} {warm['first_s'] * 1000:>16.1f} {warm['rerun_s'] * 1000:>10.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Nightly folder ingestion: a full run versus incremental runs with a manifest.
+
+Writes --files synthetic resumes and ingests them once from scratch. Then
+it times three later nights: nothing changed, --growth new files added
+(plus a few edited), and a new job skill list that only re-scores.
+
+    python -m benchmarks.ingest [--files 500] [--growth 0.05] [--workers 4]
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from benchmarks.corpus import generate_corpus, generate_resume, render
+from ingest import run_ingest
+from store import ResultStore
+
+JOB_SKILLS = ["python", "machine learning", "sql", "html", "css", "javascript"]
+NEW_JOB_SKILLS = ["java", "spring", "kubernetes", "aws"]
+
+
+def night(label, directory, store, job_skills, workers):
+    summary = run_ingest(directory, job_skills, store, workers=workers)
+    print(f"{label:<22} {summary['seconds']:>8.2f} s  skipped {summary['skipped']:>5}  "
+          f"re-scored {summary['rescored']:>5}  processed {summary['processed']:>5}  "
+          f"failed {summary['failed']:>3}  ~{summary['saved_seconds']:.1f} s saved")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--growth", type=float, default=0.05, help="share of new files on the second night")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as root:
+        directory = os.path.join(root, "resumes")
+        os.makedirs(directory)
+        for name, data in generate_corpus(args.files, formats=("pdf", "docx"), words=800):
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(data)
+        store = ResultStore(os.path.join(root, "results.db"))
+
+        night("first run", directory, store, JOB_SKILLS, args.workers)
+        night("no changes", directory, store, JOB_SKILLS, args.workers)
+
+        names = sorted(os.listdir(directory))
+        for i in range(max(1, int(args.files * args.growth))):
+            with open(os.path.join(directory, f"new_{i:05d}.pdf"), 'wb') as f:
+                f.write(render(generate_resume(rng, words=800), "pdf"))
+        for name in rng.sample(names, max(1, args.files // 100)):
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(render(generate_resume(rng, words=800), name.rsplit(".", 1)[1]))
+        night(f"+{args.growth:.0%} new, 1% edited", directory, store, JOB_SKILLS, args.workers)
+        night("new job skill list", directory, store, NEW_JOB_SKILLS, args.workers)
+
+
+if __name__ == "__main__":
+    main()
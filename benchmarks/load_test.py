@@ -0,0 +1,80 @@
+"""Load test for the HTTP service: p50/p99 latency at increasing concurrency.
+
+Start the service first, e.g. ``uvicorn service:app --port 8000``, then
+
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 [--levels 1,4,16,64]
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.corpus import SAMPLE_RESUME, make_pdf
+
+
+def multipart_body(file_name, data, fields):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'.encode() + data + b'\r\n'
+    )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def post(url, body, content_type):
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - start
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--levels", default="1,4,16,64", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="requests per level")
+    parser.add_argument("--pages", type=int, default=2, help="pages per test resume")
+    args = parser.parse_args()
+
+    pdf = make_pdf([SAMPLE_RESUME.splitlines()] * args.pages)
+    body, content_type = multipart_body("resume.pdf", pdf, {"skills": "python, sql, docker"})
+    url = args.url.rstrip("/") + "/analyze"
+
+    print(f"{'concurrency':>11} {'ok':>5} {'429':>5} {'other':>5} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for level in [int(level) for level in args.levels.split(",")]:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=level) as threads:
+            results = list(threads.map(lambda _: post(url, body, content_type), range(args.requests)))
+        elapsed = time.perf_counter() - start
+        ok = [seconds for status, seconds in results if status == 200]
+        rejected = sum(1 for status, _ in results if status == 429)
+        other = len(results) - len(ok) - rejected
+        print(f"{level:>11} {len(ok):>5} {rejected:>5} {other:>5} "
+              f"{percentile(ok, 0.5) * 1000:>8.1f} {percentile(ok, 0.99) * 1000:>8.1f} "
+              f"{len(results) / elapsed:>8.1f}")
+
+    with urllib.request.urlopen(args.url.rstrip("/") + "/health") as response:
+        print(json.loads(response.read()))
+
+
+if __name__ == "__main__":
+    main()
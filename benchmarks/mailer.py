@@ -0,0 +1,114 @@
+"""Messages per second: pooled MailQueue versus one SMTP session per message.
+
+Runs against a local sink server that accepts and discards mail, with an
+optional per-reply delay to mimic a remote server's round-trip time. Point
+--host/--port at another server (e.g. ``python -m aiosmtpd -n -l
+localhost:8025``) to use that instead.
+
+    python -m benchmarks.mailer [--messages 500] [--latency-ms 5] [--workers 1,4]
+"""
+import argparse
+import socketserver
+import threading
+import time
+
+from mailer import MailQueue, build_message, open_connection
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept messages and throw them away"""
+
+    def reply(self, line):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.reply("220 sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                self.reply("250 sink")
+            elif command == b"DATA":
+                self.reply("354 go ahead")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.received += 1
+                self.reply("250 accepted")
+            elif command == b"QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+class SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency):
+        super().__init__(("127.0.0.1", 0), SinkHandler)
+        self.latency = latency
+        self.received = 0
+
+
+def per_message(host, port, messages):
+    """The original app behaviour: connect, send and quit for every message"""
+    for msg in messages:
+        server = open_connection(host, port, starttls=False)
+        server.send_message(msg)
+        server.quit()
+
+
+def pooled(host, port, messages, workers):
+    mail = MailQueue(host, port, starttls=False, workers=workers, max_retries=0)
+    futures = [mail.submit_message(msg) for msg in messages]
+    for future in futures:
+        future.result()
+    mail.close()
+    return mail.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="delay before each sink reply")
+    parser.add_argument("--workers", default="1,4", help="comma-separated pooled connection counts")
+    parser.add_argument("--host", default=None, help="use an external SMTP server instead of the sink")
+    parser.add_argument("--port", type=int, default=25)
+    args = parser.parse_args()
+
+    sink = None
+    if args.host:
+        host, port = args.host, args.port
+    else:
+        sink = SinkServer(args.latency_ms / 1000)
+        threading.Thread(target=sink.serve_forever, daemon=True).start()
+        host, port = sink.server_address
+
+    messages = [
+        build_message("bench@example.com", f"user{i}@example.com", "Resume Analysis Report", "report body\n" * 20)
+        for i in range(args.messages)
+    ]
+
+    start = time.perf_counter()
+    per_message(host, port, messages)
+    baseline = time.perf_counter() - start
+    print(f"{'per-message connections':<26} {args.messages / baseline:>10.1f} msg/s")
+
+    for workers in (int(n) for n in args.workers.split(",")):
+        start = time.perf_counter()
+        stats = pooled(host, port, messages, workers)
+        elapsed = time.perf_counter() - start
+        print(f"{f'pooled, {workers} connection(s)':<26} {args.messages / elapsed:>10.1f} msg/s "
+              f"({baseline / elapsed:.1f}x, {stats['connections']} connects, {stats['failed']} failed)")
+
+    if sink:
+        sink.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Tail latency of PDF extraction under a mix of short and very long uploads.
+
+Compares whole-document pdfminer extraction with the streaming extractor
+and its page limit, and reports time to the first page.
+
+    python -m benchmarks.pdf_streaming [--long-pages 40] [--max-pages 5]
+"""
+import argparse
+import io
+import random
+import time
+
+from pdfminer.high_level import extract_text
+
+from benchmarks.corpus import SAMPLE_RESUME, make_pdf
+from parser import iter_text_from_file
+
+
+def build_uploads(count, long_pages, long_share, seed=0):
+    rng = random.Random(seed)
+    lines = SAMPLE_RESUME.splitlines()
+    uploads = []
+    for _ in range(count):
+        pages = long_pages if rng.random() < long_share else rng.randint(1, 2)
+        uploads.append(make_pdf([lines * 2 for _ in range(pages)]))
+    return uploads
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=60)
+    parser.add_argument("--long-pages", type=int, default=40)
+    parser.add_argument("--long-share", type=float, default=0.1)
+    parser.add_argument("--max-pages", type=int, default=5)
+    args = parser.parse_args()
+
+    uploads = build_uploads(args.uploads, args.long_pages, args.long_share)
+
+    full = []
+    for data in uploads:
+        start = time.perf_counter()
+        extract_text(io.BytesIO(data))
+        full.append(time.perf_counter() - start)
+
+    limited = []
+    first_page = []
+    for data in uploads:
+        start = time.perf_counter()
+        pages = iter_text_from_file(data, max_pages=args.max_pages, time_budget=0)
+        next(pages)
+        first_page.append(time.perf_counter() - start)
+        for _ in pages:
+            pass
+        limited.append(time.perf_counter() - start)
+
+    print(f"{args.uploads} uploads, {args.long_share:.0%} with {args.long_pages} pages")
+    print(f"{'':<28} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, values in [
+        ("full extract_text", full),
+        (f"streaming, max {args.max_pages} pages", limited),
+        ("streaming, first page", first_page),
+    ]:
+        print(f"{name:<28} {percentile(values, 0.5) * 1000:>8.1f} {percentile(values, 0.99) * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
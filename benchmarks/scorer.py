@@ -0,0 +1,106 @@
+"""score_resume against many job profiles: compiled profiles vs the old loop.
+
+The old implementation compared every required skill with every resume
+skill through SequenceMatcher and re-lowercased the text for each miss.
+
+    python -m benchmarks.scorer [--profiles N] [--skills-per-profile K]
+"""
+import argparse
+import random
+import re
+import time
+from difflib import SequenceMatcher
+
+from benchmarks.corpus import SAMPLE_RESUME
+from parser import extract_entities
+from scorer import JobProfile, get_job_profile, score_against_profiles, score_resume
+from skills import SKILL_MAP
+
+
+def legacy_score_resume(entities, job_skills, raw_text=None):
+    """The previous nested-loop scorer, kept for comparison"""
+    matched_skills = []
+    missing_skills = []
+    resume_skills = [skill.lower().strip() for skill in entities.get('skills', [])]
+    job_skills = [skill.lower().strip() for skill in job_skills]
+    for required_skill in job_skills:
+        best_score = 0
+        for resume_skill in resume_skills:
+            if required_skill == resume_skill:
+                best_score = 1.0
+                break
+            current_score = SequenceMatcher(None, required_skill, resume_skill).ratio()
+            if current_score > best_score and current_score > 0.7:
+                best_score = current_score
+        if best_score < 0.8 and raw_text:
+            text_lower = raw_text.lower()
+            variations = [
+                required_skill,
+                required_skill.replace(' ', ''),
+                required_skill.replace(' ', '-'),
+                required_skill.replace('/', ' '),
+                required_skill.replace('/', ' and ')
+            ]
+            if any(re.search(r'\b' + re.escape(variation) + r'\b', text_lower) for variation in variations):
+                best_score = 1.0
+        if best_score >= 0.7:
+            matched_skills.append(required_skill)
+        else:
+            missing_skills.append(required_skill)
+    return matched_skills, missing_skills
+
+
+def build_profiles(count, skills_per_profile, seed=0):
+    rng = random.Random(seed)
+    pool = list(SKILL_MAP) + ['pyhton', 'postgre sql', 'react native', 'ci cd', 'nodejs', 'rest apis']
+    return [rng.sample(pool, skills_per_profile) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=300)
+    parser.add_argument("--skills-per-profile", type=int, default=12)
+    args = parser.parse_args()
+
+    entities = extract_entities(SAMPLE_RESUME)
+    profiles = build_profiles(args.profiles, args.skills_per_profile)
+
+    for profile in profiles:
+        result = score_resume(entities, profile, raw_text=SAMPLE_RESUME)
+        expected = legacy_score_resume(entities, profile, raw_text=SAMPLE_RESUME)
+        assert (result["matched_skills"], result["missing_skills"]) == expected
+
+    start = time.perf_counter()
+    for profile in profiles:
+        legacy_score_resume(entities, profile, raw_text=SAMPLE_RESUME)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for profile in profiles:
+        JobProfile(profile)
+    compile_cost = time.perf_counter() - start
+
+    # Steady state: the job profiles are already compiled and cached
+    compiled = [get_job_profile(profile) for profile in profiles]
+    start = time.perf_counter()
+    for profile in compiled:
+        score_resume(entities, profile, raw_text=SAMPLE_RESUME)
+    batched = time.perf_counter() - start
+
+    score_against_profiles(entities, compiled, raw_text=SAMPLE_RESUME)
+    start = time.perf_counter()
+    score_against_profiles(entities, compiled, raw_text=SAMPLE_RESUME)
+    single_pass = time.perf_counter() - start
+
+    per_profile = 1e6 / len(profiles)
+    print(f"{len(profiles)} profiles x {args.skills_per_profile} skills, "
+          f"{len(entities['skills'])} resume skills")
+    print(f"legacy loop:        {legacy * 1000:8.1f} ms ({legacy * per_profile:7.0f} us/profile)")
+    print(f"profile compile:    {compile_cost * 1000:8.1f} ms ({compile_cost * per_profile:7.0f} us/profile, once)")
+    print(f"cached profiles:    {batched * 1000:8.1f} ms ({batched * per_profile:7.0f} us/profile)")
+    print(f"one text pass:      {single_pass * 1000:8.1f} ms ({single_pass * per_profile:7.0f} us/profile)")
+    print(f"speedup vs legacy:  {legacy / single_pass:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
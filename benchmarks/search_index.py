@@ -0,0 +1,65 @@
+"""Query latency of the candidate search index on a synthetic corpus.
+
+    python -m benchmarks.search_index [--docs 200000] [--queries 50]
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from search_index import CandidateIndex
+from skills import SKILL_MAP
+
+FILLER = ("team project delivered built designed services customers data platform "
+          "reporting pipeline stakeholders production scalable api testing").split()
+
+
+def synthetic_resume(rng):
+    skills = rng.sample(list(SKILL_MAP), rng.randint(3, 15))
+    words = [rng.choice(FILLER) for _ in range(rng.randint(150, 600))]
+    words += [rng.choice(skills) for _ in range(rng.randint(5, 30))]
+    rng.shuffle(words)
+    return {"name": "", "email": [], "skills": skills}, " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--segment-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    directory = tempfile.mkdtemp(prefix="candidate_index_")
+    try:
+        index = CandidateIndex(directory)
+        start = time.perf_counter()
+        for i in range(args.docs):
+            entities, text = synthetic_resume(rng)
+            index.add(f"doc-{i}", entities, text)
+            if (i + 1) % args.segment_size == 0:
+                index.commit()
+        index.commit()
+        index.compact()
+        build = time.perf_counter() - start
+        print(f"built index of {len(index)} resumes in {build:.1f}s")
+
+        # A fresh handle measures what a separate server process would see
+        reader = CandidateIndex(directory)
+        latencies = []
+        for _ in range(args.queries):
+            job_skills = rng.sample(list(SKILL_MAP), rng.randint(4, 12))
+            start = time.perf_counter()
+            reader.search(job_skills, k=50)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"top-50 query over {len(reader)} resumes: p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Worst-case inputs for section extraction: old regexes versus the segmenter.
+
+Each case is grown until the old multi-line regexes (education, skills and
+certifications, as extract_entities used to run them) take noticeably
+longer per character. The segmenter-based extraction should scale linearly,
+so its time per KB stays flat as the inputs grow.
+
+    python -m benchmarks.sections [--sizes 2000,4000,8000]
+"""
+import argparse
+import re
+import time
+
+from parser import extract_education
+from sections import segment
+from skills import SKILL_MATCHER
+
+LEGACY_EDUCATION = re.compile(
+    r'(B\.?\s?Tech|M\.?\s?Tech|MBA|B\.?\s?E|B\.?\s?Sc|B\.?\s?Com|B\.?\s?A).*?\n(.*?)\|.*?(\d{4}.*?\d{4})',
+    re.IGNORECASE
+)
+LEGACY_SKILLS = re.compile(
+    r'(?:SKILLS|TECHNICAL SKILLS|SKILL SET|EXPERTISE|COMPETENCIES)[\s:]*\n(.*?)(?=\n\n|\n[A-Z][A-Z]+|\n\w|$)',
+    re.IGNORECASE | re.DOTALL
+)
+LEGACY_CERTIFICATIONS = re.compile(
+    r'(?:CERTIFICATIONS|CERTIFICATE|LICENSES|TRAININGS)[\s:]*\n(.*?)(?=\n\n|\n[A-Z][A-Z]+|\n\w|$)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Each builder takes a size and returns a document
+WORST_CASES = {
+    # A degree line followed by a line of pipes without any year range
+    "pipes after degree": lambda n: "EDUCATION\nB.Tech\n" + "| " * n,
+    # One long line (e.g. a PDF with no line breaks) full of "ba" substrings
+    "one-line document": lambda n: "ba " * n,
+    # Many degree lines, each followed by a pipe line without year range
+    "degree ladder": lambda n: "EDUCATION\n" + "BA | 1999\n" * (n // 10) + "ba | " * n,
+    # Mostly headings: the segmenter's own worst case
+    "heading soup": lambda n: ("Skills \t\n" * 5 + "Certifications:\n\n") * (n // 20),
+}
+
+
+def legacy_extract(text):
+    list(LEGACY_EDUCATION.finditer(text))
+    LEGACY_SKILLS.search(text)
+    list(LEGACY_CERTIFICATIONS.finditer(text))
+
+
+def segmented_extract(text):
+    sections = segment(text)
+    lines = sections.lines("education") if sections.has("education") else text.split("\n")
+    extract_education(lines)
+    SKILL_MATCHER.find(sections.text("skills").lower())
+    sections.lines("certifications")
+
+
+def timed(func, text):
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="2000,4000,8000")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    print(f"{'case':<20} {'size':>7} {'KB':>7} {'old ms':>10} {'new ms':>9} {'old ms/KB':>10} {'new ms/KB':>10}")
+    for name, build in WORST_CASES.items():
+        for size in sizes:
+            text = build(size)
+            kb = len(text) / 1024
+            old = timed(legacy_extract, text)
+            new = timed(segmented_extract, text)
+            print(f"{name:<20} {size:>7} {kb:>7.1f} {old * 1000:>10.1f} {new * 1000:>9.2f} "
+                  f"{old * 1000 / kb:>10.3f} {new * 1000 / kb:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
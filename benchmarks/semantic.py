@@ -0,0 +1,103 @@
+"""Semantic skill matching throughput: batched phrase embedding versus nlp() per phrase.
+
+Uses the configured spaCy model (--model to pick another). When no model
+with word vectors is installed, --synthetic builds a blank English
+pipeline with random 300-d vectors for the corpus vocabulary, plus
+untrained tok2vec and ner components standing in for the ones
+en_core_web_md keeps after RESUME_ANALYZER_SPACY_EXCLUDE. The timings
+are then representative, but the matches are meaningless.
+
+    python -m benchmarks.semantic [--resumes 200] [--model en_core_web_md | --synthetic]
+"""
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.corpus import generate_resume
+from semantic import PhraseEmbedder, SemanticMatcher, has_vectors, resume_phrases
+from skills import SKILL_MAP
+
+
+def synthetic_pipeline(texts, width=300):
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.vocab.reset_vectors(width=width)
+    words = {word for text in texts for word in text.lower().split()}
+    words.update(word for aliases in SKILL_MAP.values() for alias in aliases for word in alias.split())
+    vectors = np.random.default_rng(0).normal(size=(len(words), width)).astype(np.float32)
+    for word, vector in zip(sorted(words), vectors):
+        nlp.vocab.set_vector(word, vector)
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("ner").add_label("ORG")
+    nlp.initialize()
+    return nlp
+
+
+def load_pipeline(args, texts):
+    if args.synthetic:
+        return synthetic_pipeline(texts)
+    from parser import get_nlp, load_spacy_model
+
+    try:
+        nlp = load_spacy_model(args.model) if args.model else get_nlp()
+    except RuntimeError as e:
+        raise SystemExit(f"{e}; or pass --synthetic")
+    if not has_vectors(nlp):
+        raise SystemExit("the model has no word vectors; install en_core_web_md or pass --synthetic")
+    return nlp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--model", help="spaCy model package (default: RESUME_ANALYZER_SPACY_MODEL)")
+    parser.add_argument("--synthetic", action="store_true", help="random vectors instead of a model")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = ["\n".join(generate_resume(rng)) for _ in range(args.resumes)]
+    nlp = load_pipeline(args, texts)
+    phrases = [phrase for text in texts for phrase in resume_phrases(text)]
+    jobs = [rng.sample(list(SKILL_MAP), rng.randint(4, 10)) for _ in range(20)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        matcher = SemanticMatcher(nlp, cache_dir=directory)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        SemanticMatcher(nlp, cache_dir=directory)
+        warm = time.perf_counter() - start
+
+    embedder = PhraseEmbedder(nlp)
+    start = time.perf_counter()
+    embedder.embed(phrases)
+    batched = time.perf_counter() - start
+
+    sample = phrases[:500]
+    start = time.perf_counter()
+    for phrase in sample:
+        nlp(phrase).vector
+    naive = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for i, text in enumerate(texts):
+        matcher.match_text(jobs[i % len(jobs)], text)
+    per_resume = (time.perf_counter() - start) / len(texts)
+
+    print(f"model {nlp.meta.get('name')} ({nlp.vocab.vectors.shape[0]} vectors x {embedder.width}), "
+          f"pipeline {nlp.pipe_names}")
+    print(f"{'taxonomy matrix, cold':<26} {cold * 1000:>10.1f} ms ({len(matcher.aliases)} aliases)")
+    print(f"{'taxonomy matrix, cached':<26} {warm * 1000:>10.1f} ms")
+    print(f"{'nlp(phrase).vector':<26} {1 / naive:>10,.0f} phrases/s")
+    print(f"{'batched embedding':<26} {len(phrases) / batched:>10,.0f} phrases/s "
+          f"({naive * len(phrases) / batched:.0f}x)")
+    print(f"{'match_text per resume':<26} {per_resume * 1000:>10.2f} ms "
+          f"({len(phrases) / len(texts):.0f} phrases each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Per-resume skill matching latency as the taxonomy grows.
+
+Compares the compiled ``SkillMatcher`` with the old approach of running one
+``re.search`` per alias, for taxonomies of 90 up to 10,000 aliases.
+
+    python -m benchmarks.skill_matcher [--repeat N]
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from benchmarks.corpus import SAMPLE_RESUME
+from skills import SKILL_MAP, SkillMatcher
+
+SIZES = [90, 500, 2000, 10000]
+
+
+def build_taxonomy(alias_count, seed=0):
+    """Return a skill map with exactly ``alias_count`` aliases"""
+    rng = random.Random(seed)
+    taxonomy = {}
+    count = 0
+    for standard_skill, variations in SKILL_MAP.items():
+        for variation in variations:
+            if count == alias_count:
+                return taxonomy
+            taxonomy.setdefault(standard_skill, []).append(variation)
+            count += 1
+    while count < alias_count:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        if rng.random() < 0.3:
+            word += ' ' + ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        if word not in taxonomy:
+            taxonomy[word] = [word]
+            count += 1
+    return taxonomy
+
+
+def legacy_find(skill_map, text_lower):
+    """The previous per-alias regex loop from parser.extract_entities"""
+    return [
+        standard_skill for standard_skill, variations in skill_map.items()
+        if any(re.search(r'\b' + re.escape(variation) + r'\b', text_lower) for variation in variations)
+    ]
+
+
+def time_per_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="calls per measurement")
+    args = parser.parse_args()
+
+    text_lower = SAMPLE_RESUME.lower()
+    print(f"{'aliases':>8} {'build ms':>10} {'matcher ms':>11} {'legacy ms':>10} {'speedup':>8}")
+    for size in SIZES:
+        taxonomy = build_taxonomy(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build = time.perf_counter() - start
+
+        assert matcher.ordered(matcher.find(text_lower)) == legacy_find(taxonomy, text_lower)
+        fast = time_per_call(lambda: matcher.find(text_lower), args.repeat)
+        slow = time_per_call(lambda: legacy_find(taxonomy, text_lower), args.repeat)
+        print(f"{size:>8} {build * 1000:>10.2f} {fast * 1000:>11.3f} {slow * 1000:>10.3f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
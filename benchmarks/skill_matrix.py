@@ -0,0 +1,73 @@
+"""Candidates x jobs scoring: SkillMatrix bitsets versus score_resume per pair.
+
+Jobs draw 4-10 skills from the taxonomy. Candidate bitsets are random rows
+with 8-25 skills, since encoding resumes is a one-off cost per resume and is
+timed separately on a few real synthetic resumes. score_resume is timed on a
+sample of pairs and extrapolated to the full matrix.
+
+    python -m benchmarks.skill_matrix [--candidates 100000] [--jobs 1000] [-k 10]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.corpus import generate_resume
+from parser import extract_entities
+from scorer import score_resume
+from skill_matrix import SkillMatrix
+from skills import SKILL_MAP
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--sample", type=int, default=2000, help="score_resume calls to time")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    taxonomy = list(SKILL_MAP)
+    jobs = [rng.sample(taxonomy, rng.randint(4, 10)) for _ in range(args.jobs)]
+    matrix = SkillMatrix(jobs)
+    vocabulary = matrix.vocabulary
+
+    texts = ["\n".join(generate_resume(rng)) for _ in range(50)]
+    entities = [extract_entities(text) for text in texts]
+    start = time.perf_counter()
+    for entity, text in zip(entities, texts):
+        vocabulary.resume_row(entity, text)
+    encode = (time.perf_counter() - start) / len(texts)
+
+    for _ in range(args.candidates):
+        ids = rng.sample(range(len(vocabulary)), rng.randint(8, 25))
+        matrix.add_candidate_row(vocabulary.pack(ids))
+
+    start = time.perf_counter()
+    for i in range(args.sample):
+        score_resume(entities[i % len(entities)], jobs[i % len(jobs)], raw_text=texts[i % len(texts)])
+    per_pair = (time.perf_counter() - start) / args.sample
+    pairs = args.candidates * args.jobs
+
+    start = time.perf_counter()
+    matrix.scores()
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    matrix.top_jobs(args.k)
+    top_jobs = time.perf_counter() - start
+    start = time.perf_counter()
+    matrix.top_candidates(args.k)
+    top_candidates = time.perf_counter() - start
+
+    print(f"{args.candidates} candidates x {args.jobs} jobs, {len(vocabulary)} skills "
+          f"({vocabulary.words} uint64 words per row)")
+    print(f"{'resume encoding':<28} {encode * 1000:>10.2f} ms per resume")
+    print(f"{'score_resume per pair':<28} {per_pair * 1e6:>10.1f} us -> {per_pair * pairs:,.0f} s for the matrix")
+    print(f"{'full score matrix':<28} {full:>10.2f} s ({pairs / full / 1e6:,.0f}M pairs/s, "
+          f"{per_pair * pairs / full:,.0f}x)")
+    print(f"{f'top {args.k} jobs per candidate':<28} {top_jobs:>10.2f} s")
+    print(f"{f'top {args.k} candidates per job':<28} {top_candidates:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
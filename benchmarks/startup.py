@@ -0,0 +1,66 @@
+"""Import time and memory of the analysis modules with and without spaCy.
+
+Each scenario runs in a fresh interpreter so module caches do not leak
+between measurements.
+
+    python -m benchmarks.startup [--model en_core_web_sm]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+CHILD = """
+import json, resource, time
+start = time.perf_counter()
+import parser, scorer, utils
+imported = time.perf_counter() - start
+if {load!r}:
+    parser.get_nlp()
+print(json.dumps({{
+    "import_s": imported,
+    "total_s": time.perf_counter() - start,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+SCENARIOS = [
+    ("nlp disabled", "none", False),
+    ("lazy, not used", None, False),
+    ("lazy, loaded", None, True),
+]
+
+
+def run_scenario(model, load):
+    """Stats of one fresh interpreter, or None when it fails (e.g. no model installed)"""
+    env = dict(os.environ)
+    if model is not None:
+        env["RESUME_ANALYZER_SPACY_MODEL"] = model
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(load=load)],
+        env=env, capture_output=True, text=True
+    )
+    if out.returncode:
+        error = out.stderr.strip().splitlines()
+        print(f"  failed: {error[-1] if error else f'exit status {out.returncode}'}", file=sys.stderr)
+        return None
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="auto", help="model used for the lazy scenarios")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16} {'import s':>9} {'total s':>9} {'max RSS MB':>11}")
+    for name, model, load in SCENARIOS:
+        stats = run_scenario(model or args.model, load)
+        if stats is None:
+            print(f"{name:<16} {'unavailable':>31}")
+            continue
+        print(f"{name:<16} {stats['import_s']:>9.3f} {stats['total_s']:>9.3f} {stats['max_rss_mb']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
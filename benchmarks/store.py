@@ -0,0 +1,91 @@
+"""Result store under concurrent writers, and query latency once it is full.
+
+Several processes each write --documents synthetic analyses to one SQLite
+file, in transactions of --batch rows, all at the same time. Then the
+store is queried for candidates at or above 80% on one job, and for
+documents that have a given skill.
+
+    python -m benchmarks.store [--writers 8] [--documents 5000] [--batch 100]
+"""
+import argparse
+import hashlib
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from skills import SKILL_MAP
+from store import ResultStore
+
+JOBS = [["python", "sql", "docker", "aws"], ["javascript", "react", "node.js"], ["java", "spring", "kubernetes"]]
+
+
+def synthetic_entry(rng, writer, i):
+    skills = rng.sample(list(SKILL_MAP), rng.randint(5, 20))
+    job_skills = JOBS[i % len(JOBS)]
+    matched = [skill for skill in job_skills if skill in skills]
+    key = hashlib.sha256(f"{writer}-{i}".encode()).hexdigest()
+    text = " ".join(skills) * 20
+    analysis = {
+        "text": text,
+        "entities": {"name": f"Candidate {writer}-{i}", "email": [f"c{writer}.{i}@example.com"],
+                     "phone": [], "skills": skills, "education": [], "certifications": [], "achievements": []},
+        "result": {"matched_skills": matched, "missing_skills": [s for s in job_skills if s not in matched],
+                   "score": round(100 * len(matched) / len(job_skills))},
+        "ats_warnings": ["Missing section: Summary"] if i % 3 else [],
+    }
+    return {"key": key, "analysis": analysis, "job_skills": job_skills, "file": f"{key[:8]}.pdf", "source": "bench"}
+
+
+def write(path, writer, documents, batch):
+    rng = random.Random(writer)
+    store = ResultStore(path)
+    start = time.perf_counter()
+    for offset in range(0, documents, batch):
+        store.add_many(synthetic_entry(rng, writer, i) for i in range(offset, min(documents, offset + batch)))
+    return time.perf_counter() - start
+
+
+def timed_query(function, repeat=50):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = function()
+    return (time.perf_counter() - start) / repeat, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--documents", type=int, default=5000, help="documents per writer")
+    parser.add_argument("--batch", type=int, default=100, help="documents per transaction")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.db")
+        ResultStore(path)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.writers) as pool:
+            seconds = list(pool.map(write, [path] * args.writers, range(args.writers),
+                                    [args.documents] * args.writers, [args.batch] * args.writers))
+        elapsed = time.perf_counter() - start
+
+        store = ResultStore(path)
+        total = args.writers * args.documents
+        assert len(store) == total, f"{len(store)} documents stored, expected {total}"
+        print(f"{args.writers} writers x {args.documents} documents, {args.batch} per transaction: "
+              f"{elapsed:.1f}s, {total / elapsed:,.0f} documents/s (slowest writer {max(seconds):.1f}s)")
+        print(f"database {os.path.getsize(path) / 2 ** 20:.0f} MB, all {len(store)} documents present")
+
+        latency, rows = timed_query(lambda: store.candidates(JOBS[0], min_score=80))
+        print(f"{'candidates >= 80% on a job':<30} {latency * 1000:>8.2f} ms ({rows} rows)")
+        latency, rows = timed_query(lambda: store.candidates(JOBS[0], min_score=80, limit=50))
+        print(f"{'top 50 of them':<30} {latency * 1000:>8.2f} ms")
+        latency, rows = timed_query(lambda: store.with_skills(["python", "docker"]))
+        print(f"{'documents with python+docker':<30} {latency * 1000:>8.2f} ms ({rows} rows)")
+        latency, _ = timed_query(lambda: store.get(store.candidates(JOBS[1], limit=1)[0]["key"]))
+        print(f"{'stored parse by key':<30} {latency * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Reproducible benchmark suite for the public pipeline functions.
+
+Times extract_text_from_file (per format), extract_entities, score_resume,
+check_ats_compliance and display_entities on a seeded synthetic corpus, plus
+the end-to-end pipeline at several corpus sizes. Results can be saved as
+JSON and compared with a previous run; any metric slower than the baseline
+by more than --threshold is reported as a regression (exit code 1).
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.15
+    python -m benchmarks.suite --scales 1,100,10000
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.corpus import LAYOUTS, generate_corpus, generate_resume, render
+from batch import analyze_document
+from parser import extract_entities, extract_text_from_file
+from scorer import score_resume
+from utils import check_ats_compliance, display_entities
+
+JOB_SKILLS = ["python", "machine learning", "sql", "html", "css", "javascript", "docker", "aws"]
+
+
+def measure(func, inputs, repeat):
+    """Median seconds per call of func over inputs, best of repeat rounds"""
+    rounds = []
+    for _ in range(repeat):
+        per_call = []
+        for item in inputs:
+            start = time.perf_counter()
+            func(item)
+            per_call.append(time.perf_counter() - start)
+        rounds.append(statistics.median(per_call))
+    return min(rounds)
+
+
+def run_suite(scales, repeat, samples, seed):
+    rng = random.Random(seed)
+    metrics = {}
+
+    resumes = [generate_resume(rng, layout=LAYOUTS[i % len(LAYOUTS)]) for i in range(samples)]
+    for file_format in ("pdf", "docx", "txt"):
+        documents = [render(lines, file_format, LAYOUTS[i % len(LAYOUTS)]) for i, lines in enumerate(resumes)]
+        metrics[f"extract_text_from_file[{file_format}]"] = measure(extract_text_from_file, documents, repeat)
+
+    texts = ["\n".join(lines) for lines in resumes]
+    entities = [extract_entities(text) for text in texts]
+    metrics["extract_entities"] = measure(extract_entities, texts, repeat)
+    metrics["score_resume"] = measure(
+        lambda pair: score_resume(pair[0], JOB_SKILLS, raw_text=pair[1]), list(zip(entities, texts)), repeat
+    )
+    metrics["check_ats_compliance"] = measure(check_ats_compliance, texts, repeat)
+    metrics["display_entities"] = measure(display_entities, entities, repeat)
+
+    for scale in scales:
+        corpus = [data for _, data in generate_corpus(scale, seed=seed)]
+        start = time.perf_counter()
+        for data in corpus:
+            analyze_document(data, JOB_SKILLS)
+        # Normalised per document so scales stay comparable across runs
+        metrics[f"pipeline[{scale}]"] = (time.perf_counter() - start) / scale
+    return metrics
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"python": platform.python_version(), "platform": platform.platform(), "commit": commit}
+
+
+def compare(current, baseline, threshold):
+    """Return (metric, baseline, current, ratio) for every regression"""
+    regressions = []
+    for name, seconds in current.items():
+        before = baseline.get(name)
+        if before and seconds > before * (1 + threshold):
+            regressions.append((name, before, seconds, seconds / before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,100", help="end-to-end corpus sizes, e.g. 1,100,10000")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds per function benchmark")
+    parser.add_argument("--samples", type=int, default=30, help="documents per function benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file from a previous run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    metrics = run_suite(scales, args.repeat, args.samples, args.seed)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["metrics"]
+
+    print(f"{'metric':<34} {'ms':>10} {'baseline':>10} {'change':>8}")
+    for name, seconds in metrics.items():
+        line = f"{name:<34} {seconds * 1000:>10.3f}"
+        if name in baseline:
+            line += f" {baseline[name] * 1000:>10.3f} {seconds / baseline[name] - 1:>+8.1%}"
+        print(line)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({"environment": environment(), "seed": args.seed, "metrics": metrics}, f, indent=2)
+        print(f"Saved results to {args.save}")
+
+    regressions = compare(metrics, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({ratio:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
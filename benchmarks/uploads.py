@@ -0,0 +1,61 @@
+"""Multi-file upload: serial analysis versus the app's bounded worker pool.
+
+Analyzes --files synthetic PDF/DOCX resumes of mixed length the way the
+app does for a multi-file upload, first serially and then on a process
+pool, and compares the pool's wall time with the ideal
+max(slowest file, total work / workers).
+
+    python -m benchmarks.uploads [--files 50] [--workers 4]
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import analyze_uploads
+from benchmarks.corpus import generate_resume, render
+
+JOB_SKILLS = ["python", "machine learning", "sql", "html", "css", "javascript"]
+
+
+def make_uploads(count, rng):
+    uploads = []
+    for i in range(count):
+        file_format = ("pdf", "docx")[i % 2]
+        lines = generate_resume(rng, words=rng.choice([300, 600, 1200, 2400]))
+        uploads.append((f"resume_{i:03d}.{file_format}", render(lines, file_format)))
+    return uploads
+
+
+def run(uploads, executor=None):
+    start = time.perf_counter()
+    rows = [row for _, row in analyze_uploads(uploads, JOB_SKILLS, executor)]
+    return time.perf_counter() - start, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    uploads = make_uploads(args.files, random.Random(0))
+    serial, rows = run(uploads)
+    per_file = [row["Seconds"] for row in rows]
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Warm the workers up so process start-up is not billed to the upload
+        list(pool.map(abs, range(args.workers)))
+        parallel, rows = run(uploads, pool)
+
+    ideal = max(max(per_file), sum(per_file) / args.workers)
+    failed = sum(bool(row["Error"]) for row in rows)
+    print(f"{args.files} files, {args.workers} workers, {failed} failed")
+    print(f"{'slowest file':<22} {max(per_file):>8.2f} s")
+    print(f"{'serial (sum of files)':<22} {serial:>8.2f} s")
+    print(f"{'worker pool':<22} {parallel:>8.2f} s ({serial / parallel:.1f}x)")
+    print(f"{'ideal':<22} {ideal:>8.2f} s (pool is {parallel / ideal:.2f}x the ideal)")
+
+
+if __name__ == "__main__":
+    main()
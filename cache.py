@@ -0,0 +1,123 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import config
+
+# Bump whenever extraction changes what a parse contains (text layout, entity
+# rules), so the disk cache never serves parses made by older code
+PARSE_VERSION = 2
+
+
+def content_hash(data):
+    """SHA-256 hex digest of raw document bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """Content-addressed cache of extracted text and entities.
+
+    Entries live in an in-process LRU bounded by ``max_entries`` and, when
+    ``disk_dir`` is set, are also persisted as JSON so they survive restarts
+    and can be shared between processes. Disk entries sit under a
+    ``v<PARSE_VERSION>`` subdirectory; entries of older versions are ignored.
+    """
+
+    def __init__(self, max_entries=128, disk_dir=None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"v{PARSE_VERSION}", key[:2], key + ".json")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, value):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """Return a copy of the cached value for key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(value)
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, value)
+        return copy.deepcopy(value)
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, copy.deepcopy(value))
+        self._write_disk(key, value)
+
+    def get_or_parse(self, data, parse):
+        """Return the cached parse of data, calling parse(data) on a miss"""
+        key = content_hash(data)
+        value = self.get(key)
+        if value is None:
+            value = parse(data)
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_dir": self.disk_dir
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_default_cache = None
+
+
+def get_parse_cache():
+    """Process-wide cache shared by every Streamlit session and rerun"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache(config.CACHE_MAX_ENTRIES, config.CACHE_DIR)
+    return _default_cache
@@ -0,0 +1,85 @@
+"""Runtime settings, overridable through environment variables."""
+import os
+import tempfile
+
+
+def _env_list(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return list(default)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# spaCy model to load on first use: "auto" tries en_core_web_md then
+# en_core_web_sm, a package name loads that model, "none" disables NLP.
+SPACY_MODEL = os.environ.get("RESUME_ANALYZER_SPACY_MODEL", "auto").strip()
+
+# Pipeline components that are never needed and are skipped when loading.
+SPACY_EXCLUDE = _env_list(
+    "RESUME_ANALYZER_SPACY_EXCLUDE",
+    ["parser", "lemmatizer", "tagger", "attribute_ruler", "senter"]
+)
+
+# Parse cache: entries kept in memory, and an optional directory that
+# persists extracted text and entities across restarts.
+CACHE_MAX_ENTRIES = int(os.environ.get("RESUME_ANALYZER_CACHE_MAX_ENTRIES", "128"))
+CACHE_DIR = os.environ.get("RESUME_ANALYZER_CACHE_DIR") or None
+
+# Extraction limits that bound worst-case latency per document; 0 disables.
+# Pages past PDF_MAX_PAGES or beyond the time budget (seconds, checked
+# between pages) are dropped; documents over MAX_DOCUMENT_BYTES are rejected.
+PDF_MAX_PAGES = int(os.environ.get("RESUME_ANALYZER_PDF_MAX_PAGES", "30"))
+PDF_TIME_BUDGET = float(os.environ.get("RESUME_ANALYZER_PDF_TIME_BUDGET", "15"))
+MAX_DOCUMENT_BYTES = int(os.environ.get("RESUME_ANALYZER_MAX_DOCUMENT_BYTES", str(20 * 1024 * 1024)))
+
+# HTTP service: worker processes, documents allowed in flight before new
+# requests get 429, and the per-document timeout in seconds.
+SERVICE_WORKERS = int(os.environ.get("RESUME_ANALYZER_SERVICE_WORKERS", str(os.cpu_count() or 1)))
+SERVICE_MAX_PENDING = int(os.environ.get("RESUME_ANALYZER_SERVICE_MAX_PENDING", str(SERVICE_WORKERS * 4)))
+SERVICE_TIMEOUT = float(os.environ.get("RESUME_ANALYZER_SERVICE_TIMEOUT", "30"))
+
+# Worker processes for multi-file uploads in the app, shared by all sessions.
+UPLOAD_WORKERS = int(os.environ.get("RESUME_ANALYZER_UPLOAD_WORKERS", str(os.cpu_count() or 1)))
+
+# JSON file with the ATS compliance rules (defaults to ats_rules.json).
+ATS_RULES_PATH = os.environ.get("RESUME_ANALYZER_ATS_RULES") or None
+
+# Outgoing mail: SMTP server (point it at a local debugging server in
+# development), whether to upgrade with STARTTLS, connections kept open by
+# the background queue, and retries with exponential backoff (seconds).
+SMTP_HOST = os.environ.get("RESUME_ANALYZER_SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.environ.get("RESUME_ANALYZER_SMTP_PORT", "587"))
+SMTP_STARTTLS = os.environ.get("RESUME_ANALYZER_SMTP_STARTTLS", "1").strip().lower() not in ("0", "false", "no")
+MAIL_WORKERS = int(os.environ.get("RESUME_ANALYZER_MAIL_WORKERS", "1"))
+MAIL_MAX_RETRIES = int(os.environ.get("RESUME_ANALYZER_MAIL_MAX_RETRIES", "3"))
+MAIL_BACKOFF = float(os.environ.get("RESUME_ANALYZER_MAIL_BACKOFF", "1"))
+
+# UI assets: the landing animation URL, where fetched copies are cached,
+# how long a cached copy stays fresh (seconds) and the fetch timeout.
+LOTTIE_URL = os.environ.get(
+    "RESUME_ANALYZER_LOTTIE_URL",
+    "https://lottie.host/804a3a69-2be3-4ff9-8265-8f67c182ae4a/2a1X9H6Y0Y.json"
+)
+ASSET_CACHE_DIR = os.environ.get("RESUME_ANALYZER_ASSET_CACHE_DIR") or \
+    os.path.join(tempfile.gettempdir(), "resume_analyzer_assets")
+ASSET_TTL = float(os.environ.get("RESUME_ANALYZER_ASSET_TTL", str(24 * 3600)))
+ASSET_TIMEOUT = float(os.environ.get("RESUME_ANALYZER_ASSET_TIMEOUT", "5"))
+
+# Duplicate detection: directory persisting the fingerprint index (unset
+# keeps it in memory), the MinHash similarity that counts as a near
+# duplicate, and whether a near duplicate reuses the earlier parse.
+DEDUP_DIR = os.environ.get("RESUME_ANALYZER_DEDUP_DIR") or None
+DEDUP_THRESHOLD = float(os.environ.get("RESUME_ANALYZER_DEDUP_THRESHOLD", "0.8"))
+DEDUP_REUSE = os.environ.get("RESUME_ANALYZER_DEDUP_REUSE", "0").strip().lower() not in ("0", "false", "no")
+
+# Semantic skill matching with the spaCy model's word vectors (off by
+# default): the cosine similarity that counts as a match, and where the
+# embedded skill taxonomy is cached between restarts.
+SEMANTIC_MATCHING = os.environ.get("RESUME_ANALYZER_SEMANTIC_MATCHING", "0").strip().lower() not in ("0", "false", "no")
+SEMANTIC_THRESHOLD = float(os.environ.get("RESUME_ANALYZER_SEMANTIC_THRESHOLD", "0.75"))
+SEMANTIC_CACHE_DIR = os.environ.get("RESUME_ANALYZER_SEMANTIC_CACHE_DIR") or \
+    os.path.join(tempfile.gettempdir(), "resume_analyzer_semantic")
+
+# SQLite result store shared by the app and batch runs. Off unless a path is
+# set, since it keeps every candidate's resume text and contact details.
+STORE_PATH = os.environ.get("RESUME_ANALYZER_STORE", "").strip()
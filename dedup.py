@@ -0,0 +1,300 @@
+"""Exact and near-duplicate detection for ingested resumes.
+
+Every document gets a fingerprint made of three parts:
+
+    content hash   SHA-256 of the raw bytes (the ParseCache key)
+    text hash      SHA-256 of the normalized text, equal across re-exports
+    signature      a MinHash of its word 3-shingles
+
+``DuplicateIndex`` answers "have we seen this resume, or a lightly edited
+copy of it?" The two hashes are dict lookups. Signatures are split into
+bands for LSH, and a document becomes a candidate when any band matches.
+Candidates are confirmed by their estimated Jaccard similarity. Bands of
+documents loaded from disk are kept as sorted NumPy arrays and searched
+with ``searchsorted``; documents added since loading sit in dicts. A query
+is a few dozen array probes however large the corpus is.
+
+On disk the index is a directory of three files: ``meta.json``, the
+appended ``signatures.bin`` rows and ``docs.jsonl``. The signatures are
+memory-mapped when loaded. Only one process should write to an index at a
+time.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+
+import numpy as np
+
+import config
+from cache import content_hash
+
+WORD_RE = re.compile(r'\w+')
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+SEED = 20240601
+
+META = "meta.json"
+SIGNATURES = "signatures.bin"
+DOCS = "docs.jsonl"
+
+
+def normalize_tokens(text):
+    return WORD_RE.findall(text.lower())
+
+
+class Fingerprint:
+    __slots__ = ("content_hash", "text_hash", "signature")
+
+    def __init__(self, content_hash, text_hash, signature):
+        self.content_hash = content_hash
+        self.text_hash = text_hash
+        self.signature = signature
+
+
+class Match:
+    """An earlier document a new one duplicates"""
+
+    __slots__ = ("kind", "doc_id", "similarity", "key", "label")
+
+    def __init__(self, kind, doc_id, similarity, key, label):
+        self.kind = kind
+        self.doc_id = doc_id
+        self.similarity = similarity
+        self.key = key
+        self.label = label
+
+    def as_dict(self):
+        return {"kind": self.kind, "similarity": round(self.similarity, 3), "key": self.key, "label": self.label}
+
+
+class MinHasher:
+    """Multiply-shift MinHash over word shingles, reproducible across processes"""
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, seed=SEED):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=(num_perm, 1), dtype=np.uint64)
+        self._shingle_mix = rng.integers(1, 2 ** 63, size=SHINGLE_SIZE, dtype=np.uint64) | np.uint64(1)
+        self._band_mix = rng.integers(1, 2 ** 63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+
+    def signature(self, tokens):
+        """uint32 MinHash signature of the token shingles, or None for empty text"""
+        if not tokens:
+            return None
+        ids = np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens),
+                          dtype=np.uint64, count=len(tokens))
+        size = min(SHINGLE_SIZE, len(ids))
+        shingles = np.zeros(len(ids) - size + 1, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            for offset in range(size):
+                shingles += ids[offset:offset + len(shingles)] * self._shingle_mix[offset]
+            hashed = (self._a * np.unique(shingles) + self._b) >> np.uint64(32)
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signatures):
+        """One uint64 key per band for each row of signatures"""
+        signatures = np.atleast_2d(signatures).astype(np.uint64)
+        grouped = signatures.reshape(len(signatures), self.bands, self.rows)
+        with np.errstate(over='ignore'):
+            return (grouped * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+
+_default_hasher = None
+
+
+def get_hasher():
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = MinHasher()
+    return _default_hasher
+
+
+def fingerprint(data, text, hasher=None):
+    """Fingerprint a document from its raw bytes and extracted text"""
+    tokens = normalize_tokens(text)
+    text_hash = hashlib.sha256(" ".join(tokens).encode('utf-8')).hexdigest()
+    return Fingerprint(content_hash(data), text_hash, (hasher or get_hasher()).signature(tokens))
+
+
+class DuplicateIndex:
+    """Persistent exact and MinHash-LSH index of previously seen documents"""
+
+    def __init__(self, directory=None, threshold=None, hasher=None):
+        self.directory = directory
+        self.threshold = config.DEDUP_THRESHOLD if threshold is None else threshold
+        self.hasher = hasher or get_hasher()
+        self._lock = threading.Lock()
+
+        self._docs = []
+        self._by_content = {}
+        self._by_text = {}
+        self._base_signatures = np.empty((0, self.hasher.num_perm), dtype=np.uint32)
+        self._base_keys = np.empty((self.hasher.bands, 0), dtype=np.uint64)
+        self._base_ids = np.empty((self.hasher.bands, 0), dtype=np.int64)
+        self._recent_signatures = {}
+        self._recent_buckets = [{} for _ in range(self.hasher.bands)]
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _meta(self):
+        return {"num_perm": self.hasher.num_perm, "bands": self.hasher.bands, "shingle_size": SHINGLE_SIZE}
+
+    def _load(self):
+        meta_path = os.path.join(self.directory, META)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta != self._meta():
+                raise RuntimeError(f"Duplicate index at {self.directory} was built with {meta}, not {self._meta()}")
+        else:
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(self._meta(), f)
+
+        docs_path = os.path.join(self.directory, DOCS)
+        if os.path.exists(docs_path):
+            with open(docs_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # A torn last line from an interrupted write is dropped
+                    try:
+                        self._docs.append(json.loads(line))
+                    except ValueError:
+                        break
+
+        signatures_path = os.path.join(self.directory, SIGNATURES)
+        row_bytes = self.hasher.num_perm * 4
+        rows = os.path.getsize(signatures_path) // row_bytes if os.path.exists(signatures_path) else 0
+        count = min(rows, len(self._docs))
+        del self._docs[count:]
+        self._repair(docs_path, signatures_path, count * row_bytes)
+        if count:
+            self._base_signatures = np.memmap(signatures_path, dtype=np.uint32, mode='r',
+                                              shape=(count, self.hasher.num_perm))
+
+        for doc_id, doc in enumerate(self._docs):
+            self._by_content.setdefault(doc["key"], doc_id)
+            self._by_text.setdefault(doc["text_hash"], doc_id)
+
+        has_signature = np.fromiter((doc["signed"] for doc in self._docs), dtype=bool, count=count)
+        ids = np.flatnonzero(has_signature)
+        keys = self.hasher.band_keys(self._base_signatures[ids]).T if len(ids) else \
+            np.empty((self.hasher.bands, 0), dtype=np.uint64)
+        order = np.argsort(keys, axis=1, kind='stable')
+        self._base_keys = np.take_along_axis(keys, order, axis=1)
+        self._base_ids = ids[order]
+
+    def _repair(self, docs_path, signatures_path, signature_bytes):
+        """Trim both files back to the records they have in common"""
+        if os.path.exists(signatures_path) and os.path.getsize(signatures_path) != signature_bytes:
+            with open(signatures_path, 'r+b') as f:
+                f.truncate(signature_bytes)
+        if os.path.exists(docs_path):
+            with open(docs_path, 'rb') as f:
+                lines = f.read().split(b"\n")
+            if len(lines) - 1 != len(self._docs) or lines[-1]:
+                with open(docs_path, 'wb') as f:
+                    f.write(b"".join(line + b"\n" for line in lines[:len(self._docs)]))
+
+    def _signature(self, doc_id):
+        if doc_id < len(self._base_signatures):
+            return self._base_signatures[doc_id]
+        return self._recent_signatures[doc_id]
+
+    def query(self, fp):
+        """The best earlier match for a fingerprint, or None"""
+        with self._lock:
+            return self._query(fp)
+
+    def _query(self, fp):
+        doc_id = self._by_content.get(fp.content_hash)
+        if doc_id is not None:
+            return self._match("exact", doc_id, 1.0)
+        doc_id = self._by_text.get(fp.text_hash)
+        if doc_id is not None:
+            return self._match("text", doc_id, 1.0)
+        if fp.signature is None:
+            return None
+
+        keys = self.hasher.band_keys(fp.signature)[0]
+        candidates = set()
+        for band, key in enumerate(keys):
+            band_keys = self._base_keys[band]
+            start = np.searchsorted(band_keys, key, side='left')
+            end = np.searchsorted(band_keys, key, side='right')
+            if end > start:
+                candidates.update(self._base_ids[band, start:end].tolist())
+            candidates.update(self._recent_buckets[band].get(int(key), ()))
+        best_id, best = None, 0.0
+        for candidate in candidates:
+            similarity = float(np.count_nonzero(self._signature(candidate) == fp.signature)) / self.hasher.num_perm
+            if similarity > best:
+                best_id, best = candidate, similarity
+        if best_id is None or best < self.threshold:
+            return None
+        return self._match("near", best_id, best)
+
+    def _match(self, kind, doc_id, similarity):
+        doc = self._docs[doc_id]
+        return Match(kind, doc_id, similarity, doc["key"], doc.get("label"))
+
+    def add(self, fp, label=None):
+        """Record a fingerprint; returns its document id"""
+        with self._lock:
+            return self._add(fp, label)
+
+    def _add(self, fp, label):
+        doc_id = len(self._docs)
+        doc = {"key": fp.content_hash, "text_hash": fp.text_hash, "label": label,
+               "signed": fp.signature is not None}
+        signature = fp.signature if fp.signature is not None else \
+            np.zeros(self.hasher.num_perm, dtype=np.uint32)
+        if self.directory:
+            # Signature first: on load, a doc line without its signature is dropped
+            with open(os.path.join(self.directory, SIGNATURES), 'ab') as f:
+                f.write(signature.astype(np.uint32).tobytes())
+            with open(os.path.join(self.directory, DOCS), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        self._docs.append(doc)
+        self._by_content.setdefault(fp.content_hash, doc_id)
+        self._by_text.setdefault(fp.text_hash, doc_id)
+        if fp.signature is not None:
+            self._recent_signatures[doc_id] = signature
+            for band, key in enumerate(self.hasher.band_keys(signature)[0]):
+                self._recent_buckets[band].setdefault(int(key), []).append(doc_id)
+        return doc_id
+
+    def check(self, fp, label=None):
+        """Query and then add a document unless it is a byte-identical repeat.
+
+        Both happen under one lock, so two near-identical documents checked
+        at the same time cannot both miss each other.
+        """
+        with self._lock:
+            match = self._query(fp)
+            if match is None or match.kind != "exact":
+                self._add(fp, label)
+            return match
+
+
+_default_index = None
+
+
+def get_duplicate_index():
+    """Process-wide index, persisted under RESUME_ANALYZER_DEDUP_DIR when set"""
+    global _default_index
+    if _default_index is None:
+        _default_index = DuplicateIndex(config.DEDUP_DIR)
+    return _default_index
@@ -0,0 +1,140 @@
+"""Streaming DOCX text extraction straight from the zip container.
+
+The XML parts are fed in small chunks to expat, a push parser, so memory
+stays flat however large the document is. No element tree or python-docx
+object model is built. Text comes out one paragraph per line, body first:
+
+    body      word/document.xml, including table cells and text boxes
+    headers   word/header*.xml, skipped when blank
+    footers   word/footer*.xml, skipped when blank
+
+Page headers come after the body because the first line of the text is
+taken as the candidate's name, and a header such as "Curriculum Vitae" or
+"CONFIDENTIAL" must not be.
+
+Within a paragraph, w:t text is kept, tabs become tabs and line breaks
+become newlines, as in python-docx's ``Paragraph.text``. A document
+made only of body paragraphs therefore gives the same text as joining
+``Document.paragraphs``. Text boxes are stored twice, once as DrawingML
+and once as a VML fallback, so ``mc:Fallback`` content is skipped.
+"""
+import re
+import zipfile
+from xml.parsers import expat
+
+WORD_NAMESPACES = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main",
+)
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+BODY_PART = "word/document.xml"
+HEADER_PART = re.compile(r"word/header(\d*)\.xml$")
+FOOTER_PART = re.compile(r"word/footer(\d*)\.xml$")
+
+CHUNK_SIZE = 64 * 1024
+
+_RUN_BREAKS = {"tab": "\t", "ptab": "\t", "br": "\n", "cr": "\n", "noBreakHyphen": "-"}
+
+
+class _ParagraphCollector:
+    """expat handlers that turn WordprocessingML into finished paragraphs"""
+
+    def __init__(self):
+        self.paragraphs = []
+        # Text boxes put whole paragraphs inside a paragraph, hence a stack
+        self._open = []
+        self._run_depth = 0
+        self._in_text = False
+        self._skip_depth = 0
+
+    def start(self, name, attrs):
+        uri, _, local = name.rpartition(" ")
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+        if uri == MC_NAMESPACE and local == "Fallback":
+            self._skip_depth = 1
+            return
+        if uri not in WORD_NAMESPACES or not self._open and local != "p":
+            return
+        if local == "p":
+            self._open.append([])
+        elif local == "r":
+            self._run_depth += 1
+        elif self._run_depth:
+            if local == "t":
+                self._in_text = True
+            elif local in _RUN_BREAKS:
+                # Page and column breaks carry no text
+                if local != "br" or attrs.get(f"{uri} type", "textWrapping") == "textWrapping":
+                    self._open[-1].append(_RUN_BREAKS[local])
+
+    def end(self, name):
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        uri, _, local = name.rpartition(" ")
+        if uri not in WORD_NAMESPACES or not self._open:
+            return
+        if local == "p":
+            self.paragraphs.append("".join(self._open.pop()))
+        elif local == "r":
+            self._run_depth -= 1
+        elif local == "t":
+            self._in_text = False
+
+    def text(self, data):
+        if self._in_text and not self._skip_depth:
+            self._open[-1].append(data)
+
+
+def iter_part_paragraphs(archive, name):
+    """Yield lists of paragraphs from one XML part as it is parsed"""
+    collector = _ParagraphCollector()
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parser.StartElementHandler = collector.start
+    parser.EndElementHandler = collector.end
+    parser.CharacterDataHandler = collector.text
+    with archive.open(name) as part:
+        while True:
+            chunk = part.read(CHUNK_SIZE)
+            parser.Parse(chunk, not chunk)
+            if collector.paragraphs:
+                yield collector.paragraphs
+                collector.paragraphs = []
+            if not chunk:
+                return
+
+
+def _numbered(names, pattern):
+    found = [(pattern.match(name), name) for name in names]
+    return [name for match, name in sorted(
+        ((match, name) for match, name in found if match), key=lambda item: int(item[0].group(1) or 0)
+    )]
+
+
+def _edge_text(archive, name):
+    """Text of a header or footer part without its blank leading/trailing lines"""
+    lines = [line for paragraphs in iter_part_paragraphs(archive, name) for line in paragraphs]
+    return "\n".join(lines).strip("\n")
+
+
+def iter_docx_text(stream):
+    """Yield the text of a DOCX in chunks that concatenate to the full text"""
+    with zipfile.ZipFile(stream) as archive:
+        names = archive.namelist()
+        if BODY_PART not in names:
+            raise ValueError("not a Word document: word/document.xml is missing")
+
+        first = True
+        for paragraphs in iter_part_paragraphs(archive, BODY_PART):
+            chunk = "\n".join(paragraphs)
+            yield chunk if first else "\n" + chunk
+            first = False
+        for name in _numbered(names, HEADER_PART) + _numbered(names, FOOTER_PART):
+            text = _edge_text(archive, name)
+            if text.strip():
+                yield text if first else "\n" + text
+                first = False
@@ -0,0 +1,179 @@
+"""Incremental ingestion of a folder of resumes that keeps growing.
+
+Every file the ingester has seen is recorded in the result store's
+manifest with its size, modification time, content hash and how long its
+analysis took. A run compares the folder with the manifest:
+
+    unchanged file, already scored for the job   skipped, not even opened
+    unchanged file, new job skill list            re-scored from stored entities
+    new or modified file                          analyzed on the process pool
+                                                  (known content is still only re-scored)
+    file gone from the folder                     dropped from the manifest
+
+A file that failed is retried only once it changes, or with retry_failed.
+Results and their manifest rows are committed together, every flush_every
+files. A run that is killed therefore loses at most one uncommitted batch,
+and the next run picks up where it stopped.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+
+from batch import analyze_document, analyze_file, find_resumes, report_row
+from reports import ReportSink
+
+
+def scan(directory):
+    """(path, size, mtime_ns) of every resume under directory, with absolute paths"""
+    files = []
+    for path in find_resumes(os.path.abspath(directory)):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue  # removed while scanning
+        files.append((path, stat.st_size, stat.st_mtime_ns))
+    return files
+
+
+def plan(files, manifest, scored, retry_failed=False):
+    """Split scanned files into skip, rescore and analyze lists, plus paths no longer present"""
+    skip, rescore, analyze = [], [], []
+    for path, size, mtime_ns in files:
+        entry = manifest.get(path)
+        if entry is None or entry["size"] != size or entry["mtime_ns"] != mtime_ns:
+            analyze.append((path, size, mtime_ns))
+        elif entry["error"]:
+            (analyze if retry_failed else skip).append((path, size, mtime_ns))
+        elif entry["key"] in scored:
+            skip.append((path, size, mtime_ns))
+        else:
+            rescore.append((path, size, mtime_ns))
+    present = {path for path, _, _ in files}
+    removed = [path for path in manifest if path not in present]
+    return skip, rescore, analyze, removed
+
+
+class _Batch:
+    """Results waiting to be committed to the store and then appended to the report"""
+
+    def __init__(self, store, writer, flush_every):
+        self.store = store
+        self.writer = writer
+        self.flush_every = flush_every
+        self.entries = []
+        self.failures = []
+        self.rows = []
+
+    def add(self, row, entry=None, failure=None):
+        if entry is not None:
+            self.entries.append(entry)
+        if failure is not None:
+            self.failures.append(failure)
+        self.rows.append(row)
+        if len(self.rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        # Store first: a row reaches the report only once its file will be skipped next run
+        self.store.add_many(self.entries)
+        self.store.update_manifest(self.failures)
+        if self.writer is not None:
+            self.writer.write_many(self.rows)
+            self.writer.flush()
+        self.entries, self.failures, self.rows = [], [], []
+
+
+def run_ingest(directory, job_skills, store, workers=None, output_path=None, job=None,
+               retry_failed=False, flush_every=50, on_result=None):
+    """Bring the store up to date with directory for a job skill list.
+
+    Rows for re-scored and analyzed files are passed to on_result and, when
+    output_path is given, appended to that report. Returns a summary dict with
+    skipped/rescored/processed/failed/removed counts, elapsed time, and the
+    estimated seconds saved: the recorded analysis time of every file that
+    was not parsed again, minus the time re-scoring took. Content that was
+    never timed by an ingest run (e.g. it was stored by a batch run) is left
+    out of the estimate and counted as "untimed".
+    """
+    start = time.perf_counter()
+    manifest = store.manifest(directory)
+    files = scan(directory)
+    skip, rescore, analyze, removed = plan(files, manifest, store.scored(job_skills), retry_failed)
+    store.update_manifest([], removed=removed)
+    counts = {"skipped": len(skip), "rescored": 0, "processed": 0, "failed": 0, "untimed": 0}
+    # A file whose content was first analyzed under another path has no time of its own
+    known = store.analysis_seconds()
+
+    def original_seconds(path, key):
+        seconds = manifest[path]["seconds"] if path in manifest else None
+        if seconds is None:
+            seconds = known.get(key)
+        if seconds is None:
+            counts["untimed"] += 1
+        return seconds
+
+    saved = 0.0
+    for path, _, _ in skip:
+        if manifest[path]["key"]:
+            saved += original_seconds(path, manifest[path]["key"]) or 0
+
+    with (ReportSink(output_path, batch_size=flush_every) if output_path else nullcontext()) as writer:
+        batch = _Batch(store, writer, flush_every)
+
+        def finish(outcome, row, entry=None, failure=None):
+            counts[outcome] += 1
+            batch.add(row, entry, failure)
+            if on_result:
+                on_result(row)
+
+        try:
+            for path, size, mtime_ns in rescore:
+                parsed = store.get(manifest[path]["key"])
+                if parsed is None:
+                    # The stored parse is gone; analyze the file like a new one
+                    analyze.append((path, size, mtime_ns))
+                    continue
+                began = time.perf_counter()
+                analysis = analyze_document(path, job_skills, parsed)
+                seconds = time.perf_counter() - began
+                original = original_seconds(path, manifest[path]["key"])
+                if original is not None:
+                    saved += original - seconds
+                row = {"File": path, "Error": "", "Seconds": round(seconds, 4), **report_row(analysis)}
+                finish("rescored", row, {"key": manifest[path]["key"], "analysis": analysis,
+                                         "job_skills": job_skills, "file": path, "job": job, "source": "ingest",
+                                         "manifest": {"path": path, "size": size, "mtime_ns": mtime_ns,
+                                                      "seconds": original}})
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(analyze_file, stat[0], job_skills, False, False, store.path): stat
+                           for stat in analyze}
+                for future in as_completed(futures):
+                    path, size, mtime_ns = futures[future]
+                    row = future.result()
+                    entry = row.pop("Stored", None)
+                    if entry is None:
+                        finish("failed", row, failure={"path": path, "size": size, "mtime_ns": mtime_ns,
+                                                       "error": row["Error"]})
+                        continue
+                    # The stat was taken before the worker read the file, so a file
+                    # modified meanwhile no longer matches and is analyzed again next run.
+                    # Content stored under another path or an older mtime was only re-scored,
+                    # and keeps the time its original analysis took.
+                    reused = row.pop("Reused")
+                    seconds = row["Seconds"]
+                    if reused:
+                        seconds = original_seconds(path, entry["key"])
+                        if seconds is not None:
+                            saved += seconds - row["Seconds"]
+                    entry.update(job=job, source="ingest",
+                                 manifest={"path": path, "size": size, "mtime_ns": mtime_ns, "seconds": seconds})
+                    finish("rescored" if reused else "processed", row, entry)
+        finally:
+            # Keep finished work when interrupted; the rest is redone next run
+            batch.flush()
+
+    elapsed = time.perf_counter() - start
+    return dict(counts, total=len(files), removed=len(removed),
+                seconds=round(elapsed, 3), saved_seconds=round(max(saved, 0.0), 3))
@@ -0,0 +1,170 @@
+"""Background delivery of report emails over pooled SMTP connections.
+
+``MailQueue.submit`` returns a Future immediately; worker threads drain the
+queue, each keeping one authenticated connection open across messages. A
+connection is closed after ``idle_timeout`` seconds without mail or after
+``max_per_connection`` messages, and reopened on demand. Transient failures
+(network errors, 4xx replies) are retried with exponential backoff;
+permanent 5xx rejections fail the message straight away, and every message
+that finally fails is logged, whether or not its Future is ever read.
+"""
+import logging
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import config
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+def build_message(sender, to_email, subject, body):
+    msg = MIMEMultipart()
+    msg["From"] = sender
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.attach(MIMEText(body, "plain"))
+    return msg
+
+
+def is_transient(error):
+    """Whether an SMTP failure is worth retrying"""
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code < 500 for code, _ in error.recipients.values())
+    return isinstance(error, (smtplib.SMTPException, OSError))
+
+
+def open_connection(host, port, username=None, password=None, starttls=True, timeout=30):
+    """Connect, upgrade to TLS and log in; the per-message cost pooling avoids"""
+    server = smtplib.SMTP(host, port, timeout=timeout)
+    try:
+        if starttls:
+            server.starttls()
+        if username:
+            server.login(username, password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+class MailQueue:
+    """Queue of outgoing messages served by long-lived SMTP connections"""
+
+    def __init__(self, host=None, port=None, username=None, password=None, starttls=None,
+                 workers=None, max_retries=None, backoff=None, idle_timeout=30,
+                 max_per_connection=100, timeout=30):
+        self.host = host or config.SMTP_HOST
+        self.port = port or config.SMTP_PORT
+        self.username = username
+        self.password = password
+        self.starttls = config.SMTP_STARTTLS if starttls is None else starttls
+        self.max_retries = config.MAIL_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = config.MAIL_BACKOFF if backoff is None else backoff
+        self.idle_timeout = idle_timeout
+        self.max_per_connection = max_per_connection
+        self.timeout = timeout
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._counts = {"sent": 0, "failed": 0, "retries": 0, "connections": 0}
+        self._threads = [
+            threading.Thread(target=self._run, name=f"mail-worker-{i}", daemon=True)
+            for i in range(workers or config.MAIL_WORKERS)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, to_email, subject, body, sender=None):
+        """Queue a plain-text message; the Future resolves once it is accepted by the server"""
+        msg = build_message(sender or self.username or "", to_email, subject, body)
+        return self.submit_message(msg)
+
+    def submit_message(self, msg):
+        future = Future()
+        self._queue.put((msg, future))
+        return future
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts, pending=self.pending())
+
+    def close(self, wait=True):
+        """Stop the workers after the queued messages have been attempted"""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def _connect(self):
+        server = open_connection(self.host, self.port, self.username, self.password,
+                                 self.starttls, self.timeout)
+        self._count("connections")
+        return server
+
+    def _run(self):
+        server = None
+        sent_on_connection = 0
+        while True:
+            try:
+                item = self._queue.get(timeout=self.idle_timeout if server else None)
+            except queue.Empty:
+                server = _quit(server)
+                continue
+            if item is _STOP:
+                _quit(server)
+                return
+
+            msg, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            attempt = 0
+            while True:
+                try:
+                    if sent_on_connection >= self.max_per_connection:
+                        server = _quit(server)
+                    if server is None:
+                        server = self._connect()
+                        sent_on_connection = 0
+                    server.send_message(msg)
+                    sent_on_connection += 1
+                    self._count("sent")
+                    future.set_result(True)
+                    break
+                except Exception as e:
+                    # The connection state is unknown after any failure
+                    server = _quit(server)
+                    if attempt >= self.max_retries or not is_transient(e):
+                        self._count("failed")
+                        logger.error("Mail to %s failed, giving up after attempt %d: %s", msg["To"], attempt + 1, e)
+                        future.set_exception(e)
+                        break
+                    self._count("retries")
+                    time.sleep(self.backoff * (2 ** attempt))
+                    attempt += 1
+
+
+def _quit(server):
+    """Close a connection politely if it is still alive; always returns None"""
+    if server is not None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    return None
@@ -1,37 +1,177 @@
+import io
 import re
-import spacy
-from pdfminer.high_level import extract_text
-from docx import Document
-from spacy.util import is_package
+import time
+from functools import lru_cache
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+import config
+from docx_text import iter_docx_text
+from profiling import stage, timed
+from sections import segment
+from skills import SKILL_MATCHER
+
+def load_spacy_model(model="auto", exclude=()):
+    # spaCy is heavy to import, so it is only pulled in when a model is requested
+    import spacy
+    from spacy.util import is_package
 
-def load_spacy_model():
     try:
+        if model != "auto":
+            return spacy.load(model, exclude=list(exclude))
         if is_package("en_core_web_md"):
-            return spacy.load("en_core_web_md")
+            return spacy.load("en_core_web_md", exclude=list(exclude))
         elif is_package("en_core_web_sm"):
             print("Using small spaCy model. For better results: python -m spacy download en_core_web_md")
-            return spacy.load("en_core_web_sm")
+            return spacy.load("en_core_web_sm", exclude=list(exclude))
         else:
             raise ImportError("No spaCy model found. Install with: python -m spacy download en_core_web_sm")
     except Exception as e:
         raise RuntimeError(f"spaCy model loading failed: {str(e)}")
 
-nlp = load_spacy_model()
+@lru_cache(maxsize=None)
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use.
+
+    Returns None when NLP is disabled with RESUME_ANALYZER_SPACY_MODEL=none.
+    """
+    if config.SPACY_MODEL.lower() in ("", "none", "off"):
+        return None
+    return load_spacy_model(config.SPACY_MODEL, config.SPACY_EXCLUDE)
+
+PDF_MAGIC = b'%PDF-'
+ZIP_MAGIC = b'PK\x03\x04'
+
+def detect_format(header):
+    """Identify a document from its leading bytes: 'pdf', 'docx' or 'text'"""
+    # The PDF spec tolerates junk before the header within the first 1024 bytes
+    if PDF_MAGIC in header[:1024]:
+        return 'pdf'
+    if header.startswith(ZIP_MAGIC):
+        return 'docx'
+    return 'text'
+
+def _limit(value, default):
+    """None falls back to the configured default; 0 means unlimited"""
+    return default if value is None else value
+
+def iter_pdf_pages(stream, max_pages=0, time_budget=0):
+    """Yield the text of a PDF one page at a time.
 
-def extract_text_from_file(file_path):
+    Produces exactly what pdfminer's extract_text would, split per page, and
+    stops early after max_pages pages or once time_budget seconds have been
+    spent. The budget is checked between pages.
+    """
+    deadline = time.monotonic() + time_budget if time_budget else None
+    rsrcmgr = PDFResourceManager(caching=True)
+    output = io.StringIO()
+    device = TextConverter(rsrcmgr, output, laparams=LAParams())
     try:
-        if file_path.endswith('.pdf'):
-            return extract_text(file_path)
-        elif file_path.endswith('.docx'):
-            doc = Document(file_path)
-            return "\n".join([para.text for para in doc.paragraphs])
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page_number, page in enumerate(PDFPage.get_pages(stream, caching=True)):
+            if max_pages and page_number >= max_pages:
+                break
+            if deadline and time.monotonic() > deadline:
+                break
+            interpreter.process_page(page)
+            text = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            yield text
+    finally:
+        device.close()
+
+def _iter_stream_text(stream, max_pages, max_bytes, time_budget):
+    start = stream.tell()
+    if max_bytes:
+        size = stream.seek(0, io.SEEK_END) - start
+        if size > max_bytes:
+            raise ValueError(f"document is {size} bytes, over the {max_bytes} byte limit")
+    stream.seek(start)
+    header = stream.read(1024)
+    stream.seek(start)
+
+    file_format = detect_format(header)
+    if file_format == 'pdf':
+        yield from iter_pdf_pages(stream, max_pages, time_budget)
+    elif file_format == 'docx':
+        yield from iter_docx_text(stream)
+    else:
+        # Same newlines as a file opened in text mode, so no line ends in '\r'
+        yield stream.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+def iter_text_from_file(source, max_pages=None, max_bytes=None, time_budget=None):
+    """Stream the text of a path, raw bytes or binary file-like object.
+
+    PDFs are yielded page by page and DOCX files as their XML is parsed, so
+    callers can start work before the whole document is read; plain text
+    arrives as a single chunk. Limits
+    default to the values in config, and 0 disables a limit.
+    """
+    max_pages = _limit(max_pages, config.PDF_MAX_PAGES)
+    max_bytes = _limit(max_bytes, config.MAX_DOCUMENT_BYTES)
+    time_budget = _limit(time_budget, config.PDF_TIME_BUDGET)
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield from _iter_stream_text(io.BytesIO(source), max_pages, max_bytes, time_budget)
+        elif hasattr(source, 'read'):
+            if not (hasattr(source, 'seekable') and source.seekable()):
+                source = io.BytesIO(source.read())
+            yield from _iter_stream_text(source, max_pages, max_bytes, time_budget)
         else:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with open(source, 'rb') as f:
+                yield from _iter_stream_text(f, max_pages, max_bytes, time_budget)
     except Exception as e:
         raise RuntimeError(f"Failed to extract text: {str(e)}")
 
-def extract_entities(text):
+@timed("extract_text")
+def extract_text_from_file(source, max_pages=None, max_bytes=None, time_budget=None):
+    """Extract text from a path, raw bytes or a binary file-like object.
+
+    The format is detected from the content itself, so in-memory uploads
+    never need to touch the filesystem.
+    """
+    return "".join(iter_text_from_file(source, max_pages, max_bytes, time_budget))
+
+ACHIEVEMENT_PATTERN = re.compile(
+    r'(?:achieved|implemented|increased|reduced|improved|optimized|saved|led|managed|developed|delivered|completed).*?\b\d+[%+]?\b',
+    re.IGNORECASE
+)
+
+DEGREE_PATTERN = re.compile(r'(B\.?\s?Tech|M\.?\s?Tech|MBA|B\.?\s?E|B\.?\s?Sc|B\.?\s?Com|B\.?\s?A)', re.IGNORECASE)
+YEAR_RANGE_PATTERN = re.compile(r'\d{4}.*?\d{4}')
+CERT_CLEANUP = re.compile(r'^[•\-*]\s*|\s*\(.*?\)')
+
+def extract_education(lines):
+    """Degrees as "Degree from Institution (years)".
+
+    A degree line must be followed by a line holding the institution, a "|"
+    and a year range. Each line is searched at most twice, so the cost stays
+    linear where a single multi-line regex would backtrack quadratically.
+    """
+    education = []
+    start = 0
+    for i in range(len(lines) - 1):
+        degree = DEGREE_PATTERN.search(lines[i], start)
+        start = 0
+        if not degree:
+            continue
+        detail = lines[i + 1]
+        pipe = detail.find('|')
+        years = YEAR_RANGE_PATTERN.search(detail, pipe + 1) if pipe >= 0 else None
+        if years:
+            education.append(f"{degree.group(1).title()} from {detail[:pipe].strip()} ({years.group().strip()})")
+            # The next degree may only start after the year range, as with a regex scan
+            start = years.end()
+    return education
+
+def extract_entities(text, scan=None):
+    """Extract contacts, skills, education, certifications and achievements from text.
+
+    scan, the document's ats_rules TextScan when the caller already has one,
+    lets the achievement search be skipped when no achievement verb occurs.
+    """
     try:
         entities = {
             "name": "",
@@ -45,153 +185,46 @@ def extract_entities(text):
         }
 
         # Name extraction (first line before separator)
-        first_line = text.split('\n')[0].strip()
-        if first_line and not any(sep in first_line for sep in ['---', '___', '===']):
-            entities["name"] = first_line
-
-        # Email and phone
-        entities["email"] = list(set(re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)))
-        entities["phone"] = list(set(re.findall(r'(\+?\d[\d\s-]{8,}\d)', text)))
-
-        # Education
-        edu_pattern = re.compile(
-            r'(B\.?\s?Tech|M\.?\s?Tech|MBA|B\.?\s?E|B\.?\s?Sc|B\.?\s?Com|B\.?\s?A).*?\n(.*?)\|.*?(\d{4}.*?\d{4})', 
-            re.IGNORECASE
-        )
-        for match in edu_pattern.finditer(text):
-            entities["education"].append(f"{match.group(1).title()} from {match.group(2).strip()} ({match.group(3).strip()})")
-
-        # Comprehensive skill mapping with all provided skills and additional IT/CS skills
-        skill_map = {
-            # Programming Languages
-            'javascript': ['javascript', 'js', 'es6', 'ecmascript'],
-            'python': ['python', 'py'],
-            'java': ['java', 'j2ee', 'j2se'],
-            'c++': ['c++', 'cpp'],
-            'c#': ['c#', 'csharp'],
-            'php': ['php'],
-            'ruby': ['ruby', 'ruby on rails'],
-            'swift': ['swift'],
-            'kotlin': ['kotlin'],
-            'typescript': ['typescript', 'ts'],
-            'go': ['go', 'golang'],
-            'r': ['r'],
-            
-            # Frontend
-            'html': ['html', 'html5'],
-            'css': ['css', 'css3'],
-            'react': ['react', 'reactjs', 'react.js'],
-            'angular': ['angular', 'angularjs'],
-            'vue.js': ['vue.js', 'vuejs', 'vue'],
-            'bootstrap': ['bootstrap'],
-            'jquery': ['jquery'],
-            'sass': ['sass', 'scss'],
-            'web accessibility': ['web accessibility', 'a11y'],
-            
-            # Backend
-            'node.js': ['node.js', 'nodejs', 'node'],
-            'express': ['express', 'express.js'],
-            'django': ['django'],
-            'flask': ['flask'],
-            'spring': ['spring', 'spring boot'],
-            'laravel': ['laravel'],
-            'asp.net': ['asp.net', 'aspnet'],
-            
-            # Databases
-            'mongodb': ['mongodb', 'mongo'],
-            'mysql': ['mysql'],
-            'postgresql': ['postgresql', 'postgres'],
-            'sql': ['sql', 'structured query language'],
-            'oracle': ['oracle'],
-            'sqlite': ['sqlite'],
-            'redis': ['redis'],
-            
-            # Data Science/AI
-            'machine learning': ['machine learning', 'ml'],
-            'deep learning': ['deep learning', 'dl'],
-            'tensorflow': ['tensorflow', 'tf'],
-            'pytorch': ['pytorch'],
-            'pandas': ['pandas'],
-            'numpy': ['numpy'],
-            'scikit-learn': ['scikit-learn', 'sklearn'],
-            'statistics': ['statistics', 'stats'],
-            'data visualization': ['data visualization', 'dataviz'],
-            'tableau': ['tableau'],
-            'power bi': ['power bi', 'powerbi'],
-            
-            # DevOps/Cloud
-            'aws': ['aws', 'amazon web services'],
-            'azure': ['azure', 'microsoft azure'],
-            'gcp': ['gcp', 'google cloud'],
-            'docker': ['docker'],
-            'kubernetes': ['kubernetes', 'k8s'],
-            'terraform': ['terraform'],
-            'ansible': ['ansible'],
-            'jenkins': ['jenkins'],
-            'git': ['git', 'github', 'gitlab'],
-            'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
-            
-            # Tools
-            'jira': ['jira'],
-            'figma': ['figma'],
-            'excel': ['excel', 'advanced excel'],
-            'photoshop': ['photoshop'],
-            'illustrator': ['illustrator'],
-            
-            # Business/Soft Skills
-            'agile': ['agile', 'scrum'],
-            'project management': ['project management', 'pm'],
-            'business analysis': ['business analysis', 'ba'],
-            'communication': ['communication', 'communication skills'],
-            
-            # Digital Marketing
-            'digital marketing': ['digital marketing', 'digitalmarketing', 'online marketing'],
-            'seo/sem': ['seo', 'sem', 'search engine optimization', 'search engine marketing'],
-            'google analytics': ['google analytics', 'ga', 'googleanalytics'],
-            'social media marketing': ['social media marketing', 'smm', 'social media'],
-            'content creation': ['content creation', 'content marketing', 'content strategy'],
-            'market research': ['market research', 'competitive analysis']
-        }
+        with stage("entities.contacts"):
+            first_line = text.split('\n')[0].strip()
+            if first_line and not any(sep in first_line for sep in ['---', '___', '===']):
+                entities["name"] = first_line
+
+            # Email and phone
+            entities["email"] = list(set(re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)))
+            entities["phone"] = list(set(re.findall(r'(\+?\d[\d\s-]{8,}\d)', text)))
+
+        with stage("entities.sections"):
+            sections = segment(text)
+
+        # Education: a degree line followed by "Institution | years"
+        with stage("entities.education"):
+            # Resumes without an education heading are read whole
+            edu_lines = sections.lines("education") if sections.has("education") else text.split('\n')
+            entities["education"] = extract_education(edu_lines)
+
+        # Skills listed in the skills section come first, then those mentioned elsewhere
+        with stage("entities.skills"):
+            section_skills = SKILL_MATCHER.find(sections.text("skills").lower())
+            entities["skills"].extend(SKILL_MATCHER.ordered(section_skills))
+
+            text_skills = SKILL_MATCHER.find(text.lower()) - section_skills
+            entities["skills"].extend(SKILL_MATCHER.ordered(text_skills))
 
-        # Extract skills from dedicated skills section
-        skills_section = re.search(
-            r'(?:SKILLS|TECHNICAL SKILLS|SKILL SET|EXPERTISE|COMPETENCIES)[\s:]*\n(.*?)(?=\n\n|\n[A-Z][A-Z]+|\n\w|$)',
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if skills_section:
-            skills_text = skills_section.group(1).lower()
-            for standard_skill, variations in skill_map.items():
-                if any(re.search(r'\b' + re.escape(variation) + r'\b', skills_text) for variation in variations):
-                    if standard_skill not in entities["skills"]:
-                        entities["skills"].append(standard_skill)
-
-        # Also check entire text for skills not in dedicated section
-        text_lower = text.lower()
-        for standard_skill, variations in skill_map.items():
-            if standard_skill not in entities["skills"]:  # Skip if already found
-                if any(re.search(r'\b' + re.escape(variation) + r'\b', text_lower) for variation in variations):
-                    entities["skills"].append(standard_skill)
-
-        # Certifications - Robust extraction
-        cert_sections = re.finditer(
-            r'(?:CERTIFICATIONS|CERTIFICATE|LICENSES|TRAININGS)[\s:]*\n(.*?)(?=\n\n|\n[A-Z][A-Z]+|\n\w|$)',
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        for match in cert_sections:
-            cert_lines = [line.strip() for line in match.group(1).split('\n') if line.strip()]
-            for line in cert_lines:
-                clean_line = re.sub(r'^[•\-*]\s*|\s*\(.*?\)', '', line).strip()
+        # Certifications: every entry of the certifications sections
+        with stage("entities.certifications"):
+            for line in sections.lines("certifications"):
+                clean_line = CERT_CLEANUP.sub('', line.strip()).strip()
                 if clean_line and len(clean_line) > 5 and not clean_line.upper() in ["CERTIFICATIONS", "CERTIFICATE", "LICENSES"]:
                     entities["certifications"].append(clean_line)
 
         # Achievements
-        achievement_pattern = r'(?:achieved|implemented|increased|reduced|improved|optimized|saved|led|managed|developed|delivered|completed).*?\b\d+[%+]?\b'
-        entities["achievements"] = list(set(
-            re.findall(achievement_pattern, text, re.IGNORECASE)
-        ))
+        with stage("entities.achievements"):
+            # A shared ATS scan already knows whether any achievement verb occurs
+            if scan is None or not scan.defines("achievement_verbs") or scan.matched("achievement_verbs"):
+                entities["achievements"] = list(set(
+                    ACHIEVEMENT_PATTERN.findall(text)
+                ))
 
         return entities
 
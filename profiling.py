@@ -0,0 +1,147 @@
+"""Lightweight per-stage instrumentation for the analysis pipeline.
+
+Pipeline code marks its stages with ``with stage("name"):`` or ``@timed``.
+Unless a document is being profiled in the current context, ``stage`` returns
+a shared no-op context manager, so the disabled cost is one ContextVar lookup.
+
+    with profile_document("resume.pdf") as prof:
+        text = extract_text_from_file(path)
+        ...
+    prof.as_dict()   # wall/CPU seconds and peak allocation per stage
+
+Finished profiles are kept in ``RECENT_PROFILES`` and can be exported as JSON
+lines or Prometheus-style counters (the HTTP service serves these on
+``/metrics``). ``cprofile_path`` adds a cProfile dump of
+the whole document and ``memory=True`` records tracemalloc peaks per stage.
+"""
+import contextvars
+import cProfile
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+_active = contextvars.ContextVar("resume_analyzer_profile", default=None)
+_NOOP = nullcontext()
+
+RECENT_PROFILES = deque(maxlen=1000)
+_totals = {}
+_totals_lock = threading.Lock()
+
+
+class DocumentProfile:
+    """Stage timings collected for one document"""
+
+    def __init__(self, document, memory=False):
+        self.document = document
+        self.memory = memory
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                "stage": name,
+                "wall_s": time.perf_counter() - wall,
+                "cpu_s": time.process_time() - cpu
+            }
+            if self.memory:
+                record["peak_bytes"] = max(0, tracemalloc.get_traced_memory()[1] - base)
+            self.stages.append(record)
+
+    def total(self):
+        return sum(record["wall_s"] for record in self.stages)
+
+    def as_dict(self):
+        return {"document": self.document, "total_s": self.total(), "stages": self.stages}
+
+
+def stage(name):
+    """Time a pipeline stage if a document profile is active, else do nothing"""
+    profile = _active.get()
+    if profile is None:
+        return _NOOP
+    return profile.stage(name)
+
+
+def timed(name):
+    """Decorator form of ``stage``"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _active.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            with profile.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record(profile):
+    RECENT_PROFILES.append(profile.as_dict())
+    add_stage_totals(profile.stages)
+
+
+def add_stage_totals(stages):
+    """Count stage records from another process in this process's totals"""
+    with _totals_lock:
+        for record in stages:
+            totals = _totals.setdefault(record["stage"], {"count": 0, "wall_s": 0.0, "cpu_s": 0.0})
+            totals["count"] += 1
+            totals["wall_s"] += record["wall_s"]
+            totals["cpu_s"] += record["cpu_s"]
+
+
+@contextmanager
+def profile_document(document, memory=False, cprofile_path=None):
+    """Collect stage timings for everything run on this document in this context"""
+    profile = DocumentProfile(document, memory=memory)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if cprofile_path else None
+    token = _active.set(profile)
+    if profiler:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        _active.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+        _record(profile)
+
+
+def write_jsonl(stream, profiles=None):
+    """Write profiles (default: the recent ones) as one JSON object per line"""
+    for profile in RECENT_PROFILES if profiles is None else profiles:
+        stream.write(json.dumps(profile) + "\n")
+
+
+def prometheus_metrics():
+    """Cumulative per-stage counters in Prometheus text format"""
+    with _totals_lock:
+        totals = sorted((name, dict(values)) for name, values in _totals.items())
+    lines = []
+    # Every sample of a metric has to follow its TYPE line as one group
+    for metric, key, fmt in (("stage_seconds_total", "wall_s", ".6f"),
+                             ("stage_cpu_seconds_total", "cpu_s", ".6f"),
+                             ("stage_calls_total", "count", "d")):
+        lines.append(f"# TYPE resume_analyzer_{metric} counter")
+        for name, values in totals:
+            lines.append(f'resume_analyzer_{metric}{{stage="{name}"}} {values[key]:{fmt}}')
+    return "\n".join(lines) + "\n"
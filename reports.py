@@ -0,0 +1,255 @@
+"""Append-only report sinks for analysis results.
+
+Rows are buffered and written in batches. The output format follows the
+path:
+
+    report.csv      one CSV file; list columns are joined with ", "
+    report.jsonl    one JSON Lines file; list columns stay JSON arrays
+    report.parquet  a directory of Parquet shards with list<string> columns
+
+CSV and JSON Lines appends take an exclusive file lock for the duration of
+each batch, so several processes can share one file. Parquet files cannot be
+appended to, so every flush writes a new shard named after the writer;
+``compact`` merges the shards of a directory into one file.
+"""
+import csv
+import glob
+import json
+import os
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+REPORT_FIELDS = [
+    "File", "Name", "Email", "Phone", "Match_Percentage",
+    "Matched_Skills", "Missing_Skills", "ATS_Warnings", "Seconds", "Error"
+]
+
+LIST_FIELDS = ("Matched_Skills", "Missing_Skills", "ATS_Warnings")
+
+SHARD_PATTERN = "part-*.parquet"
+
+
+def _lock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def report_format(path):
+    """Output format implied by a report path's extension"""
+    lower = path.lower().rstrip("/\\")
+    if lower.endswith(".parquet"):
+        return "parquet"
+    if lower.endswith((".jsonl", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def normalize_row(row):
+    """Restrict a row to the report schema, filling absent columns with None"""
+    normalized = {field: row.get(field) for field in REPORT_FIELDS}
+    for field in LIST_FIELDS:
+        value = normalized[field]
+        if value is None:
+            normalized[field] = []
+        elif isinstance(value, str):
+            normalized[field] = [value]
+        else:
+            normalized[field] = [str(item) for item in value]
+    return normalized
+
+
+def arrow_schema():
+    """Fixed Arrow schema of the report; list columns are list<string>"""
+    import pyarrow as pa
+
+    return pa.schema([
+        ("File", pa.string()),
+        ("Name", pa.string()),
+        ("Email", pa.string()),
+        ("Phone", pa.string()),
+        ("Match_Percentage", pa.int32()),
+        ("Matched_Skills", pa.list_(pa.string())),
+        ("Missing_Skills", pa.list_(pa.string())),
+        ("ATS_Warnings", pa.list_(pa.string())),
+        ("Seconds", pa.float64()),
+        ("Error", pa.string()),
+    ])
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("Parquet reports need pyarrow. Install it with: pip install pyarrow") from e
+
+
+class ReportSink:
+    """Buffered, append-only writer for report rows.
+
+    Rows are flushed every batch_size rows and on close; use batch_size=1
+    to make every row durable as soon as it is written.
+    """
+
+    def __init__(self, path, batch_size=100):
+        self.path = path
+        self.format = report_format(path)
+        self.batch_size = max(1, batch_size)
+        self.rows_written = 0
+        self._buffer = []
+        self._writer_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._shards = 0
+        if self.format == "parquet":
+            _require_pyarrow()
+            os.makedirs(path, exist_ok=True)
+
+    def write(self, row):
+        self._buffer.append(normalize_row(row))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        if self.format == "parquet":
+            self._write_shard(rows)
+        else:
+            self._append_text(rows)
+        self.rows_written += len(rows)
+
+    def _append_text(self, rows):
+        with open(self.path, 'a+', encoding='utf-8', newline='') as f:
+            _lock(f)
+            try:
+                if self.format == "jsonl":
+                    f.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+                else:
+                    self._append_csv(f, rows)
+                f.flush()
+            finally:
+                _unlock(f)
+
+    def _append_csv(self, f, rows):
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            writer.writeheader()
+        else:
+            f.seek(0)
+            header = next(csv.reader([f.readline()]), [])
+            if header != REPORT_FIELDS:
+                if not set(header) <= set(REPORT_FIELDS):
+                    raise RuntimeError(f"{self.path} has columns {header}, expected {REPORT_FIELDS}")
+                self._migrate_csv(f, writer)
+        for row in rows:
+            writer.writerow({
+                key: ", ".join(value) if key in LIST_FIELDS else value
+                for key, value in row.items()
+            })
+
+    def _migrate_csv(self, f, writer):
+        """Rewrite a report with an older subset of the columns under the current header.
+
+        The rewrite happens in place, under the lock already held, so other
+        writers keep appending to the same file. The original is kept as
+        ``<path>.legacy`` first.
+        """
+        f.seek(0)
+        legacy = f.read()
+        with open(self.path + ".legacy", 'w', encoding='utf-8', newline='') as backup:
+            backup.write(legacy)
+        rows = list(csv.DictReader(legacy.splitlines(keepends=True)))
+        f.truncate(0)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    def _write_shard(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(rows, schema=arrow_schema())
+        name = f"part-{self._writer_id}-{self._shards:05d}.parquet"
+        self._shards += 1
+        # Write under a hidden name and rename, so readers never see a partial shard
+        tmp_path = os.path.join(self.path, "." + name + ".tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, os.path.join(self.path, name))
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def shard_paths(directory):
+    return sorted(glob.glob(os.path.join(directory, SHARD_PATTERN)))
+
+
+def compact(directory):
+    """Merge every Parquet shard in directory into one file.
+
+    Shards written while compaction runs are left for the next pass. Returns
+    the path of the merged shard, or None if there was nothing to merge.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    shards = shard_paths(directory)
+    if len(shards) < 2:
+        return shards[0] if shards else None
+    schema = arrow_schema()
+    table = pa.concat_tables(pq.read_table(path, schema=schema) for path in shards)
+    name = f"part-compacted-{uuid.uuid4().hex[:8]}.parquet"
+    tmp_path = os.path.join(directory, "." + name + ".tmp")
+    pq.write_table(table, tmp_path)
+    merged = os.path.join(directory, name)
+    os.replace(tmp_path, merged)
+    for path in shards:
+        os.remove(path)
+    return merged
+
+
+def read_report(path):
+    """Load a report written by ReportSink as a pandas DataFrame"""
+    import pandas as pd
+
+    fmt = report_format(path)
+    if fmt == "parquet":
+        _require_pyarrow()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        shards = shard_paths(path)
+        if not shards:
+            return arrow_schema().empty_table().to_pandas()
+        schema = arrow_schema()
+        return pa.concat_tables(pq.read_table(shard, schema=schema) for shard in shards).to_pandas()
+    if fmt == "jsonl":
+        return pd.read_json(path, lines=True)
+    return pd.read_csv(path)
@@ -0,0 +1,252 @@
+"""Command line entry point for headless resume analysis.
+
+    python -m resume_analyzer batch <dir> --skills "python, sql" --workers 8
+    python -m resume_analyzer index <dir> --index-dir candidate_index
+    python -m resume_analyzer search --skills "python, sql" -k 50
+    python -m resume_analyzer compact report.parquet
+    python -m resume_analyzer query --job backend --min-score 80
+    python -m resume_analyzer ingest <dir> --skills "python, sql" --watch 3600
+"""
+import argparse
+import sys
+
+DEFAULT_SKILLS = "python, machine learning, sql, html, css, javascript"
+
+
+def cmd_batch(args):
+    from batch import find_resumes, parse_skills, run_batch
+    from store import get_result_store
+
+    paths = list(find_resumes(args.directory))
+    if not paths:
+        print(f"No PDF/DOCX resumes found in {args.directory}", file=sys.stderr)
+        return 1
+
+    def report(row):
+        if row["Error"]:
+            print(f"FAILED {row['File']}: {row['Error']}", file=sys.stderr)
+        elif args.verbose:
+            print(f"{row['Match_Percentage']:>3}% {row['File']}")
+            if row.get("Duplicate_Of"):
+                print(f"     duplicate of {row['Duplicate_Of']} ({row['Similarity']:.0%} similar)")
+
+    duplicate_index = None
+    if args.dedup_dir:
+        from dedup import DuplicateIndex
+        duplicate_index = DuplicateIndex(args.dedup_dir)
+
+    store = get_result_store(args.store)
+    summary = run_batch(paths, parse_skills(args.skills), args.output,
+                        workers=args.workers, on_result=report, profile_path=args.profile_out,
+                        duplicate_index=duplicate_index, store=store, job=args.job)
+    print(f"Analyzed {summary['total']} resumes in {summary['seconds']}s "
+          f"({summary['resumes_per_second']} resumes/sec): "
+          f"{summary['processed']} ok, {summary['failed']} failed -> {args.output}")
+    if store is not None:
+        print(f"{summary['reused']} re-scored from stored entities; {store.path} holds {len(store)} resumes")
+    if duplicate_index is not None:
+        print(f"{summary['duplicates']} duplicates of earlier resumes; index holds {len(duplicate_index)}")
+    return 0
+
+
+def cmd_profile(args):
+    from batch import analyze_document, parse_skills
+    from profiling import profile_document
+
+    with profile_document(args.file, memory=args.memory, cprofile_path=args.cprofile) as prof:
+        analyze_document(args.file, parse_skills(args.skills))
+
+    header = f"{'stage':<26} {'wall ms':>9} {'cpu ms':>9}" + (f" {'peak KiB':>9}" if args.memory else "")
+    print(header)
+    for record in prof.stages:
+        line = f"{record['stage']:<26} {record['wall_s'] * 1000:>9.2f} {record['cpu_s'] * 1000:>9.2f}"
+        if args.memory:
+            line += f" {record['peak_bytes'] / 1024:>9.1f}"
+        print(line)
+    print(f"{'total':<26} {prof.total() * 1000:>9.2f}")
+    if args.cprofile:
+        print(f"cProfile stats written to {args.cprofile}")
+    return 0
+
+
+def cmd_index(args):
+    from concurrent.futures import ProcessPoolExecutor
+    from batch import find_resumes, parse_file
+    from search_index import CandidateIndex
+
+    index = CandidateIndex(args.index_dir)
+    paths = list(find_resumes(args.directory))
+    added = failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for row in pool.map(parse_file, paths, chunksize=16):
+            if row["Error"]:
+                failed += 1
+                print(f"FAILED {row['File']}: {row['Error']}", file=sys.stderr)
+                continue
+            if index.add(row["Key"], row["entities"], row["text"], {"file": row["File"]}):
+                added += 1
+                if added % args.commit_every == 0:
+                    index.commit()
+    index.commit()
+    print(f"Indexed {added} new resumes ({failed} failed); index holds {len(index)}")
+    return 0
+
+
+def cmd_search(args):
+    import json
+    import time
+    from batch import parse_skills
+    from search_index import CandidateIndex
+
+    index = CandidateIndex(args.index_dir)
+    start = time.perf_counter()
+    hits = index.search(parse_skills(args.skills), description=args.description, k=args.top)
+    elapsed = time.perf_counter() - start
+    for hit in hits:
+        print(json.dumps(hit, ensure_ascii=False))
+    print(f"{len(hits)} candidates from {len(index)} in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def cmd_compact(args):
+    from reports import compact, shard_paths
+
+    before = len(shard_paths(args.directory))
+    merged = compact(args.directory)
+    if merged is None:
+        print(f"No report shards in {args.directory}", file=sys.stderr)
+        return 1
+    if before == 1:
+        print(f"{merged} is already compact")
+    else:
+        print(f"Merged {before} shards into {merged}")
+    return 0
+
+
+def cmd_ingest(args):
+    import time
+    from batch import parse_skills
+    from ingest import run_ingest
+    from store import get_result_store
+
+    store = get_result_store(args.store)
+    if store is None:
+        print("Ingestion needs the result store: pass --store or set RESUME_ANALYZER_STORE", file=sys.stderr)
+        return 1
+
+    def report(row):
+        if row["Error"]:
+            print(f"FAILED {row['File']}: {row['Error']}", file=sys.stderr)
+        elif args.verbose:
+            print(f"{row['Match_Percentage']:>3}% {row['File']}")
+
+    while True:
+        summary = run_ingest(args.directory, parse_skills(args.skills), store, workers=args.workers,
+                             output_path=args.output, job=args.job, retry_failed=args.retry_failed,
+                             on_result=report)
+        print(f"{summary['total']} resumes in {summary['seconds']}s: {summary['skipped']} skipped, "
+              f"{summary['rescored']} re-scored, {summary['processed']} processed, {summary['failed']} failed, "
+              f"{summary['removed']} removed; about {summary['saved_seconds']}s saved")
+        if summary["untimed"]:
+            print(f"  ({summary['untimed']} reused resumes have no recorded analysis time and are not in that estimate)")
+        if not args.watch:
+            return 0
+        try:
+            time.sleep(args.watch)
+        except KeyboardInterrupt:
+            return 0
+
+
+def cmd_query(args):
+    import json
+    from batch import parse_skills
+    from store import get_result_store
+
+    store = get_result_store(args.store)
+    if store is None:
+        print("No result store: pass --store or set RESUME_ANALYZER_STORE", file=sys.stderr)
+        return 1
+    if args.has_skills:
+        rows = store.with_skills(parse_skills(args.has_skills))
+    elif args.job or args.skills:
+        rows = store.candidates(args.job or parse_skills(args.skills), args.min_score, args.limit)
+    else:
+        rows = store.jobs()
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False))
+    print(f"{len(rows)} rows from {store.path}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="resume_analyzer", description="AI Resume Analyzer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="analyze every resume in a directory")
+    batch.add_argument("directory", help="folder to scan recursively for PDF/DOCX files")
+    batch.add_argument("--skills", default=DEFAULT_SKILLS, help="comma-separated job skills")
+    batch.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument("--output", default="batch_report.csv", help="report to append to (.csv, .jsonl or a .parquet directory)")
+    batch.add_argument("-v", "--verbose", action="store_true", help="print every result")
+    batch.add_argument("--profile-out", default=None, help="write per-stage timings as JSON lines")
+    batch.add_argument("--dedup-dir", default=None, help="flag exact and near-duplicate resumes using this index")
+    batch.add_argument("--store", default=None, help="SQLite result store (default: RESUME_ANALYZER_STORE, off when unset; 'none' to skip)")
+    batch.add_argument("--job", default=None, help="name the skill list in the result store")
+    batch.set_defaults(func=cmd_batch)
+
+    profile = commands.add_parser("profile", help="time each pipeline stage on a single resume")
+    profile.add_argument("file", help="resume to analyze")
+    profile.add_argument("--skills", default=DEFAULT_SKILLS, help="comma-separated job skills")
+    profile.add_argument("--memory", action="store_true", help="record tracemalloc peaks per stage")
+    profile.add_argument("--cprofile", default=None, help="dump cProfile stats to this path")
+    profile.set_defaults(func=cmd_profile)
+
+    index = commands.add_parser("index", help="add the resumes in a directory to a candidate index")
+    index.add_argument("directory", help="folder to scan recursively for PDF/DOCX files")
+    index.add_argument("--index-dir", default="candidate_index", help="index location")
+    index.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    index.add_argument("--commit-every", type=int, default=1000, help="resumes per index segment")
+    index.set_defaults(func=cmd_index)
+
+    search = commands.add_parser("search", help="rank indexed candidates against a job")
+    search.add_argument("--index-dir", default="candidate_index", help="index location")
+    search.add_argument("--skills", default=DEFAULT_SKILLS, help="comma-separated job skills")
+    search.add_argument("--description", default=None, help="free-text job description for BM25")
+    search.add_argument("-k", "--top", type=int, default=50, help="number of candidates to return")
+    search.set_defaults(func=cmd_search)
+
+    compact = commands.add_parser("compact", help="merge the shards of a Parquet report")
+    compact.add_argument("directory", help=".parquet report directory written by batch")
+    compact.set_defaults(func=cmd_compact)
+
+    ingest = commands.add_parser("ingest", help="analyze only new or changed resumes in a folder")
+    ingest.add_argument("directory", help="folder to scan recursively for PDF/DOCX files")
+    ingest.add_argument("--skills", default=DEFAULT_SKILLS, help="comma-separated job skills")
+    ingest.add_argument("--store", default=None, help="SQLite result store holding the manifest (default: RESUME_ANALYZER_STORE)")
+    ingest.add_argument("--job", default=None, help="name the skill list in the result store")
+    ingest.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ingest.add_argument("--output", default=None, help="also append rows for re-scored and analyzed files to this report")
+    ingest.add_argument("--retry-failed", action="store_true", help="retry files that failed before even if unchanged")
+    ingest.add_argument("--watch", type=float, default=0, help="rescan every this many seconds until interrupted")
+    ingest.add_argument("-v", "--verbose", action="store_true", help="print every result")
+    ingest.set_defaults(func=cmd_ingest)
+
+    query = commands.add_parser("query", help="read candidates and scores from the result store")
+    query.add_argument("--store", default=None, help="SQLite result store (default: RESUME_ANALYZER_STORE)")
+    query.add_argument("--job", default=None, help="job name given to batch --job")
+    query.add_argument("--skills", default=None, help="comma-separated job skills, instead of --job")
+    query.add_argument("--min-score", type=int, default=0, help="lowest match percentage to return")
+    query.add_argument("--limit", type=int, default=None, help="number of candidates to return")
+    query.add_argument("--has-skills", default=None, help="list resumes whose extracted skills include all of these")
+    query.set_defaults(func=cmd_query)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
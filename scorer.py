@@ -1,64 +1,192 @@
-import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+import numpy as np
+
+import config
+from profiling import timed
+from skills import SkillMatcher
+
+SIMILARITY_THRESHOLD = 0.7
 
 def skill_similarity(a, b):
     """Calculate similarity between two skill names using sequence matching"""
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
-def score_resume(entities, job_skills, exp_keywords=None, raw_text=None):
+def _char_counts(skills, alphabet):
+    """Character count matrix with one row per skill; characters outside alphabet are ignored"""
+    counts = np.zeros((len(skills), len(alphabet)), dtype=np.int32)
+    for row, skill in enumerate(skills):
+        for ch in skill:
+            col = alphabet.get(ch)
+            if col is not None:
+                counts[row, col] += 1
+    return counts
+
+def _alphabet(skills):
+    return {ch: i for i, ch in enumerate(sorted(set(''.join(skills))))}
+
+def _fuzzy_matches(job_skills, job_counts, alphabet, resume_skills, threshold):
+    matches = np.zeros((len(job_skills), len(resume_skills)), dtype=bool)
+    if not job_skills or not resume_skills:
+        return matches
+
+    # Characters absent from every job skill cannot overlap, so the job
+    # alphabet is enough for the resume side; lengths still use full strings
+    resume_counts = _char_counts(resume_skills, alphabet)
+    overlap = np.minimum(job_counts[:, None, :], resume_counts[None, :, :]).sum(axis=2)
+    lengths = (np.array([len(skill) for skill in job_skills])[:, None]
+               + np.array([len(skill) for skill in resume_skills])[None, :])
+    bound = np.divide(2.0 * overlap, lengths, out=np.ones(overlap.shape), where=lengths > 0)
+
+    for i, j in zip(*np.nonzero(bound > threshold)):
+        a, b = job_skills[i], resume_skills[j]
+        matches[i, j] = a == b or SequenceMatcher(None, a, b).ratio() > threshold
+    return matches
+
+def fuzzy_match_matrix(job_skills, resume_skills, threshold=SIMILARITY_THRESHOLD):
+    """Boolean (job skill x resume skill) matrix of exact or fuzzy matches.
+
+    A pair matches when the strings are equal or their SequenceMatcher ratio
+    exceeds the threshold. The ratio is bounded above by the character
+    multiset overlap 2*|a & b| / (|a| + |b|), which is computed for every pair
+    at once; the exact ratio is only evaluated for the few pairs whose bound
+    clears the threshold.
+    """
+    alphabet = _alphabet(job_skills)
+    return _fuzzy_matches(job_skills, _char_counts(job_skills, alphabet), alphabet, resume_skills, threshold)
+
+def skill_variations(required_skill):
+    """Spellings of a required skill that count as a mention in the resume text"""
+    return [
+        required_skill,
+        required_skill.replace(' ', ''),
+        required_skill.replace(' ', '-'),
+        required_skill.replace('/', ' '),
+        required_skill.replace('/', ' and ')
+    ]
+
+class JobProfile:
+    """A job skill list compiled once and reused for every resume it is scored against.
+
+    Holds the normalized skills, their text variations, one combined matcher
+    for those variations and the character counts used by fuzzy matching.
+    Build profiles with get_job_profile so identical skill lists share one.
+    """
+
+    def __init__(self, job_skills):
+        self.skills = tuple(skill.lower().strip() for skill in job_skills)
+        self.unique_skills = list(dict.fromkeys(self.skills))
+        self.variations = {skill: skill_variations(skill) for skill in self.unique_skills}
+        self.matcher = SkillMatcher(self.variations)
+        self._alphabet = _alphabet(self.unique_skills)
+        self._counts = _char_counts(self.unique_skills, self._alphabet)
+
+    def fuzzy_matched(self, resume_skills):
+        """Job skills with an exact or fuzzy match among resume_skills"""
+        matches = _fuzzy_matches(self.unique_skills, self._counts, self._alphabet,
+                                 resume_skills, SIMILARITY_THRESHOLD)
+        return {skill for skill, hit in zip(self.unique_skills, matches.any(axis=1)) if hit}
+
+    def mentioned(self, text_lower):
+        """Job skills whose variations appear in already-lowercased text"""
+        return self.matcher.find(text_lower)
+
+    def __repr__(self):
+        return f"JobProfile({list(self.skills)!r})"
+
+@lru_cache(maxsize=256)
+def _cached_profile(skills):
+    return JobProfile(skills)
+
+def get_job_profile(job_skills):
+    """Shared JobProfile for a skill list, cached by its normalized skills"""
+    if isinstance(job_skills, JobProfile):
+        return job_skills
+    return _cached_profile(tuple(skill.lower().strip() for skill in job_skills))
+
+@lru_cache(maxsize=64)
+def _combined_matcher(profiles):
+    variations = {}
+    for profile in profiles:
+        variations.update(profile.variations)
+    return SkillMatcher(variations)
+
+def _semantic_matches(skills, raw_text, semantic):
+    """{skill: (phrase, similarity)} from the semantic matcher, or None when it is off"""
+    if not (config.SEMANTIC_MATCHING if semantic is None else semantic):
+        return None
+    # Imported here so literal scoring never touches spaCy
+    from semantic import get_semantic_matcher
+    matcher = get_semantic_matcher()
+    if matcher is None or not raw_text:
+        return None if matcher is None else {}
+    return matcher.match_text(skills, raw_text)
+
+def _build_result(entities, profile, fuzzy, mentioned, semantic=None):
     matched_skills = []
     missing_skills = []
-    
-    # Normalize all skills
-    resume_skills = [skill.lower().strip() for skill in entities.get('skills', [])]
-    job_skills = [skill.lower().strip() for skill in job_skills]
-
-    # For each required skill, find the best match in resume
-    for required_skill in job_skills:
-        best_match = None
-        best_score = 0
-        
-        # Check against each resume skill
-        for resume_skill in resume_skills:
-            # Exact match
-            if required_skill == resume_skill:
-                best_match = resume_skill
-                best_score = 1.0
-                break
-            
-            # Partial match with similarity threshold
-            current_score = skill_similarity(required_skill, resume_skill)
-            if current_score > best_score and current_score > 0.7:  # 0.7 similarity threshold
-                best_score = current_score
-                best_match = resume_skill
-        
-        # Also check if skill is mentioned in text but not in skills section
-        if best_score < 0.8 and raw_text:
-            text_lower = raw_text.lower()
-            variations = [
-                required_skill,
-                required_skill.replace(' ', ''),
-                required_skill.replace(' ', '-'),
-                required_skill.replace('/', ' '),
-                required_skill.replace('/', ' and ')
-            ]
-            if any(re.search(r'\b' + re.escape(variation) + r'\b', text_lower) for variation in variations):
-                best_match = required_skill
-                best_score = 1.0
-        
-        if best_score >= 0.7:  # Consider it a match if similarity >= 70%
+    semantic_matches = {}
+    for required_skill in profile.skills:
+        if required_skill in fuzzy or required_skill in mentioned:
+            matched_skills.append(required_skill)
+        elif semantic and required_skill in semantic:
+            semantic_matches[required_skill] = semantic[required_skill][0]
             matched_skills.append(required_skill)
         else:
             missing_skills.append(required_skill)
 
     # Calculate percentage
-    skill_percentage = (len(matched_skills) / len(job_skills)) * 100 if job_skills else 0
+    skill_percentage = (len(matched_skills) / len(profile.skills)) * 100 if profile.skills else 0
 
-    return {
+    result = {
         "matched_skills": matched_skills,
         "missing_skills": missing_skills,
         "score": round(skill_percentage),
         "max_score": 100,
         "certifications": entities.get('certifications', []),
         "achievements": entities.get('achievements', [])
-    }
\ No newline at end of file
+    }
+    if semantic is not None:
+        # Matched skills found only by meaning, with the resume phrase that matched
+        result["semantic_matches"] = semantic_matches
+    return result
+
+@timed("score")
+def score_resume(entities, job_skills, exp_keywords=None, raw_text=None, semantic=None):
+    """Score a resume against a skill list or a prebuilt JobProfile.
+
+    semantic turns vector-based matching on or off for this call; None
+    follows RESUME_ANALYZER_SEMANTIC_MATCHING.
+    """
+    profile = get_job_profile(job_skills)
+
+    # Normalize all skills
+    resume_skills = [skill.lower().strip() for skill in entities.get('skills', [])]
+
+    # Best fuzzy match of every required skill against every resume skill at once
+    fuzzy = profile.fuzzy_matched(resume_skills)
+
+    # Also check if skill is mentioned in text but not in skills section,
+    # scanning the lowercased text a single time for every variation
+    mentioned = profile.mentioned(raw_text.lower()) if raw_text else set()
+
+    semantic = _semantic_matches(profile.unique_skills, raw_text, semantic)
+    return _build_result(entities, profile, fuzzy, mentioned, semantic)
+
+@timed("score")
+def score_against_profiles(entities, profiles, raw_text=None, semantic=None):
+    """Score one resume against many job profiles with a single pass over its text.
+
+    Returns one score_resume-style result per profile, in the same order.
+    """
+    profiles = tuple(get_job_profile(profile) for profile in profiles)
+    resume_skills = [skill.lower().strip() for skill in entities.get('skills', [])]
+
+    # Fuzzy-match the union of all profiles' skills in one batch
+    union = list(dict.fromkeys(skill for profile in profiles for skill in profile.unique_skills))
+    fuzzy = {skill for skill, hit in zip(union, fuzzy_match_matrix(union, resume_skills).any(axis=1)) if hit}
+
+    mentioned = _combined_matcher(profiles).find(raw_text.lower()) if raw_text else set()
+    semantic = _semantic_matches(union, raw_text, semantic)
+    return [_build_result(entities, profile, fuzzy, mentioned, semantic) for profile in profiles]
@@ -0,0 +1,385 @@
+"""Persistent candidate search index over parsed resumes.
+
+The index is a directory of immutable segments. Each segment stores three
+inverted indexes as flat NumPy arrays in CSR layout: canonical skills from
+``extract_entities``, BM25 term frequencies over the raw text, and the
+text's word pairs and triples for phrase lookups. Arrays are
+opened with ``mmap_mode='r'`` so several server processes share one copy
+through the page cache, and new resumes are added incrementally by writing
+a new segment.
+
+Only one process should write to an index at a time.
+"""
+import json
+import math
+import os
+import re
+import shutil
+from collections import Counter
+
+import numpy as np
+
+from scorer import fuzzy_match_matrix, skill_variations
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Longest phrase kept as an n-gram; every taxonomy alias fits
+MAX_PHRASE_TOKENS = 3
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+MANIFEST = "manifest.json"
+DOCS = "docs.jsonl"
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def phrases(tokens, longest=MAX_PHRASE_TOKENS):
+    """Every run of 2 to longest consecutive tokens, space-joined"""
+    return {" ".join(tokens[i:i + n]) for n in range(2, longest + 1) for i in range(len(tokens) - n + 1)}
+
+
+def _write_json_atomic(path, value):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f)
+    os.replace(tmp_path, path)
+
+
+def _replace_dir(tmp_dir, directory):
+    # A commit that crashed before its manifest write leaves a segment under
+    # this name that no manifest lists; os.replace cannot overwrite it
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+
+
+def _write_postings(directory, name, postings):
+    """Store {term: [(doc_id, weight), ...]} as offsets/docs/weights arrays"""
+    terms = sorted(postings)
+    offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    for i, term in enumerate(terms):
+        offsets[i + 1] = offsets[i] + len(postings[term])
+    docs = np.empty(offsets[-1], dtype=np.int32)
+    weights = np.empty(offsets[-1], dtype=np.float32)
+    for i, term in enumerate(terms):
+        entries = postings[term]
+        docs[offsets[i]:offsets[i + 1]] = [doc_id for doc_id, _ in entries]
+        weights[offsets[i]:offsets[i + 1]] = [weight for _, weight in entries]
+    np.save(os.path.join(directory, f"{name}_offsets.npy"), offsets)
+    np.save(os.path.join(directory, f"{name}_docs.npy"), docs)
+    np.save(os.path.join(directory, f"{name}_weights.npy"), weights)
+    return terms
+
+
+class _Postings:
+    """Memory-mapped read side of one CSR posting list"""
+
+    def __init__(self, directory, name, terms):
+        self.terms = {term: i for i, term in enumerate(terms)}
+        self.offsets = np.load(os.path.join(directory, f"{name}_offsets.npy"), mmap_mode='r')
+        self.docs = np.load(os.path.join(directory, f"{name}_docs.npy"), mmap_mode='r')
+        self.weights = np.load(os.path.join(directory, f"{name}_weights.npy"), mmap_mode='r')
+
+    def get(self, term):
+        i = self.terms.get(term)
+        if i is None:
+            return None, None
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.docs[start:end], self.weights[start:end]
+
+
+class _Segment:
+    def __init__(self, directory, start):
+        self.directory = directory
+        self.start = start
+        with open(os.path.join(directory, "vocab.json"), 'r', encoding='utf-8') as f:
+            vocab = json.load(f)
+        self.text = _Postings(directory, "text", vocab["text"])
+        self.skills = _Postings(directory, "skills", vocab["skills"])
+        # Segments written before phrases were indexed fall back to single tokens
+        self.phrases = _Postings(directory, "phrases", vocab["phrases"]) if "phrases" in vocab else None
+        self.doc_len = np.load(os.path.join(directory, "doc_len.npy"), mmap_mode='r')
+
+    @staticmethod
+    def write(directory, start, pending):
+        tmp_dir = directory + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        text_postings = {}
+        skill_postings = {}
+        phrase_postings = {}
+        doc_len = np.zeros(len(pending), dtype=np.int32)
+        for offset, (skills, counts, length, grams) in enumerate(pending):
+            doc_id = start + offset
+            doc_len[offset] = length
+            for term, tf in counts.items():
+                text_postings.setdefault(term, []).append((doc_id, tf))
+            for skill in skills:
+                skill_postings.setdefault(skill, []).append((doc_id, 1))
+            for gram in grams:
+                phrase_postings.setdefault(gram, []).append((doc_id, 1))
+
+        vocab = {
+            "text": _write_postings(tmp_dir, "text", text_postings),
+            "skills": _write_postings(tmp_dir, "skills", skill_postings),
+            "phrases": _write_postings(tmp_dir, "phrases", phrase_postings)
+        }
+        np.save(os.path.join(tmp_dir, "doc_len.npy"), doc_len)
+        with open(os.path.join(tmp_dir, "vocab.json"), 'w', encoding='utf-8') as f:
+            json.dump(vocab, f)
+        _replace_dir(tmp_dir, directory)
+
+
+class CandidateIndex:
+    """Incrementally built skill + BM25 index answering top-k candidate queries"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._pending = []
+        self._pending_docs = []
+        self._load()
+
+    def _load(self):
+        manifest_path = os.path.join(self.directory, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self._manifest = json.load(f)
+        else:
+            self._manifest = {"segments": [], "doc_count": 0, "total_tokens": 0, "next_segment": 0}
+
+        # docs.jsonl may hold rows from a commit that crashed before the
+        # manifest was written; anything past doc_count is ignored
+        self._docs = []
+        docs_path = os.path.join(self.directory, DOCS)
+        if os.path.exists(docs_path):
+            with open(docs_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if len(self._docs) == self._manifest["doc_count"]:
+                        break
+                    self._docs.append(json.loads(line))
+        self._keys = {doc["key"] for doc in self._docs}
+
+        self._segments = [
+            _Segment(os.path.join(self.directory, seg["name"]), seg["start"])
+            for seg in self._manifest["segments"]
+        ]
+        self._doc_len = (
+            np.concatenate([seg.doc_len for seg in self._segments])
+            if self._segments else np.zeros(0, dtype=np.int32)
+        )
+        skill_vocab = set()
+        for seg in self._segments:
+            skill_vocab.update(seg.skills.terms)
+        self._skill_vocab = sorted(skill_vocab)
+
+    def __len__(self):
+        return self._manifest["doc_count"]
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def reload(self):
+        """Pick up segments committed by another process"""
+        self._load()
+
+    def add(self, key, entities, raw_text, metadata=None):
+        """Queue a parsed resume for the next commit; returns False if key is already indexed"""
+        if key in self._keys:
+            return False
+        tokens = tokenize(raw_text or "")
+        skills = sorted({skill.lower().strip() for skill in entities.get("skills", [])})
+        self._pending.append((skills, Counter(tokens), len(tokens), phrases(tokens)))
+        doc = {
+            "key": key,
+            "name": entities.get("name", ""),
+            "email": entities["email"][0] if entities.get("email") else "",
+            "skills": skills
+        }
+        doc.update(metadata or {})
+        self._pending_docs.append(doc)
+        self._keys.add(key)
+        return True
+
+    def commit(self):
+        """Write queued resumes as a new segment"""
+        if not self._pending:
+            return 0
+        manifest = dict(self._manifest)
+        start = manifest["doc_count"]
+        name = f"seg_{manifest['next_segment']:06d}"
+        _Segment.write(os.path.join(self.directory, name), start, self._pending)
+
+        docs_path = os.path.join(self.directory, DOCS)
+        self._truncate_docs(docs_path, start)
+        with open(docs_path, 'a', encoding='utf-8') as f:
+            for doc in self._pending_docs:
+                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+
+        manifest["segments"] = manifest["segments"] + [{"name": name, "start": start, "count": len(self._pending)}]
+        manifest["doc_count"] = start + len(self._pending)
+        manifest["total_tokens"] += sum(length for _, _, length, _ in self._pending)
+        manifest["next_segment"] += 1
+        _write_json_atomic(os.path.join(self.directory, MANIFEST), manifest)
+
+        added = len(self._pending)
+        self._pending = []
+        self._pending_docs = []
+        self._load()
+        return added
+
+    @staticmethod
+    def _truncate_docs(docs_path, keep):
+        """Drop doc rows left behind by a commit that never reached the manifest"""
+        if not os.path.exists(docs_path):
+            return
+        with open(docs_path, 'r+', encoding='utf-8') as f:
+            for _ in range(keep):
+                if not f.readline():
+                    return
+            f.truncate(f.tell())
+
+    def compact(self):
+        """Merge all segments into one to keep query fan-out low"""
+        if len(self._segments) < 2:
+            return
+        merged = {"text": {}, "skills": {}}
+        if all(seg.phrases is not None for seg in self._segments):
+            merged["phrases"] = {}
+        for seg in self._segments:
+            for kind in merged:
+                postings = getattr(seg, kind)
+                for term, i in postings.terms.items():
+                    start, end = postings.offsets[i], postings.offsets[i + 1]
+                    merged[kind].setdefault(term, []).append(
+                        (np.asarray(postings.docs[start:end]), np.asarray(postings.weights[start:end]))
+                    )
+
+        name = f"seg_{self._manifest['next_segment']:06d}"
+        directory = os.path.join(self.directory, name)
+        tmp_dir = directory + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        vocab = {}
+        for kind, postings in merged.items():
+            vocab[kind] = _write_postings(tmp_dir, kind, {
+                term: list(zip(np.concatenate([d for d, _ in parts]).tolist(),
+                               np.concatenate([w for _, w in parts]).tolist()))
+                for term, parts in postings.items()
+            })
+        np.save(os.path.join(tmp_dir, "doc_len.npy"), np.asarray(self._doc_len, dtype=np.int32))
+        with open(os.path.join(tmp_dir, "vocab.json"), 'w', encoding='utf-8') as f:
+            json.dump(vocab, f)
+        _replace_dir(tmp_dir, directory)
+
+        old = [seg["name"] for seg in self._manifest["segments"]]
+        manifest = dict(self._manifest)
+        manifest["segments"] = [{"name": name, "start": 0, "count": manifest["doc_count"]}]
+        manifest["next_segment"] += 1
+        _write_json_atomic(os.path.join(self.directory, MANIFEST), manifest)
+        # Readers that still map the old files keep working until they reload
+        for seg_name in old:
+            shutil.rmtree(os.path.join(self.directory, seg_name), ignore_errors=True)
+        self._load()
+
+    def _skill_hits(self, job_skills):
+        """(job skills x documents) mask of which documents satisfy each job skill.
+
+        Follows score_resume's rules on tokens: a stored skill fuzzy-matches
+        the job skill, or one of its spellings occurs in the text as a run of
+        words. Spellings longer than MAX_PHRASE_TOKENS words count when all of
+        their word triples occur.
+        """
+        hits = np.zeros((len(job_skills), len(self)), dtype=bool)
+        matches = fuzzy_match_matrix(job_skills, self._skill_vocab) if self._skill_vocab else []
+        for row, accepted in zip(hits, matches):
+            for s in np.nonzero(accepted)[0]:
+                for seg in self._segments:
+                    docs, _ = seg.skills.get(self._skill_vocab[s])
+                    if docs is not None:
+                        row[docs] = True
+        for row, skill in zip(hits, job_skills):
+            for variation in dict.fromkeys(skill_variations(skill)):
+                row |= self._text_has_phrase(tokenize(variation))
+        return hits
+
+    def _text_has_phrase(self, tokens):
+        mask = np.zeros(len(self), dtype=bool)
+        if not tokens:
+            return mask
+        for seg in self._segments:
+            if len(tokens) == 1:
+                terms, postings = tokens, seg.text
+            elif seg.phrases is None:
+                terms, postings = set(tokens), seg.text
+            else:
+                n = min(len(tokens), MAX_PHRASE_TOKENS)
+                terms = {" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
+                postings = seg.phrases
+            found = np.zeros(len(self), dtype=np.int32)
+            for term in terms:
+                docs, _ = postings.get(term)
+                if docs is not None:
+                    found[docs] += 1
+            mask |= found == len(terms)
+        return mask
+
+    def _bm25(self, terms):
+        scores = np.zeros(len(self), dtype=np.float32)
+        n = len(self)
+        avgdl = self._manifest["total_tokens"] / n if n else 0
+        for term in terms:
+            hits = [(seg, *seg.text.get(term)) for seg in self._segments]
+            hits = [(seg, docs, tf) for seg, docs, tf in hits if docs is not None]
+            df = sum(len(docs) for _, docs, _ in hits)
+            if not df:
+                continue
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for seg, docs, tf in hits:
+                dl = seg.doc_len[docs - seg.start]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl) if avgdl else BM25_K1
+                scores[docs] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, job_skills, description=None, k=50):
+        """Top-k candidates for a job, best skill coverage first, then BM25.
+
+        Each hit carries a matched/missing breakdown from the stored skills
+        and the indexed text, so no documents are re-parsed. Text mentions
+        are matched on words, so a spelling that score_resume's regexes
+        reject at punctuation (a trailing "#" or "+") may still count here.
+        """
+        job_skills = [skill.lower().strip() for skill in job_skills if skill.strip()]
+        if not len(self) or not job_skills:
+            return []
+
+        hits = self._skill_hits(job_skills)
+        coverage = hits.sum(axis=0)
+        terms = set(tokenize(" ".join(job_skills) + " " + (description or "")))
+        bm25 = self._bm25(terms)
+
+        # Coverage dominates; BM25 (scaled below 1) only breaks ties
+        rank = coverage + bm25 / (float(bm25.max()) + 1.0)
+        candidates = np.nonzero(rank > 0)[0]
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-rank[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-rank[candidates], kind="stable")]
+
+        results = []
+        for doc_id in candidates:
+            doc = self._docs[doc_id]
+            matched = [skill for skill, row in zip(job_skills, hits) if row[doc_id]]
+            missing = [skill for skill, row in zip(job_skills, hits) if not row[doc_id]]
+            hit = dict(doc)
+            hit.update({
+                "score": round(len(matched) / len(job_skills) * 100),
+                "bm25": round(float(bm25[doc_id]), 4),
+                "matched_skills": matched,
+                "missing_skills": missing
+            })
+            results.append(hit)
+        return results
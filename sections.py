@@ -0,0 +1,140 @@
+"""Line-oriented resume section segmenter.
+
+The text is split into typed sections in one pass over its lines. A line is
+a heading when, stripped of bullets, numbering and a trailing colon, it is
+one of the known headings below ("Technical Skills", "EDUCATION:") or starts
+with one followed by a colon ("Skills: Python, SQL"). Headings such as
+"Languages" that no extractor reads still end the section before them, as
+an ``other`` section, and so does any other all-caps heading line
+("VOLUNTEER WORK"). Skills and certifications are lists, so like the
+patterns this replaces they also end at their first blank line. Everything
+before the first heading is the ``header``.
+
+Each line is looked at once and heading lookup is a dict hit, so the cost is
+linear in the length of the text however it is formatted.
+"""
+import re
+
+from skills import SKILL_MAP
+
+SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "professional profile", "objective",
+                "career objective", "about me"),
+    "skills": ("skills", "technical skills", "skill set", "skillset", "key skills", "core skills",
+               "expertise", "technical expertise", "areas of expertise", "competencies", "core competencies"),
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internships", "internship"),
+    "education": ("education", "academic background", "academics", "academic qualifications",
+                  "educational qualifications", "qualifications", "education and training"),
+    "certifications": ("certifications", "certification", "certificates", "certificate", "licenses",
+                       "licenses and certifications", "certifications and licenses", "trainings",
+                       "training", "courses", "certifications and trainings"),
+    "projects": ("projects", "academic projects", "personal projects", "key projects"),
+    "achievements": ("achievements", "key achievements", "accomplishments", "awards",
+                     "awards and achievements", "honors", "honors and awards"),
+    # Headings that matter only because they end the section before them
+    "other": ("languages", "interests", "hobbies", "hobbies and interests", "references", "publications",
+              "volunteering", "volunteer experience", "extracurricular activities", "activities",
+              "personal details", "personal information", "declaration"),
+}
+
+HEADING_KINDS = {
+    heading: kind for kind, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+# Longest heading, in words; longer lines are never looked up
+_MAX_HEADING_WORDS = max(len(heading.split()) for heading in HEADING_KINDS)
+
+# Leading bullets or numbering and trailing colons/dashes around a heading
+_DECORATION = re.compile(r'^[\s•\-*#>\d.)]*|[\s:\-–—]*$')
+_WORDS = re.compile(r'[^\W_]+')
+
+# An unlisted heading: a short all-caps line of words, such as "VOLUNTEER WORK"
+_CAPS_HEADING = re.compile(r'[A-Z][A-Z&/ ]{3,}')
+# ...that is not a skill listed one per line ("DOCKER")
+_SKILL_ALIASES = frozenset(alias for aliases in SKILL_MAP.values() for alias in aliases) | frozenset(SKILL_MAP)
+
+# Sections that end at a blank line once they have content
+_LIST_KINDS = frozenset({"skills", "certifications"})
+
+
+def heading_kind(line):
+    """(kind, inline content) when line is a section heading, else None"""
+    stripped = line.strip()
+    # Only the heading is bounded: "Skills: python, sql, ..." may run long
+    head, _, rest = stripped.partition(":")
+    if not head or len(head) > 60:
+        return None
+    words = _WORDS.findall(_DECORATION.sub("", head).replace("&", " and ").lower())
+    if not words or len(words) > _MAX_HEADING_WORDS:
+        return None
+    kind = HEADING_KINDS.get(" ".join(words))
+    if kind:
+        return kind, rest.strip()
+    head = _DECORATION.sub("", head)
+    if not rest.strip() and _CAPS_HEADING.fullmatch(head) and head.lower() not in _SKILL_ALIASES:
+        return "other", ""
+    return None
+
+
+class Section:
+    __slots__ = ("kind", "heading", "lines")
+
+    def __init__(self, kind, heading, lines=None):
+        self.kind = kind
+        self.heading = heading
+        self.lines = lines if lines is not None else []
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+    def __repr__(self):
+        return f"Section({self.kind!r}, {self.heading!r}, {len(self.lines)} lines)"
+
+
+class Sections:
+    """The sections of one document, in order"""
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def has(self, kind):
+        return any(section.kind == kind for section in self.sections)
+
+    def lines(self, kind):
+        """Body lines of every section of this kind, in document order"""
+        return [line for section in self.sections if section.kind == kind for line in section.lines]
+
+    def text(self, kind):
+        return "\n".join(self.lines(kind))
+
+    def kinds(self):
+        return [section.kind for section in self.sections]
+
+
+def segment(text):
+    """Split text into typed sections in a single pass over its lines"""
+    current = Section("header", "")
+    sections = [current]
+    for line in text.split("\n"):
+        found = heading_kind(line)
+        if found is None:
+            if not line.strip() and current.kind in _LIST_KINDS and any(l.strip() for l in current.lines):
+                # The blank line closes the list; what follows belongs to no section
+                current = Section("other", "")
+                sections.append(current)
+            current.lines.append(line)
+            continue
+        kind, inline = found
+        current = Section(kind, line.strip())
+        if inline:
+            current.lines.append(inline)
+        sections.append(current)
+    if not sections[0].lines and len(sections) > 1:
+        sections.pop(0)
+    return Sections(sections)
+
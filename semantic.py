@@ -0,0 +1,199 @@
+"""Optional semantic skill matching with the spaCy model's word vectors.
+
+Literal and fuzzy matching miss paraphrases: "Postgres DBA" never fuzzy
+matches "postgresql". When a model with static vectors is available
+(en_core_web_md), every alias in the skill taxonomy is embedded once into a
+unit-normalized matrix, which is cached on disk per model and taxonomy. The
+short phrases of a resume (list items, skill lines) are embedded in
+batches, and a whole resume is then matched with one matrix product. A
+phrase matches a skill when their cosine similarity reaches the threshold.
+
+A phrase vector is the mean of its tokens' static vectors, so only the
+tokenizer has to run; every pipeline component is disabled while
+embedding. Without a model, or with one that has no vectors
+(en_core_web_sm), no matcher is available and scoring stays literal.
+"""
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+import config
+from skills import SKILL_MAP
+
+# Resume text is cut into phrases at line breaks and list punctuation;
+# longer chunks are prose, whose averaged vectors match nothing reliably
+PHRASE_BOUNDARY = re.compile(r"[\n\r\t,;|•·●▪◦*()\[\]{}]+|\s[-–—/&]\s|:\s|\.\s")
+MAX_PHRASE_WORDS = 5
+BATCH_SIZE = 1024
+
+
+def resume_phrases(text, max_words=MAX_PHRASE_WORDS):
+    """Distinct short phrases of text, lowercased, in order of appearance"""
+    phrases = {}
+    for chunk in PHRASE_BOUNDARY.split(text.lower()):
+        chunk = " ".join(chunk.split()).strip(" .-")
+        if chunk and chunk.count(" ") < max_words:
+            phrases.setdefault(chunk, None)
+    return list(phrases)
+
+
+def has_vectors(nlp):
+    return nlp is not None and nlp.vocab.vectors.shape[0] > 0 and nlp.vocab.vectors.shape[1] > 0
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+class PhraseEmbedder:
+    """Unit-length phrase vectors from a spaCy pipeline's static vectors"""
+
+    def __init__(self, nlp, batch_size=BATCH_SIZE):
+        if not has_vectors(nlp):
+            raise RuntimeError("spaCy pipeline has no word vectors")
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self.vectors = nlp.vocab.vectors
+        self.width = self.vectors.shape[1]
+
+    def embed(self, phrases):
+        """(phrases x width) float32 matrix; phrases with no known token get a zero row"""
+        phrases = list(phrases)
+        out = np.zeros((len(phrases), self.width), dtype=np.float32)
+        # Static vectors need no pipeline component, so only the tokenizer runs
+        docs = self.nlp.pipe(phrases, batch_size=self.batch_size, disable=self.nlp.pipe_names)
+        for start in range(0, len(phrases), self.batch_size):
+            batch = list(islice(docs, self.batch_size))
+            out[start:start + len(batch)] = self._mean_vectors(batch)
+        return _normalize_rows(out)
+
+    def _mean_vectors(self, docs):
+        if self.vectors.mode != "default":
+            # floret vectors are built from subwords; let spaCy compute them
+            return np.array([doc.vector for doc in docs], dtype=np.float32).reshape(len(docs), self.width)
+        lengths = np.array([len(doc) for doc in docs], dtype=np.int64)
+        keys = np.fromiter((token.orth for doc in docs for token in doc), dtype=np.uint64, count=lengths.sum())
+        sums = np.zeros((len(docs), self.width), dtype=np.float32)
+        if not len(keys):
+            return sums
+        rows = np.asarray(self.vectors.find(keys=keys))
+        tokens = np.asarray(self.vectors.data)[np.maximum(rows, 0)]
+        # Unknown tokens add zero vectors; the scale is normalized away anyway
+        tokens[rows < 0] = 0
+        # Empty docs span nothing, so each non-empty doc's segment ends where the next one starts
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        nonempty = lengths > 0
+        sums[nonempty] = np.add.reduceat(tokens, starts[nonempty], axis=0)
+        return sums
+
+    def fingerprint(self):
+        """Identifies the model and its vectors in cache file names"""
+        meta = self.nlp.meta
+        digest = hashlib.sha256(f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+                                f"-{self.vectors.shape}".encode())
+        digest.update(np.ascontiguousarray(np.asarray(self.vectors.data)[:64]).tobytes())
+        return digest.hexdigest()[:16]
+
+
+class SemanticMatcher:
+    """Matches resume phrases to job skills by cosine similarity of phrase vectors.
+
+    Job skills that belong to the taxonomy (as a canonical name or an alias)
+    are represented by every alias of their canonical skill, so "postgres"
+    counts for "postgresql". Other job skills are embedded on first use.
+    """
+
+    def __init__(self, nlp, threshold=None, cache_dir=None, skill_map=SKILL_MAP):
+        self.embedder = PhraseEmbedder(nlp)
+        self.threshold = config.SEMANTIC_THRESHOLD if threshold is None else threshold
+        self.aliases = []
+        self.alias_rows = {}
+        self.canonical = {}
+        for skill, variations in skill_map.items():
+            rows = self.alias_rows.setdefault(skill, [])
+            for alias in dict.fromkeys([skill, *variations]):
+                self.canonical.setdefault(alias, skill)
+                rows.append(len(self.aliases))
+                self.aliases.append(alias)
+        self.matrix = self._taxonomy_matrix(cache_dir or config.SEMANTIC_CACHE_DIR)
+        self.skill_matrix = lru_cache(maxsize=256)(self._skill_matrix)
+
+    def _taxonomy_matrix(self, cache_dir):
+        digest = hashlib.sha256("\n".join(self.aliases).encode()).hexdigest()[:16]
+        path = os.path.join(cache_dir, f"taxonomy-{self.embedder.fingerprint()}-{digest}.npy")
+        try:
+            matrix = np.load(path)
+            if matrix.shape == (len(self.aliases), self.embedder.width):
+                return matrix
+        except (OSError, ValueError):
+            pass
+        matrix = self.embedder.embed(self.aliases)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # an unwritable cache only costs the embedding at next startup
+        return matrix
+
+    def _skill_matrix(self, skills):
+        """(rows x width) vectors for a tuple of job skills and the skill index of each row"""
+        rows, owners, others = [], [], []
+        for i, skill in enumerate(skills):
+            canonical = self.canonical.get(skill)
+            if canonical is None:
+                others.append(i)
+                continue
+            rows.extend(self.alias_rows[canonical])
+            owners.extend([i] * len(self.alias_rows[canonical]))
+        matrix = self.matrix[rows]
+        if others:
+            matrix = np.vstack([matrix, self.embedder.embed(skills[i] for i in others)])
+            owners.extend(others)
+        return matrix, np.array(owners, dtype=np.int64)
+
+    def match(self, job_skills, phrases):
+        """{job skill: (phrase, similarity)} for the best phrase of every skill over the threshold"""
+        skills = tuple(dict.fromkeys(skill.lower().strip() for skill in job_skills))
+        if not skills or not phrases:
+            return {}
+        matrix, owners = self.skill_matrix(skills)
+        similarity = self.embedder.embed(phrases) @ matrix.T
+        best_phrase = similarity.argmax(axis=0)
+        best = similarity[best_phrase, np.arange(len(owners))]
+        found = {}
+        for row in np.flatnonzero(best >= self.threshold):
+            skill, score = skills[owners[row]], float(best[row])
+            if skill not in found or score > found[skill][1]:
+                found[skill] = (phrases[best_phrase[row]], score)
+        return found
+
+    def match_text(self, job_skills, text):
+        return self.match(job_skills, resume_phrases(text))
+
+
+@lru_cache(maxsize=None)
+def get_semantic_matcher():
+    """Shared SemanticMatcher, or None when no model with word vectors is available"""
+    # parser pulls in the PDF stack, which scoring alone does not need
+    from parser import get_nlp
+
+    try:
+        nlp = get_nlp()
+    except RuntimeError as e:
+        print(f"Semantic matching disabled: {e}")
+        return None
+    if not has_vectors(nlp):
+        if nlp is not None:
+            print(f"Semantic matching disabled: spaCy model {nlp.meta.get('name')!r} has no word vectors. "
+                  "Install one with: python -m spacy download en_core_web_md")
+        return None
+    return SemanticMatcher(nlp)
@@ -0,0 +1,239 @@
+"""Async HTTP scoring service for programmatic ATS integrations.
+
+    uvicorn service:app --host 0.0.0.0 --port 8000
+
+Extraction and scoring run on a bounded process pool. Requests beyond the
+pool's queue capacity are rejected with 429 instead of piling up, before
+their upload is read, and each document is limited by a request timeout
+(504). If a worker dies, the pool is replaced and warmed up again; requests
+get 503 until it is ready.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+import config
+from batch import analyze_document, parse_skills
+from profiling import add_stage_totals, profile_document, prometheus_metrics
+
+DEFAULT_SKILLS = "python, machine learning, sql, html, css, javascript"
+
+
+def _analyze(data, job_skills):
+    # Stage timings travel back with the result; the worker's own totals are never scraped
+    with profile_document("upload") as prof:
+        analysis = analyze_document(data, job_skills)
+    del analysis["text"]
+    return analysis, prof.stages
+
+
+def _warm_up():
+    """Import the pipeline and compile its matchers before the first request"""
+    _analyze(b"Warm Up\nSKILLS\npython, sql\n", ["python"])
+    return os.getpid()
+
+
+class Metrics:
+    def __init__(self):
+        self.counters = {
+            "requests_total": 0,
+            "documents_total": 0,
+            "documents_failed_total": 0,
+            "rejected_total": 0,
+            "timeouts_total": 0
+        }
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.in_flight = 0
+
+    def observe(self, seconds):
+        self.latency_sum += seconds
+        self.latency_count += 1
+
+    def render(self, capacity):
+        lines = []
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE resume_analyzer_{name} counter")
+            lines.append(f"resume_analyzer_{name} {value}")
+        lines += [
+            "# TYPE resume_analyzer_in_flight gauge",
+            f"resume_analyzer_in_flight {self.in_flight}",
+            "# TYPE resume_analyzer_queue_capacity gauge",
+            f"resume_analyzer_queue_capacity {capacity}",
+            "# TYPE resume_analyzer_document_seconds summary",
+            f"resume_analyzer_document_seconds_sum {self.latency_sum:.6f}",
+            f"resume_analyzer_document_seconds_count {self.latency_count}"
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class AnalysisPool:
+    """Process pool with admission control for CPU-bound analysis"""
+
+    def __init__(self, workers, max_pending, timeout):
+        self.workers = workers
+        self.capacity = max_pending
+        self.timeout = timeout
+        self.metrics = Metrics()
+        self._executor = None
+        self._warming = []
+
+    def start(self):
+        self._replace_executor()
+        for future in self._warming:
+            future.result()
+
+    def _replace_executor(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        # One warm-up job per worker so every process has the pipeline loaded
+        self._warming = [self._executor.submit(_warm_up) for _ in range(self.workers)]
+
+    def _broken(self, executor):
+        """Replace a pool that lost a worker, once, however many jobs report it"""
+        if executor is self._executor:
+            self._replace_executor()
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+
+    def check(self, documents):
+        """Raise 413, 503 or 429 unless documents more can be accepted now"""
+        if documents > self.capacity:
+            self.metrics.counters["rejected_total"] += 1
+            raise HTTPException(status_code=413,
+                                detail=f"Batch of {documents} documents exceeds the queue capacity of "
+                                       f"{self.capacity}; split it into smaller batches")
+        if not all(future.done() for future in self._warming):
+            # A replacement pool serves nothing until its workers have loaded the pipeline
+            self.metrics.counters["rejected_total"] += 1
+            raise HTTPException(status_code=503, detail="Analysis workers are restarting, retry later",
+                                headers={"Retry-After": "5"})
+        if self.metrics.in_flight + documents > self.capacity:
+            self.metrics.counters["rejected_total"] += 1
+            raise HTTPException(status_code=429, detail="Analysis queue is full, retry later",
+                                headers={"Retry-After": "1"})
+
+    def admit(self, documents):
+        """Reserve queue slots for documents or raise like check"""
+        self.check(documents)
+        self.metrics.in_flight += documents
+
+    def _release(self, _future=None):
+        self.metrics.in_flight -= 1
+
+    async def analyze(self, data, job_skills):
+        """Analyze one admitted document; its slot is freed when the worker finishes.
+
+        Raises BrokenProcessPool when a worker died; the pool is then replaced.
+        """
+        start = time.perf_counter()
+        executor = self._executor
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, _analyze, data, job_skills)
+        except Exception as e:
+            # Never submitted, so no done callback will free the slot
+            self._release()
+            self.metrics.counters["documents_failed_total"] += 1
+            if isinstance(e, BrokenProcessPool):
+                self._broken(executor)
+            raise
+        # A timed-out job keeps its worker busy, so the slot is only released
+        # when the work really completes, keeping backpressure honest
+        future.add_done_callback(self._release)
+        self.metrics.counters["documents_total"] += 1
+        try:
+            analysis, stages = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            add_stage_totals(stages)
+            return analysis
+        except asyncio.TimeoutError:
+            self.metrics.counters["timeouts_total"] += 1
+            raise
+        except Exception as e:
+            self.metrics.counters["documents_failed_total"] += 1
+            if isinstance(e, BrokenProcessPool):
+                self._broken(executor)
+            raise
+        finally:
+            self.metrics.observe(time.perf_counter() - start)
+
+
+pool = AnalysisPool(config.SERVICE_WORKERS, config.SERVICE_MAX_PENDING, config.SERVICE_TIMEOUT)
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    pool.start()
+    yield
+    pool.shutdown()
+
+
+app = FastAPI(title="AI Resume Analyzer", lifespan=lifespan)
+
+UNAVAILABLE = "Analysis workers crashed and are restarting, retry later"
+
+
+@app.middleware("http")
+async def shed_load(request, call_next):
+    # The form is parsed before a route runs, so refuse here, before the upload is received,
+    # when not even one more document could be accepted
+    if request.method == "POST" and request.url.path.startswith("/analyze"):
+        try:
+            pool.check(1)
+        except HTTPException as e:
+            return JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+    return await call_next(request)
+
+
+@app.post("/analyze")
+async def analyze(file: UploadFile = File(...), skills: str = Form(DEFAULT_SKILLS)):
+    pool.metrics.counters["requests_total"] += 1
+    data = await file.read()
+    pool.admit(1)
+    try:
+        analysis = await pool.analyze(data, parse_skills(skills))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Analysis timed out")
+    except BrokenProcessPool:
+        raise HTTPException(status_code=503, detail=UNAVAILABLE, headers={"Retry-After": "5"})
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"file": file.filename, **analysis}
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(files: list[UploadFile] = File(...), skills: str = Form(DEFAULT_SKILLS)):
+    pool.metrics.counters["requests_total"] += 1
+    contents = [await upload.read() for upload in files]
+    pool.admit(len(files))
+    job_skills = parse_skills(skills)
+
+    async def one(upload, data):
+        try:
+            return {"file": upload.filename, **await pool.analyze(data, job_skills)}
+        except asyncio.TimeoutError:
+            return {"file": upload.filename, "error": "Analysis timed out"}
+        except BrokenProcessPool:
+            return {"file": upload.filename, "error": UNAVAILABLE}
+        except Exception as e:
+            return {"file": upload.filename, "error": str(e)}
+
+    return {"results": await asyncio.gather(*(one(u, d) for u, d in zip(files, contents)))}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return pool.metrics.render(pool.capacity) + prometheus_metrics()
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "workers": pool.workers, "in_flight": pool.metrics.in_flight}
@@ -0,0 +1,206 @@
+"""Bulk candidate x job scoring on packed skill bitsets.
+
+Every skill gets an integer id in a ``SkillVocabulary``: the canonical
+skills of the taxonomy first, then any other job skills in the order they
+were first seen. Resumes and jobs become rows of uint64 words with one bit
+per skill, so a whole candidates x jobs matrix of match counts is an AND
+followed by a popcount, computed in blocks of candidates.
+
+A resume's bit for a skill is set exactly when ``score_resume`` would count
+that skill as matched: a fuzzy match among the extracted skills, or a
+mention of one of its variations in the raw text. Match percentages
+therefore agree with ``score_resume`` for job lists without repeated skills.
+"""
+import numpy as np
+
+from scorer import get_job_profile
+from skills import SKILL_MAP
+
+# Candidates scored per block; bounds the (block x jobs x words) temporaries
+BLOCK_SIZE = 4096
+
+if hasattr(np, "bitwise_count"):
+    def _popcount(words):
+        return np.bitwise_count(words)
+else:  # NumPy < 2.0
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        counts = _BYTE_COUNTS[words.view(np.uint8)]
+        return counts.reshape(words.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+def _normalize(skill):
+    return skill.lower().strip()
+
+
+class SkillVocabulary:
+    """Interns skills to bit positions, taxonomy skills first"""
+
+    def __init__(self, skills=()):
+        self.skills = []
+        self.ids = {}
+        for skill in list(SKILL_MAP) + list(skills):
+            self.intern(skill)
+
+    def __len__(self):
+        return len(self.skills)
+
+    @property
+    def words(self):
+        """uint64 words per bitset"""
+        return (len(self.skills) + 63) // 64
+
+    def intern(self, skill):
+        skill = _normalize(skill)
+        skill_id = self.ids.get(skill)
+        if skill_id is None:
+            skill_id = self.ids[skill] = len(self.skills)
+            self.skills.append(skill)
+        return skill_id
+
+    def pack(self, skill_ids, words=None):
+        """Bitset row with the given skill ids set"""
+        row = np.zeros(words or self.words, dtype=np.uint64)
+        for skill_id in skill_ids:
+            row[skill_id >> 6] |= np.uint64(1) << np.uint64(skill_id & 63)
+        return row
+
+    def unpack(self, row):
+        """Skill names whose bits are set in row, in id order"""
+        bits = np.unpackbits(row.view(np.uint8), bitorder='little')[:len(self.skills)]
+        return [self.skills[i] for i in np.flatnonzero(bits)]
+
+    def job_row(self, job_skills):
+        """Bitset of a job's skills, interning skills not seen before"""
+        return self.pack({self.intern(skill) for skill in job_skills if _normalize(skill)})
+
+    def resume_row(self, entities, raw_text=None):
+        """Bitset of every vocabulary skill score_resume would count as matched"""
+        profile = get_job_profile(self.skills)
+        resume_skills = [_normalize(skill) for skill in entities.get('skills', [])]
+        matched = profile.fuzzy_matched(resume_skills)
+        if raw_text:
+            matched |= profile.mentioned(raw_text.lower())
+        return self.pack(self.ids[skill] for skill in matched)
+
+
+def _pad(rows, words):
+    rows = np.atleast_2d(np.asarray(rows, dtype=np.uint64))
+    if rows.shape[1] < words:
+        rows = np.pad(rows, ((0, 0), (0, words - rows.shape[1])))
+    return rows
+
+
+def _match_counts(candidates, jobs):
+    """(candidates x jobs) number of shared skills"""
+    counts = np.zeros((len(candidates), len(jobs)), dtype=np.uint16)
+    for word in range(jobs.shape[1]):
+        counts += _popcount(candidates[:, word, None] & jobs[None, :, word])
+    return counts
+
+
+def _percentages(counts, job_sizes):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.rint(counts * 100.0 / job_sizes)
+    return np.where(job_sizes > 0, scores, 0).astype(np.uint8)
+
+
+def _top_k(scores, k, axis):
+    """Indices and scores of the k best entries along axis; ties go to the lower index"""
+    k = min(k, scores.shape[axis])
+    if k == 0:
+        shape = list(scores.shape)
+        shape[axis] = 0
+        return np.empty(shape, dtype=np.int64), np.empty(shape, dtype=scores.dtype)
+    # Make the ordering total so partition and sort agree on ties
+    n = scores.shape[axis]
+    index_shape = [1, 1]
+    index_shape[axis] = n
+    keys = scores.astype(np.int64) * n + (n - 1 - np.arange(n).reshape(index_shape))
+    part = np.argpartition(-keys, k - 1, axis=axis).take(np.arange(k), axis=axis)
+    order = np.argsort(-np.take_along_axis(keys, part, axis=axis), axis=axis)
+    best = np.take_along_axis(part, order, axis=axis)
+    return best, np.take_along_axis(scores, best, axis=axis)
+
+
+class SkillMatrix:
+    """Skill bitsets for a set of jobs and candidates, scored all at once.
+
+    Add every job before the candidates: a candidate row only knows the
+    skills that were in the vocabulary when it was encoded.
+    """
+
+    def __init__(self, jobs=(), vocabulary=None):
+        self.vocabulary = vocabulary or SkillVocabulary()
+        self._job_rows = []
+        self._job_sizes = []
+        self._candidate_rows = []
+        for job_skills in jobs:
+            self.add_job(job_skills)
+
+    def add_job(self, job_skills):
+        row = self.vocabulary.job_row(job_skills)
+        self._job_rows.append(row)
+        self._job_sizes.append(int(_popcount(row).sum()))
+        return len(self._job_rows) - 1
+
+    def add_candidate(self, entities, raw_text=None):
+        self._candidate_rows.append(self.vocabulary.resume_row(entities, raw_text))
+        return len(self._candidate_rows) - 1
+
+    def add_candidate_row(self, row):
+        """Add a precomputed bitset row, e.g. one loaded from storage"""
+        self._candidate_rows.append(np.asarray(row, dtype=np.uint64))
+        return len(self._candidate_rows) - 1
+
+    @property
+    def jobs(self):
+        return _pad(self._job_rows or np.zeros((0, 1)), self.vocabulary.words)
+
+    @property
+    def job_sizes(self):
+        return np.array(self._job_sizes, dtype=np.float64)
+
+    @property
+    def candidates(self):
+        return _pad(self._candidate_rows or np.zeros((0, 1)), self.vocabulary.words)
+
+    def _blocks(self):
+        candidates, jobs, sizes = self.candidates, self.jobs, self.job_sizes
+        for start in range(0, len(candidates), BLOCK_SIZE):
+            block = candidates[start:start + BLOCK_SIZE]
+            yield start, _percentages(_match_counts(block, jobs), sizes)
+
+    def scores(self):
+        """(candidates x jobs) match percentages as uint8"""
+        out = np.zeros((len(self._candidate_rows), len(self._job_rows)), dtype=np.uint8)
+        for start, block in self._blocks():
+            out[start:start + len(block)] = block
+        return out
+
+    def top_jobs(self, k=10):
+        """(indices, scores) of each candidate's k best jobs, best first"""
+        k = min(k, len(self._job_rows))
+        indices = np.zeros((len(self._candidate_rows), k), dtype=np.int64)
+        scores = np.zeros((len(self._candidate_rows), k), dtype=np.uint8)
+        for start, block in self._blocks():
+            best, best_scores = _top_k(block, k, axis=1)
+            indices[start:start + len(block)] = best
+            scores[start:start + len(block)] = best_scores
+        return indices, scores
+
+    def top_candidates(self, k=10):
+        """(indices, scores) of each job's k best candidates, best first"""
+        best = np.zeros((0, len(self._job_rows)), dtype=np.int64)
+        best_scores = np.zeros((0, len(self._job_rows)), dtype=np.uint8)
+        for start, block in self._blocks():
+            # Merge this block's leaders with the running top k of every job
+            block_best, block_scores = _top_k(block, k, axis=0)
+            merged = np.concatenate([best, block_best + start])
+            merged_scores = np.concatenate([best_scores, block_scores])
+            # Earlier blocks hold lower indices, so a stable sort keeps ties in index order
+            order = np.argsort(-merged_scores.astype(np.int16), axis=0, kind='stable')[:k]
+            best = np.take_along_axis(merged, order, axis=0)
+            best_scores = np.take_along_axis(merged_scores, order, axis=0)
+        return best.T, best_scores.T
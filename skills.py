@@ -0,0 +1,168 @@
+import re
+
+# Comprehensive skill mapping with all provided skills and additional IT/CS skills
+SKILL_MAP = {
+    # Programming Languages
+    'javascript': ['javascript', 'js', 'es6', 'ecmascript'],
+    'python': ['python', 'py'],
+    'java': ['java', 'j2ee', 'j2se'],
+    'c++': ['c++', 'cpp'],
+    'c#': ['c#', 'csharp'],
+    'php': ['php'],
+    'ruby': ['ruby', 'ruby on rails'],
+    'swift': ['swift'],
+    'kotlin': ['kotlin'],
+    'typescript': ['typescript', 'ts'],
+    'go': ['go', 'golang'],
+    'r': ['r'],
+
+    # Frontend
+    'html': ['html', 'html5'],
+    'css': ['css', 'css3'],
+    'react': ['react', 'reactjs', 'react.js'],
+    'angular': ['angular', 'angularjs'],
+    'vue.js': ['vue.js', 'vuejs', 'vue'],
+    'bootstrap': ['bootstrap'],
+    'jquery': ['jquery'],
+    'sass': ['sass', 'scss'],
+    'web accessibility': ['web accessibility', 'a11y'],
+
+    # Backend
+    'node.js': ['node.js', 'nodejs', 'node'],
+    'express': ['express', 'express.js'],
+    'django': ['django'],
+    'flask': ['flask'],
+    'spring': ['spring', 'spring boot'],
+    'laravel': ['laravel'],
+    'asp.net': ['asp.net', 'aspnet'],
+
+    # Databases
+    'mongodb': ['mongodb', 'mongo'],
+    'mysql': ['mysql'],
+    'postgresql': ['postgresql', 'postgres'],
+    'sql': ['sql', 'structured query language'],
+    'oracle': ['oracle'],
+    'sqlite': ['sqlite'],
+    'redis': ['redis'],
+
+    # Data Science/AI
+    'machine learning': ['machine learning', 'ml'],
+    'deep learning': ['deep learning', 'dl'],
+    'tensorflow': ['tensorflow', 'tf'],
+    'pytorch': ['pytorch'],
+    'pandas': ['pandas'],
+    'numpy': ['numpy'],
+    'scikit-learn': ['scikit-learn', 'sklearn'],
+    'statistics': ['statistics', 'stats'],
+    'data visualization': ['data visualization', 'dataviz'],
+    'tableau': ['tableau'],
+    'power bi': ['power bi', 'powerbi'],
+
+    # DevOps/Cloud
+    'aws': ['aws', 'amazon web services'],
+    'azure': ['azure', 'microsoft azure'],
+    'gcp': ['gcp', 'google cloud'],
+    'docker': ['docker'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'terraform': ['terraform'],
+    'ansible': ['ansible'],
+    'jenkins': ['jenkins'],
+    'git': ['git', 'github', 'gitlab'],
+    'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
+
+    # Tools
+    'jira': ['jira'],
+    'figma': ['figma'],
+    'excel': ['excel', 'advanced excel'],
+    'photoshop': ['photoshop'],
+    'illustrator': ['illustrator'],
+
+    # Business/Soft Skills
+    'agile': ['agile', 'scrum'],
+    'project management': ['project management', 'pm'],
+    'business analysis': ['business analysis', 'ba'],
+    'communication': ['communication', 'communication skills'],
+
+    # Digital Marketing
+    'digital marketing': ['digital marketing', 'digitalmarketing', 'online marketing'],
+    'seo/sem': ['seo', 'sem', 'search engine optimization', 'search engine marketing'],
+    'google analytics': ['google analytics', 'ga', 'googleanalytics'],
+    'social media marketing': ['social media marketing', 'smm', 'social media'],
+    'content creation': ['content creation', 'content marketing', 'content strategy'],
+    'market research': ['market research', 'competitive analysis']
+}
+
+
+def _is_word_char(ch):
+    """Mirror the regex engine's notion of a \\w character"""
+    return ch.isalnum() or ch == '_'
+
+
+def _trie_to_regex(node):
+    """Render a character trie as a nested alternation, longest branches first"""
+    branches = [re.escape(ch) + _trie_to_regex(child) for ch, child in sorted(node.items()) if ch]
+    if '' in node:
+        # Terminal node: the empty branch goes last so longer aliases win
+        branches.append('')
+    if not branches:
+        return ''
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class SkillMatcher:
+    """Compiled single-pass matcher mapping skill aliases to canonical skills.
+
+    All aliases are folded into one trie-shaped regex that is tried once at
+    every word boundary, so the cost per document stays linear in its length
+    no matter how large the taxonomy grows.
+    """
+
+    def __init__(self, skill_map):
+        self.skills = list(skill_map)
+        self._rank = {skill: i for i, skill in enumerate(self.skills)}
+
+        owners = {}
+        for standard_skill, variations in skill_map.items():
+            for variation in variations:
+                owners.setdefault(variation.lower(), set()).add(standard_skill)
+
+        # Only the longest alias at a position is reported by the regex, so each
+        # alias also carries the skills of any shorter alias that would have
+        # matched at the same spot (a prefix ending on a word boundary).
+        self._implied = {}
+        for alias in owners:
+            found = set(owners[alias])
+            for end in range(1, len(alias)):
+                prefix = alias[:end]
+                if prefix in owners and _is_word_char(alias[end - 1]) != _is_word_char(alias[end]):
+                    found |= owners[prefix]
+            self._implied[alias] = frozenset(found)
+
+        trie = {}
+        for alias in owners:
+            node = trie
+            for ch in alias:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+        if trie:
+            self.pattern = re.compile(r'(?=\b(' + _trie_to_regex(trie) + r')\b)')
+        else:
+            # An empty taxonomy must never match, not match everywhere
+            self.pattern = re.compile(r'(?!)')
+
+    def find(self, text_lower):
+        """Return the set of canonical skills mentioned in already-lowercased text"""
+        found = set()
+        implied = self._implied
+        for match in self.pattern.finditer(text_lower):
+            found |= implied[match.group(1)]
+        return found
+
+    def ordered(self, found):
+        """Sort canonical skills by their position in the taxonomy"""
+        return sorted(found, key=self._rank.__getitem__)
+
+
+SKILL_MATCHER = SkillMatcher(SKILL_MAP)
@@ -0,0 +1,387 @@
+"""Persistent SQLite store of analyzed resumes and their scores.
+
+One database file in WAL mode holds every document keyed by the SHA-256 of
+its bytes (text, entities, ATS warnings), its skills, the latest score
+against every job profile, and a log of each analysis. Readers never block
+writers, so the UI, batch runs and their worker processes can all share
+one file. Writes are grouped into ``BEGIN IMMEDIATE`` transactions. These
+take the write lock up front and wait on the busy timeout, so concurrent
+writers queue instead of failing halfway through.
+
+    documents        key, file, name, email, phone, text, entities, first/last seen, retired
+    document_skills  (skill, key)                      indexed by skill
+    ats_warnings     (key, position, warning)
+    job_profiles     id, skills (normalized, comma-joined), optional unique name
+    scores           (key, profile_id) -> score, matched, missing   indexed by (profile, score)
+    analyses         append-only history: key, profile, file, score, source, time
+    manifest         path -> size, mtime, key, error, seconds   files seen by folder ingestion
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+import config
+
+SCHEMA_VERSION = 3
+BUSY_TIMEOUT = 30
+WRITE_RETRIES = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    key TEXT PRIMARY KEY,
+    file TEXT,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    text TEXT NOT NULL,
+    entities TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    retired_at REAL
+);
+CREATE TABLE IF NOT EXISTS document_skills (
+    skill TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (skill, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS document_skills_key ON document_skills (key);
+CREATE TABLE IF NOT EXISTS ats_warnings (
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    warning TEXT NOT NULL,
+    PRIMARY KEY (key, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS job_profiles (
+    id INTEGER PRIMARY KEY,
+    skills TEXT NOT NULL UNIQUE,
+    name TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT NOT NULL,
+    profile_id INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    matched TEXT NOT NULL,
+    missing TEXT NOT NULL,
+    scored_at REAL NOT NULL,
+    PRIMARY KEY (key, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_profile_score ON scores (profile_id, score DESC);
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    profile_id INTEGER NOT NULL,
+    file TEXT,
+    score INTEGER NOT NULL,
+    source TEXT,
+    analyzed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analyses_key ON analyses (key, analyzed_at);
+CREATE TABLE IF NOT EXISTS manifest (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    key TEXT,
+    error TEXT,
+    seconds REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS manifest_key ON manifest (key);
+"""
+
+
+def profile_key(job_skills):
+    """Normalized form of a job skill list, as stored in job_profiles.skills"""
+    return ", ".join(skill.lower().strip() for skill in job_skills if skill.strip())
+
+
+def _first(values):
+    return values[0] if values else None
+
+
+class ResultStore:
+    """SQLite result store shared by threads and processes.
+
+    Each thread (and each forked process) opens its own connection on first
+    use, so one instance can be shared across Streamlit sessions.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        # WAL is a property of the file, so only the first opener switches it
+        if connection.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+            connection.execute("PRAGMA journal_mode=WAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._write(self._create_schema)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            # isolation_level=None leaves transactions to BEGIN/COMMIT below
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _create_schema(db):
+        # CREATE TABLE IF NOT EXISTS leaves tables from older versions as they are
+        columns = {row[1] for row in db.execute("PRAGMA table_info(documents)")}
+        if columns and "retired_at" not in columns:
+            db.execute("ALTER TABLE documents ADD COLUMN retired_at REAL")
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                db.execute(statement)
+        db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _write(self, body):
+        """Run body(connection) in one write transaction, retrying while the file is busy"""
+        db = self._connection()
+        for attempt in range(WRITE_RETRIES):
+            try:
+                db.execute("BEGIN IMMEDIATE")
+                try:
+                    result = body(db)
+                    db.execute("COMMIT")
+                    return result
+                except BaseException:
+                    if db.in_transaction:
+                        db.execute("ROLLBACK")
+                    raise
+            except sqlite3.OperationalError as e:
+                busy = "locked" in str(e) or "busy" in str(e)
+                if not busy or attempt == WRITE_RETRIES - 1:
+                    raise RuntimeError(f"result store write failed: {e}") from e
+                time.sleep(0.05 * 2 ** attempt)
+
+    def _profile_id(self, db, job_skills, job=None):
+        skills = profile_key(job_skills)
+        db.execute("INSERT INTO job_profiles (skills) VALUES (?) ON CONFLICT (skills) DO NOTHING", (skills,))
+        if job is not None:
+            # A name moves to the newest skill list it was used with
+            db.execute("UPDATE job_profiles SET name = NULL WHERE name = ? AND skills != ?", (job, skills))
+            db.execute("UPDATE job_profiles SET name = ? WHERE skills = ?", (job, skills))
+        return db.execute("SELECT id FROM job_profiles WHERE skills = ?", (skills,)).fetchone()[0]
+
+    def _insert(self, db, entry, now):
+        key, analysis = entry["key"], entry["analysis"]
+        entities, result = analysis["entities"], analysis["result"]
+        db.execute(
+            "INSERT INTO documents (key, file, name, email, phone, text, entities, first_seen, last_seen)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET file = excluded.file, name = excluded.name,"
+            " email = excluded.email, phone = excluded.phone, text = excluded.text,"
+            " entities = excluded.entities, last_seen = excluded.last_seen, retired_at = NULL",
+            (key, entry.get("file"), entities.get("name"), _first(entities.get("email")),
+             _first(entities.get("phone")), analysis["text"], json.dumps(entities, ensure_ascii=False), now, now)
+        )
+        db.execute("DELETE FROM document_skills WHERE key = ?", (key,))
+        db.executemany("INSERT OR IGNORE INTO document_skills (skill, key) VALUES (?, ?)",
+                       [(skill.lower().strip(), key) for skill in entities.get("skills", [])])
+        db.execute("DELETE FROM ats_warnings WHERE key = ?", (key,))
+        db.executemany("INSERT INTO ats_warnings (key, position, warning) VALUES (?, ?, ?)",
+                       [(key, i, warning) for i, warning in enumerate(analysis.get("ats_warnings", []))])
+        profile_id = self._profile_id(db, entry["job_skills"], entry.get("job"))
+        db.execute(
+            "INSERT INTO scores (key, profile_id, score, matched, missing, scored_at) VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (key, profile_id) DO UPDATE SET score = excluded.score, matched = excluded.matched,"
+            " missing = excluded.missing, scored_at = excluded.scored_at",
+            (key, profile_id, result["score"], json.dumps(result["matched_skills"]),
+             json.dumps(result["missing_skills"]), now)
+        )
+        db.execute("INSERT INTO analyses (key, profile_id, file, score, source, analyzed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                   (key, profile_id, entry.get("file"), result["score"], entry.get("source"), now))
+        if entry.get("manifest"):
+            self._upsert_manifest(db, dict(entry["manifest"], key=key, error=None), now)
+
+    @staticmethod
+    def _retire(db, keys, now):
+        """Retire documents that ingestion replaced or removed and no manifest row still names"""
+        db.executemany(
+            "UPDATE documents SET retired_at = ? WHERE key = ? AND retired_at IS NULL"
+            " AND NOT EXISTS (SELECT 1 FROM manifest m WHERE m.key = documents.key)",
+            [(now, key) for key in set(keys) if key]
+        )
+        # A copy of the file under another path keeps the document current; point at it
+        db.executemany(
+            "UPDATE documents SET file = (SELECT MIN(path) FROM manifest m WHERE m.key = documents.key)"
+            " WHERE key = ? AND retired_at IS NULL"
+            " AND EXISTS (SELECT 1 FROM manifest m WHERE m.key = documents.key)"
+            " AND file NOT IN (SELECT path FROM manifest m WHERE m.key = documents.key)",
+            [(key,) for key in set(keys) if key]
+        )
+
+    @classmethod
+    def _upsert_manifest(cls, db, row, now):
+        previous = db.execute("SELECT key FROM manifest WHERE path = ?", (row["path"],)).fetchone()
+        db.execute(
+            "INSERT INTO manifest (path, size, mtime_ns, key, error, seconds, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (path) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns,"
+            " key = excluded.key, error = excluded.error,"
+            " seconds = COALESCE(excluded.seconds, manifest.seconds), updated_at = excluded.updated_at",
+            (row["path"], row["size"], row["mtime_ns"], row.get("key"), row.get("error"), row.get("seconds"), now)
+        )
+        if previous is not None and previous[0] != row.get("key"):
+            cls._retire(db, [previous[0]], now)
+
+    def add(self, key, analysis, job_skills, file=None, job=None, source=None):
+        """Store one analysis (text, entities, result, ats_warnings) of the document with this key"""
+        self.add_many([{"key": key, "analysis": analysis, "job_skills": job_skills,
+                        "file": file, "job": job, "source": source}])
+
+    def add_many(self, entries):
+        """Store many add() entries, given as dicts of its arguments, in one transaction.
+
+        An entry may also carry a "manifest" dict (path, size, mtime_ns,
+        seconds), recorded for its file in the same transaction.
+        """
+        entries = list(entries)
+        if not entries:
+            return
+        now = time.time()
+        self._write(lambda db: [self._insert(db, entry, now) for entry in entries])
+
+    def update_manifest(self, rows, removed=()):
+        """Record manifest rows (path, size, mtime_ns and key, error or seconds) and drop removed paths"""
+        rows, removed = list(rows), list(removed)
+        if not rows and not removed:
+            return
+        now = time.time()
+
+        def body(db):
+            for row in rows:
+                self._upsert_manifest(db, row, now)
+            gone = [db.execute("SELECT key FROM manifest WHERE path = ?", (path,)).fetchone() for path in removed]
+            db.executemany("DELETE FROM manifest WHERE path = ?", [(path,) for path in removed])
+            self._retire(db, [row[0] for row in gone if row is not None], now)
+        self._write(body)
+
+    def name_job(self, name, job_skills):
+        """Give a job skill list a name that queries can use instead of the skills"""
+        self._write(lambda db: self._profile_id(db, job_skills, name))
+
+    # --- Queries ---
+
+    def _query(self, sql, params=()):
+        return self._connection().execute(sql, params).fetchall()
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM documents")[0][0]
+
+    def __contains__(self, key):
+        return bool(self._query("SELECT 1 FROM documents WHERE key = ?", (key,)))
+
+    def get(self, key):
+        """Stored text, entities and ATS warnings of a document, or None"""
+        rows = self._query("SELECT file, text, entities FROM documents WHERE key = ?", (key,))
+        if not rows:
+            return None
+        warnings = self._query("SELECT warning FROM ats_warnings WHERE key = ? ORDER BY position", (key,))
+        return {"file": rows[0]["file"], "text": rows[0]["text"], "entities": json.loads(rows[0]["entities"]),
+                "ats_warnings": [row["warning"] for row in warnings]}
+
+    def _job_id(self, job):
+        """Profile id of a job name or skill list, or None when it was never scored"""
+        if isinstance(job, str):
+            rows = self._query("SELECT id FROM job_profiles WHERE name = ?", (job,))
+        else:
+            rows = self._query("SELECT id FROM job_profiles WHERE skills = ?", (profile_key(job),))
+        return rows[0]["id"] if rows else None
+
+    def candidates(self, job, min_score=0, limit=None):
+        """Documents scored against a job (its name or skill list) with score >= min_score, best first.
+
+        Documents retired by folder ingestion (their file was edited or
+        deleted) are left out.
+        """
+        profile_id = self._job_id(job)
+        if profile_id is None:
+            return []
+        rows = self._query(
+            "SELECT s.key, d.file, d.name, d.email, d.phone, s.score, s.matched, s.missing, s.scored_at"
+            " FROM scores s JOIN documents d ON d.key = s.key"
+            " WHERE s.profile_id = ? AND s.score >= ? AND d.retired_at IS NULL"
+            " ORDER BY s.score DESC, s.key LIMIT ?",
+            (profile_id, min_score, -1 if limit is None else limit)
+        )
+        return [{"key": row["key"], "file": row["file"], "name": row["name"], "email": row["email"],
+                 "phone": row["phone"], "score": row["score"], "matched_skills": json.loads(row["matched"]),
+                 "missing_skills": json.loads(row["missing"]), "scored_at": row["scored_at"]} for row in rows]
+
+    def with_skills(self, skills):
+        """Keys and files of documents whose extracted skills include every given skill"""
+        skills = list(dict.fromkeys(skill.lower().strip() for skill in skills))
+        if not skills:
+            return []
+        rows = self._query(
+            "SELECT d.key, d.file FROM document_skills k JOIN documents d ON d.key = k.key"
+            f" WHERE k.skill IN ({', '.join('?' * len(skills))}) AND d.retired_at IS NULL"
+            " GROUP BY d.key HAVING COUNT(*) = ? ORDER BY d.key",
+            (*skills, len(skills))
+        )
+        return [dict(row) for row in rows]
+
+    def scored(self, job):
+        """Keys of every document with a score for a job (its name or skill list)"""
+        profile_id = self._job_id(job)
+        if profile_id is None:
+            return set()
+        return {row[0] for row in self._query("SELECT key FROM scores WHERE profile_id = ?", (profile_id,))}
+
+    def manifest(self, directory):
+        """{path: manifest row} for every file recorded under directory"""
+        prefix = os.path.join(os.path.abspath(directory), "")
+        # Paths under prefix sort between it and the same string with its last character bumped
+        rows = self._query("SELECT * FROM manifest WHERE path >= ? AND path < ?",
+                           (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)))
+        return {row["path"]: dict(row) for row in rows}
+
+    def analysis_seconds(self):
+        """{key: seconds} for every document whose full analysis time is in the manifest"""
+        rows = self._query("SELECT key, MIN(seconds) FROM manifest"
+                           " WHERE key IS NOT NULL AND seconds IS NOT NULL GROUP BY key")
+        return {key: seconds for key, seconds in rows}
+
+    def history(self, key):
+        """Every analysis of a document, oldest first"""
+        rows = self._query(
+            "SELECT a.analyzed_at, a.file, a.score, a.source, p.skills, p.name AS job"
+            " FROM analyses a JOIN job_profiles p ON p.id = a.profile_id"
+            " WHERE a.key = ? ORDER BY a.analyzed_at, a.id", (key,)
+        )
+        return [dict(row) for row in rows]
+
+    def jobs(self):
+        """Job profiles with how many documents were scored against each"""
+        rows = self._query(
+            "SELECT p.id, p.name, p.skills, COUNT(s.key) AS documents FROM job_profiles p"
+            " LEFT JOIN scores s ON s.profile_id = p.id GROUP BY p.id ORDER BY p.id"
+        )
+        return [dict(row) for row in rows]
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.connection = None
+
+
+@lru_cache(maxsize=None)
+def _open_store(path):
+    return ResultStore(path)
+
+
+def get_result_store(path=None):
+    """Process-wide store at path (default RESUME_ANALYZER_STORE), or None when disabled"""
+    path = config.STORE_PATH if path is None else path
+    if not path or path.lower() in ("none", "off"):
+        return None
+    return _open_store(path)
@@ -1,4 +1,5 @@
-import re
+from ats_rules import scan_text
+from profiling import timed
 
 def display_entities(entities):
     """Display all extracted entities in a beautifully formatted markdown"""
@@ -41,35 +42,9 @@ def display_entities(entities):
     
     return "\n".join(sections)
 
-def check_ats_compliance(text):
+@timed("ats")
+def check_ats_compliance(text, scan=None):
     """Comprehensive ATS compliance checker with detailed feedback"""
-    warnings = []
-    word_count = len(text.split())
-    
-    # Length analysis
-    if word_count < 200:
-        warnings.append("⚠️ **Resume Too Short**: Only {} words (Aim for 200-800 words)".format(word_count))
-    elif word_count > 800:
-        warnings.append("⚠️ **Resume Too Long**: {} words (Ideal is 200-800 words)".format(word_count))
-    
-    # Content quality checks
-    if not re.search(r'\b\d+%|\b\d+\+|\$\d+|\d+\s*(years|yrs)|₹\d+', text):
-        warnings.append("⚠️ **Add Quantifiable Metrics**: Include numbers like 'increased sales by 30%' or 'managed $1M budget'")
-    
-    if not re.search(r'\b(achieved|implemented|developed|managed|led|improved|increased)\b', text, re.IGNORECASE):
-        warnings.append("⚠️ **Use Strong Action Verbs**: Start bullet points with words like 'Developed', 'Implemented', 'Led'")
-    
-    # Formatting checks
-    formatting_issues = {
-        'tables': r'\b(table|row|column)\b',
-        'headers/footers': r'\b(header|footer)\b',
-        'graphics': r'[■□▢▣▤▥▦▧▨▩▪▫▬▭▮▯]|⛔|█',
-        'columns': r'column|text\s*box',
-        'icons': r'[⚡★☆♡♥♠♣♦]'
-    }
-    
-    for issue, pattern in formatting_issues.items():
-        if re.search(pattern, text, re.IGNORECASE):
-            warnings.append(f"⚠️ **Avoid {issue.replace('/', ' and ')}**: These may not parse correctly in ATS systems")
-    
-    return warnings
\ No newline at end of file
+    # Length, content quality and formatting rules are data-driven (ats_rules.json)
+    # and evaluated together in a single pass over the text, unless it was scanned already
+    return (scan or scan_text(text)).warnings()
\ No newline at end of file